@@ -6,12 +6,15 @@ Simple but insightful dashboard for visualizing Antler participant data
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
+from plotly.colors import sample_colorscale
 from pymongo import MongoClient
 from dotenv import load_dotenv
 import os
-from collections import Counter
+import re
+import html
 from datetime import datetime
 
 # Page configuration
@@ -25,6 +28,229 @@ st.set_page_config(
 # Load environment variables
 load_dotenv()
 
+# Fields the dashboard reads from each user document
+CANDIDATE_FIELDS = [
+    'name', 'status', 'location', 'skills', 'antler_cofounder_type', 'founder_type',
+    'avatar_url', 'tagline', 'bio', 'description', 'linkedin', 'email', 'categories'
+]
+
+# Shared MongoClient pool; every session reuses the same warm connections
+MONGO_MAX_POOL_SIZE = 20
+
+# Dashboard views, shown as tabs
+TAB_LABELS = ["📊 Overview", "👥 Candidates", "🎯 Skills Analysis", "📍 Location Insights"]
+
+# Column each view depends on; the view is hidden when the cohort has no values for it
+TAB_REQUIRED_COLUMNS = {"🎯 Skills Analysis": 'skills', "📍 Location Insights": 'location'}
+
+# Arrow-backed string dtype for the precomputed search columns
+SEARCH_STRING_DTYPE = 'string[pyarrow]'
+
+# Low-cardinality columns stored as pandas categoricals
+CATEGORY_COLUMNS = ('status', 'location', 'founder_type')
+
+# Map founder_type classifications onto the Antler cofounder type format
+FOUNDER_TYPE_TO_ANTLER = {
+    'technical': ['Technology'],
+    'technology': ['Technology'],
+    'business': ['Business'],
+}
+
+# Precomputed boolean column per Antler cofounder type
+TYPE_FLAG_COLUMNS = {
+    'Technology': 'is_technology',
+    'Business': 'is_business',
+    'Domain': 'is_domain',
+}
+
+# Bar colors per team status and per Antler cofounder type
+STATUS_COLORS = {
+    'Looking for co-founder': '#10B981',
+    'In a team': '#3B82F6'
+}
+TYPE_COLORS = {
+    'Technology': '#8B5CF6',  # Purple for Technology
+    'Business': '#F59E0B',    # Orange for Business
+    'Domain': '#10B981'       # Green for Domain
+}
+DEFAULT_BAR_COLOR = '#636EFA'
+
+# Upper bound on bars per chart so figure payloads stay small as the cohort grows.
+# Any point-based chart added later should use go.Scattergl (WebGL) rather than go.Scatter.
+MAX_BARS = 20
+
+# Upper bound on slices in a pie chart; the long tail is merged into one "Other" slice
+MAX_PIE_SLICES = 20
+
+# Number of candidate cards rendered per page in the Candidates tab
+CANDIDATES_PER_PAGE = 30
+
+# Columns and their display config for the Candidates table view
+CANDIDATE_TABLE_COLUMNS = [
+    'avatar_url', 'name', 'status', 'effective_cofounder_type', 'location', 'tagline', 'skills', 'linkedin'
+]
+CANDIDATE_TABLE_CONFIG = {
+    'avatar_url': st.column_config.ImageColumn("Photo", width="small"),
+    'name': st.column_config.TextColumn("Name"),
+    'status': st.column_config.TextColumn("Status"),
+    'effective_cofounder_type': st.column_config.ListColumn("Type"),
+    'location': st.column_config.TextColumn("Location"),
+    'tagline': st.column_config.TextColumn("Tagline", width="large"),
+    'skills': st.column_config.ListColumn("Skills", width="large"),
+    'linkedin': st.column_config.LinkColumn("LinkedIn"),
+}
+
+# Emoji shown next to each team status; any other status gets STATUS_EMOJI_DEFAULT
+STATUS_EMOJIS = {'Looking for co-founder': '🟢'}
+STATUS_EMOJI_DEFAULT = '🔵'
+
+# Emoji shown next to each Antler cofounder type
+TYPE_EMOJIS = {
+    'Technology': '💻',
+    'Business': '💼',
+    'Domain': '🎯'
+}
+
+# Shown in place of a profile picture when a candidate has no avatar
+AVATAR_PLACEHOLDER_HTML = '<div class="avatar-placeholder">👤</div>'
+
+# Page-wide styles: more visible tab buttons and the candidate card grid
+PAGE_CSS = """
+<style>
+section.main div[role="radiogroup"] {
+    gap: 12px;
+    margin-bottom: 30px;
+    border-bottom: 2px solid #2e3440;
+    padding-bottom: 0;
+}
+
+section.main div[role="radiogroup"] label[data-baseweb="radio"] {
+    height: 55px;
+    padding-left: 28px;
+    padding-right: 28px;
+    margin: 0 0 -2px 0;
+    background-color: #3b4252;
+    color: #d8dee9;
+    border: none;
+    border-radius: 8px 8px 0 0;
+    transition: all 0.2s ease;
+    cursor: pointer;
+}
+
+section.main div[role="radiogroup"] label[data-baseweb="radio"] p {
+    font-size: 20px;
+    font-weight: 700;
+}
+
+/* Hide the radio dot so the options read as tabs */
+section.main div[role="radiogroup"] label[data-baseweb="radio"] > div:first-child {
+    display: none;
+}
+
+section.main div[role="radiogroup"] label[data-baseweb="radio"]:hover {
+    background-color: #4c566a;
+    color: #eceff4;
+    transform: translateY(-2px);
+}
+
+section.main div[role="radiogroup"] label[data-baseweb="radio"]:has(input:checked) {
+    background-color: #5e81ac !important;
+    color: #ffffff !important;
+    border-bottom: 2px solid #5e81ac !important;
+    transform: translateY(-2px);
+}
+
+.candidate-grid {
+    display: grid;
+    grid-template-columns: repeat(3, minmax(0, 1fr));
+    gap: 1rem;
+}
+
+.candidate-card {
+    background: white;
+    padding: 1rem;
+    border-radius: 10px;
+    border: 1px solid #e0e0e0;
+    margin-bottom: 1rem;
+}
+
+.candidate-card p {
+    margin: 0.4rem 0;
+}
+
+.card-header {
+    display: flex;
+    align-items: center;
+    gap: 0.75rem;
+}
+
+.profile-pic {
+    border-radius: 50%;
+    width: 60px;
+    height: 60px;
+    object-fit: cover;
+}
+
+.avatar-placeholder {
+    width: 60px;
+    height: 60px;
+    border-radius: 50%;
+    background-color: #f0f0f0;
+    display: flex;
+    align-items: center;
+    justify-content: center;
+    font-size: 24px;
+    flex-shrink: 0;
+}
+
+.skill-badge {
+    display: inline-block;
+    background-color: #e8f4f8;
+    color: #1f77b4;
+    padding: 2px 8px;
+    margin: 2px;
+    border-radius: 12px;
+    font-size: 12px;
+    border: 1px solid #d0e8f2;
+}
+
+/* Lunch mode profiles use larger avatars and badges */
+.lunch-avatar {
+    width: 100px;
+    height: 100px;
+    border-radius: 50%;
+    object-fit: cover;
+}
+
+.lunch-avatar-placeholder {
+    width: 100px;
+    height: 100px;
+    border-radius: 50%;
+    background-color: #f0f0f0;
+    display: flex;
+    align-items: center;
+    justify-content: center;
+    font-size: 48px;
+}
+
+.lunch-skill-badge {
+    display: inline-block;
+    background-color: #e8f4f8;
+    color: #1f77b4;
+    padding: 4px 10px;
+    margin: 3px;
+    border-radius: 15px;
+    font-size: 14px;
+    border: 1px solid #d0e8f2;
+}
+</style>
+"""
+
+@st.cache_resource
+def get_client(mongo_uri):
+    """Create the process-wide MongoClient and its connection pool"""
+    return MongoClient(mongo_uri, maxPoolSize=MONGO_MAX_POOL_SIZE, compressors='zlib')
+
 @st.cache_resource
 def init_connection():
     """Initialize MongoDB connection"""
@@ -33,12 +259,31 @@ def init_connection():
         st.error("MongoDB URI not found in .env file")
         return None
     try:
-        client = MongoClient(mongo_uri)
+        client = get_client(mongo_uri)
         return client['last-recruiter-mvp']
     except Exception as e:
         st.error(f"Failed to connect to MongoDB: {e}")
         return None
 
+def get_effective_types(df):
+    """Get cofounder types per candidate, falling back from antler_cofounder_type to founder_type"""
+    no_types = np.empty(len(df), dtype=object)
+    no_types.fill([])
+    
+    if 'founder_type' in df.columns:
+        mapped = df['founder_type'].map(FOUNDER_TYPE_TO_ANTLER)
+        effective = np.where(mapped.notna(), mapped.to_numpy(), no_types)
+    else:
+        effective = no_types
+    
+    # antler_cofounder_type takes precedence whenever it holds a non-empty list
+    if 'antler_cofounder_type' in df.columns:
+        antler_types = df['antler_cofounder_type']
+        has_antler = antler_types.map(lambda x: isinstance(x, list) and len(x) > 0)
+        effective = np.where(has_antler, antler_types.to_numpy(), effective)
+    
+    return pd.Series(effective, index=df.index)
+
 @st.cache_data(ttl=300)  # Cache for 5 minutes
 def load_data():
     """Load candidate data from MongoDB"""
@@ -48,20 +293,740 @@ def load_data():
     
     try:
         collection = db['users']
-        candidates = list(collection.find({}))
+        projection = {field: 1 for field in CANDIDATE_FIELDS}
+        candidates = list(collection.find({}, projection=projection, batch_size=1000))
         
-        # Convert to DataFrame
-        df = pd.DataFrame(candidates)
+        # Convert to DataFrame with a fixed column set instead of the union of document keys
+        df = pd.DataFrame.from_records(candidates, columns=['_id'] + CANDIDATE_FIELDS)
         
         # Clean and prepare data
         if '_id' in df.columns:
             df['_id'] = df['_id'].astype(str)
         
+        # Avatar snippet for the card grid, built once per load
+        if 'avatar_url' in df.columns:
+            avatar_urls = df['avatar_url'].fillna('').astype(str)
+            avatar_tags = '<img src="' + avatar_urls.map(html.escape) + '" class="profile-pic">'
+            df['avatar_html'] = np.where(avatar_urls != '', avatar_tags, AVATAR_PLACEHOLDER_HTML)
+        else:
+            df['avatar_html'] = AVATAR_PLACEHOLDER_HTML
+        
+        # Lowercased name for the case-insensitive candidate search. The search columns
+        # are Arrow-backed strings so str.contains runs on Arrow compute kernels.
+        if 'name' in df.columns:
+            df['name_lc'] = df['name'].fillna('').astype(str).str.lower().astype(SEARCH_STRING_DTYPE)
+        
+        # Lowercased skills joined per candidate so search is a single substring scan.
+        # Newline separator keeps a search term from matching across two skills.
+        if 'skills' in df.columns:
+            df['skills_blob'] = df['skills'].map(
+                lambda x: '\n'.join(map(str, x)).lower() if isinstance(x, list) else ''
+            ).astype(SEARCH_STRING_DTYPE)
+            # Skills in a ragged CSR layout: integer codes for every (candidate, skill) pair,
+            # plus each row's offset and length into that flat array
+            df['skill_count'] = df['skills'].map(lambda x: len(x) if isinstance(x, list) else 0)
+            df['skill_offset'] = df['skill_count'].cumsum() - df['skill_count']
+            df.attrs['skill_codes'], df.attrs['skill_vocab'] = pd.factorize(flatten_lists(df['skills']))
+            # Skill badges for the card grid, joined once per load
+            df['skills_html'] = df['skills'].map(
+                lambda x: ''.join(f'<span class="skill-badge">{html.escape(str(skill))}</span>' for skill in x)
+                if isinstance(x, list) else ''
+            )
+        
+        # Rows holding a category list, so aggregations skip the per-row type check
+        if 'categories' in df.columns:
+            df['has_categories'] = df['categories'].map(type).eq(list)
+        
+        # Derive effective cofounder type once per load instead of on every rerun
+        if 'antler_cofounder_type' in df.columns or 'founder_type' in df.columns:
+            df['effective_cofounder_type'] = get_effective_types(df)
+            df.attrs['unique_types'] = sorted(df['effective_cofounder_type'].explode().dropna().unique())
+            for antler_type, flag_column in TYPE_FLAG_COLUMNS.items():
+                df[flag_column] = df['effective_cofounder_type'].map(lambda types: antler_type in types)
+        
+        # Low-cardinality string columns compare and count faster as categoricals.
+        # Done last because get_effective_types maps founder_type values to lists.
+        # Categories come out sorted, so they double as the sidebar filter options.
+        for col in CATEGORY_COLUMNS:
+            if col in df.columns:
+                df[col] = df[col].astype('category')
+        
+        # Schema is fixed per load, so record once which columns actually hold data
+        df.attrs['available_columns'] = frozenset(col for col in df.columns if df[col].notna().any())
+        
         return df
     except Exception as e:
         st.error(f"Error loading data: {e}")
         return pd.DataFrame()
 
+@st.cache_data(ttl=300)
+def apply_filters(selected_status, selected_antler_type, selected_location):
+    """
+    Filter the cohort and compute the key metrics for the given sidebar selections
+    
+    Args:
+        selected_status: Team status to keep, or 'All'
+        selected_antler_type: Cofounder type to keep, or 'All'
+        selected_location: Location to keep, or 'All'
+        
+    Returns:
+        Tuple of (filtered DataFrame, dict of metric counts)
+    """
+    df = load_data()
+    
+    # Combine all filters into one mask and slice the cohort once
+    mask = np.ones(len(df), dtype=bool)
+    if selected_status != 'All' and 'status' in df.columns:
+        mask &= (df['status'] == selected_status).to_numpy()
+    if selected_antler_type != 'All' and 'effective_cofounder_type' in df.columns:
+        # Filter based on effective cofounder type containing the selected type
+        if selected_antler_type in TYPE_FLAG_COLUMNS:
+            mask &= df[TYPE_FLAG_COLUMNS[selected_antler_type]].to_numpy()
+        else:
+            mask &= df['effective_cofounder_type'].map(
+                lambda x: selected_antler_type in x if isinstance(x, list) else False
+            ).to_numpy(dtype=bool)
+    if selected_location != 'All' and 'location' in df.columns:
+        mask &= (df['location'] == selected_location).to_numpy()
+    filtered_df = df[mask]
+    
+    metrics = {'total': len(filtered_df)}
+    if 'status' in df.columns:
+        metrics['looking'] = int((filtered_df['status'] == 'Looking for co-founder').sum())
+    if 'effective_cofounder_type' in df.columns:
+        # One reduction over both flag columns instead of a pass per type
+        type_totals = filtered_df[['is_technology', 'is_business']].sum()
+        metrics['technology'] = int(type_totals['is_technology'])
+        metrics['business'] = int(type_totals['is_business'])
+    if 'location' in df.columns:
+        metrics['unique_locations'] = filtered_df['location'].nunique()
+    
+    return filtered_df, metrics
+
+@st.cache_data(ttl=300)
+def compute_overview_stats(selected_status, selected_antler_type, selected_location):
+    """
+    Aggregate the Overview tab counts for the given sidebar selections
+    
+    Args:
+        selected_status: Team status to keep, or 'All'
+        selected_antler_type: Cofounder type to keep, or 'All'
+        selected_location: Location to keep, or 'All'
+        
+    Returns:
+        Dict of count Series for status, cofounder type, location and the cofounder
+        types of those looking, plus the number of candidates looking
+    """
+    filtered_df, _ = apply_filters(selected_status, selected_antler_type, selected_location)
+    empty_counts = pd.Series(dtype='int64')
+    stats = {'status': empty_counts, 'types': empty_counts, 'locations': empty_counts,
+             'looking_types': empty_counts, 'looking_total': 0}
+    
+    if 'status' in filtered_df.columns:
+        stats['status'] = filtered_df['status'].value_counts()
+    if 'location' in filtered_df.columns:
+        # A categorical also lists unused categories with a zero count
+        location_counts = filtered_df['location'].value_counts()
+        stats['locations'] = location_counts[location_counts > 0]
+    if 'effective_cofounder_type' in filtered_df.columns:
+        stats['types'] = filtered_df['effective_cofounder_type'].explode().value_counts()
+        if 'status' in filtered_df.columns:
+            looking_types = filtered_df.loc[filtered_df['status'] == 'Looking for co-founder', 'effective_cofounder_type']
+            stats['looking_total'] = len(looking_types)
+            stats['looking_types'] = looking_types.explode().value_counts()
+    
+    return stats
+
+def flatten_lists(series, is_list=None):
+    """
+    Concatenate the list values of a Series into one flat array
+    
+    Args:
+        series: Series whose values are lists (non-list values are skipped)
+        is_list: Optional precomputed boolean mask of the rows holding a list
+        
+    Returns:
+        1-D object ndarray with every list element
+    """
+    if is_list is None:
+        is_list = series.map(type).eq(list)
+    lists = series[is_list]
+    if lists.empty:
+        return np.array([], dtype=object)
+    return np.concatenate(lists.to_numpy(), dtype=object)
+
+def count_skill_codes(frame):
+    """
+    Count skills for a subset of candidates using the CSR skill layout built in load_data
+    
+    Args:
+        frame: Rows of the candidates DataFrame
+        
+    Returns:
+        Series of skill counts sorted descending
+    """
+    lengths = frame['skill_count'].to_numpy()
+    starts = frame['skill_offset'].to_numpy()
+    # Position of every skill of every selected row in the flat code array
+    positions = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths) + np.arange(lengths.sum())
+    codes = frame.attrs['skill_codes'][positions]
+    vocab = frame.attrs['skill_vocab']
+    counts = pd.Series(np.bincount(codes[codes >= 0], minlength=len(vocab)), index=vocab)
+    return counts[counts > 0].sort_values(ascending=False)
+
+@st.cache_data(ttl=300)
+def compute_skill_stats(selected_status, selected_antler_type, selected_location):
+    """
+    Aggregate skill and category counts for the given sidebar selections
+    
+    Args:
+        selected_status: Team status to keep, or 'All'
+        selected_antler_type: Cofounder type to keep, or 'All'
+        selected_location: Location to keep, or 'All'
+        
+    Returns:
+        Dict of count Series (sorted descending) for cohort, looking and team skills and categories
+    """
+    filtered_df, _ = apply_filters(selected_status, selected_antler_type, selected_location)
+    empty_counts = pd.Series(dtype='int64')
+    stats = {'skills': empty_counts, 'looking': empty_counts, 'team': empty_counts, 'categories': empty_counts}
+    
+    if 'skills' in filtered_df.columns:
+        stats['skills'] = count_skill_codes(filtered_df)
+        
+        if 'status' in filtered_df.columns:
+            stats['looking'] = count_skill_codes(filtered_df[filtered_df['status'] == 'Looking for co-founder'])
+            stats['team'] = count_skill_codes(filtered_df[filtered_df['status'] == 'In a team'])
+    
+    if 'categories' in filtered_df.columns:
+        stats['categories'] = pd.Series(
+            flatten_lists(filtered_df['categories'], filtered_df['has_categories'])
+        ).value_counts()
+    
+    return stats
+
+@st.cache_data(ttl=300)
+def compute_location_stats(selected_status, selected_antler_type, selected_location):
+    """
+    Aggregate location counts for the given sidebar selections
+    
+    Args:
+        selected_status: Team status to keep, or 'All'
+        selected_antler_type: Cofounder type to keep, or 'All'
+        selected_location: Location to keep, or 'All'
+        
+    Returns:
+        Dict with the top-10 location/status breakdown, the top-3 concentration
+        percentage and the location distribution table
+    """
+    filtered_df, _ = apply_filters(selected_status, selected_antler_type, selected_location)
+    
+    # Reuse the Overview's cached location count for the same filter selection
+    location_counts = compute_overview_stats(selected_status, selected_antler_type, selected_location)['locations']
+    top_counts = location_counts.head(10)
+    
+    # value_counts is sorted, so the top 3 are a prefix of one shared percentage array
+    values = location_counts.to_numpy()
+    total = values.sum()
+    percentages = values * (100.0 / total) if total else values.astype(float)
+    
+    table = top_counts.rename_axis('Location').reset_index(name='Count')
+    table['Location'] = table['Location'].astype(str)
+    table['Percentage'] = np.round(percentages[:10], 1)
+    
+    stats = {
+        'top_3_concentration': percentages[:3].sum(),
+        'table': table,
+        'status_breakdown': pd.DataFrame(columns=['location', 'status', 'count'])
+    }
+    
+    if 'status' in filtered_df.columns:
+        # Dense location x status grid in one crosstab; reindexing to the top 10
+        # keeps their order for the chart, then melt back to long form for px.bar
+        location_status = pd.crosstab(filtered_df['location'], filtered_df['status'])
+        if not location_status.empty:
+            stats['status_breakdown'] = (
+                location_status.reindex(top_counts.index, fill_value=0)
+                .reset_index()
+                .melt(id_vars='location', var_name='status', value_name='count')
+                .astype({'location': str, 'status': str})
+            )
+    
+    return stats
+
+def make_bar(counts, top=MAX_BARS, horizontal=False, color_map=None, colorscale=None, height=400, **layout):
+    """
+    Build a bar chart from a counts Series, keeping only the largest categories
+    
+    Args:
+        counts: Series of counts indexed by category
+        top: Maximum number of bars to show (capped at MAX_BARS)
+        horizontal: Draw horizontal bars instead of vertical ones
+        color_map: Optional dict mapping category to bar color
+        colorscale: Optional Plotly colorscale sampled per bar by value
+        height: Figure height in pixels
+        **layout: Extra layout options such as title and axis titles
+        
+    Returns:
+        Plotly Figure
+    """
+    # Categorical columns report unused categories with a zero count
+    counts = counts[counts > 0].nlargest(min(top, MAX_BARS))
+    
+    if color_map is not None:
+        marker = dict(color=[color_map.get(label, DEFAULT_BAR_COLOR) for label in counts.index])
+    elif colorscale is not None and not counts.empty:
+        # Sample the scale in Python so the figure carries plain colors and no colorbar
+        values = counts.to_numpy(dtype=float)
+        span = values.max() - values.min()
+        positions = (values - values.min()) / span if span else np.ones_like(values)
+        marker = dict(color=sample_colorscale(colorscale, positions.tolist()))
+    else:
+        marker = dict(color=DEFAULT_BAR_COLOR)
+    
+    x, y = (counts.values, counts.index) if horizontal else (counts.index, counts.values)
+    fig = go.Figure(go.Bar(
+        x=x,
+        y=y,
+        orientation='h' if horizontal else 'v',
+        marker=marker,
+        text=counts.values,
+        texttemplate='%{text}',
+        textposition='outside',
+        # Plain "label: value" hover instead of Plotly's default multi-field box
+        hovertemplate='%{y}: %{x}<extra></extra>' if horizontal else '%{x}: %{y}<extra></extra>'
+    ))
+    # Constant uirevision keeps zoom/hover state instead of resetting it on every rerun
+    fig.update_layout(showlegend=False, height=height, uirevision='fixed', **layout)
+    return fig
+
+def build_candidate_card(candidate):
+    """
+    Build the HTML card for a single candidate in the grid view
+    
+    Args:
+        candidate: Dict of one candidate's fields
+        
+    Returns:
+        HTML string for the candidate card
+    """
+    # Profile picture (precomputed in load_data) and name in horizontal layout
+    name = html.escape(str(candidate.get('name', 'Unknown')))
+    parts = [f'<div class="card-header">{candidate["avatar_html"]}<strong>{name}</strong></div>']
+    
+    # Status and founder type on the same line
+    line_items = []
+    status = candidate.get('status')
+    if pd.notna(status):
+        status_color = STATUS_EMOJIS.get(status, STATUS_EMOJI_DEFAULT)
+        line_items.append(f"{status_color} {html.escape(str(status))}")
+    
+    # Use effective cofounder type (with fallback logic)
+    effective_types = candidate.get('effective_cofounder_type')
+    if effective_types:
+        line_items.extend(f"{TYPE_EMOJIS.get(atype, '🏷️')} {html.escape(atype)}" for atype in effective_types)
+    
+    if line_items:
+        parts.append(f"<p>{' | '.join(line_items)}</p>")
+    
+    if 'location' in candidate:
+        location = candidate['location']
+        parts.append(f"<p>📍 {html.escape(str(location)) if pd.notna(location) else 'N/A'}</p>")
+    
+    tagline = candidate.get('tagline')
+    if pd.notna(tagline):
+        parts.append(f"<p><em>{html.escape(str(tagline))}</em></p>")
+    
+    skills_html = candidate.get('skills_html')
+    if skills_html:
+        parts.append(skills_html)
+    
+    return f'<div class="candidate-card">{"".join(parts)}</div>'
+
+def render_overview_tab(filtered_df, selected_status, selected_antler_type, selected_location):
+    """
+    Render the Overview tab
+    
+    Args:
+        filtered_df: Candidates matching the sidebar filters
+        selected_status: Active team status filter
+        selected_antler_type: Active cofounder type filter
+        selected_location: Active location filter
+    """
+    # Chart counts (cached per filter selection)
+    overview_stats = compute_overview_stats(selected_status, selected_antler_type, selected_location)
+    
+    # First row - three main charts
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        # Status distribution bar chart
+        st.subheader("Founder Status Distribution")
+        if 'status' in filtered_df.columns:
+            fig_status = make_bar(overview_stats['status'], color_map=STATUS_COLORS, xaxis_title='Status', yaxis_title='Count')
+            st.plotly_chart(fig_status, use_container_width=True)
+        else:
+            st.info("Status information not available")
+    
+    with col2:
+        # Cofounder type distribution bar chart
+        st.subheader("Cofounder Type Distribution")
+        if 'effective_cofounder_type' in filtered_df.columns:
+            # Occurrences of each type across all effective arrays
+            type_counts = overview_stats['types']
+            
+            if not type_counts.empty:
+                fig_founder_type = make_bar(
+                    type_counts, color_map=TYPE_COLORS, xaxis_title='Cofounder Type', yaxis_title='Count'
+                )
+                st.plotly_chart(fig_founder_type, use_container_width=True)
+            else:
+                st.info("No cofounder type data available")
+        else:
+            st.info("Cofounder type information not available")
+    
+    with col3:
+        # Location distribution
+        st.subheader("Top Locations")
+        if 'location' in filtered_df.columns:
+            fig_location = make_bar(
+                overview_stats['locations'],
+                top=8,  # Show fewer to fit in smaller column
+                horizontal=True,
+                colorscale='Viridis',
+                xaxis_title='Count',
+                yaxis_title='Location'
+            )
+            st.plotly_chart(fig_location, use_container_width=True)
+        else:
+            st.info("Location information not available")
+    
+    # Second row - Cofounder matching insights
+    st.markdown("---")
+    st.subheader("🤝 Available for Cofounder Matching")
+    
+    # Center the chart in a single column
+    if 'status' in filtered_df.columns and 'effective_cofounder_type' in filtered_df.columns:
+        # Those looking for cofounders
+        total_looking = overview_stats['looking_total']
+        
+        if total_looking > 0:
+            # Effective cofounder types among those looking for cofounders
+            type_counts = overview_stats['looking_types']
+            
+            if not type_counts.empty:
+                fig_looking = make_bar(
+                    type_counts,
+                    color_map=TYPE_COLORS,
+                    title="Antler Cofounder Types Looking for Partners",
+                    xaxis_title='Antler Cofounder Type',
+                    yaxis_title='Count'
+                )
+                st.plotly_chart(fig_looking, use_container_width=True)
+                
+                # Show percentages and matching insights in columns
+                col1, col2, col3 = st.columns(3)
+                
+                with col1:
+                    st.markdown("**📊 Breakdown:**")
+                    breakdown = type_counts.rename_axis('Type').reset_index(name='Founders')
+                    breakdown['Share (%)'] = (type_counts.to_numpy() * (100.0 / type_counts.sum())).round(1)
+                    st.dataframe(breakdown, hide_index=True, use_container_width=True)
+                
+                with col2:
+                    st.markdown("**🎯 Matching Opportunities:**")
+                    tech_count = type_counts.get('Technology', 0)
+                    biz_count = type_counts.get('Business', 0)
+                    domain_count = type_counts.get('Domain', 0)
+                    
+                    if tech_count > biz_count and tech_count > domain_count:
+                        st.write("⚠️ More Technology founders looking")
+                        st.write("💡 Great opportunity for Business/Domain founders!")
+                    elif biz_count > tech_count and biz_count > domain_count:
+                        st.write("⚠️ More Business founders looking") 
+                        st.write("💡 Great opportunity for Technology/Domain founders!")
+                    elif domain_count > tech_count and domain_count > biz_count:
+                        st.write("⚠️ More Domain founders looking")
+                        st.write("💡 Great opportunity for Technology/Business founders!")
+                    else:
+                        st.write("✅ Balanced availability!")
+                        st.write("🤝 Good matching potential")
+                
+                with col3:
+                    st.markdown("**💼 Total Available:**")
+                    st.metric("Total Available", f"{total_looking} founders", help="Total founders looking for cofounders")
+                    if total_looking > 0:
+                        cohort_percentage = (total_looking / len(filtered_df) * 100) if len(filtered_df) > 0 else 0
+                        st.write(f"({cohort_percentage:.1f}% of cohort)")
+            else:
+                st.info("No cofounder type data available for candidates looking for cofounders")
+        else:
+            st.info("No founders currently looking for cofounders with the applied filters")
+    else:
+        st.info("Status or cofounder type information not available")
+
+def render_candidates_tab(filtered_df):
+    """
+    Render the Candidates tab with search, table/card views and lunch mode
+    
+    Args:
+        filtered_df: Candidates matching the sidebar filters
+    """
+    st.subheader("👥 Candidate Profiles")
+    
+    # Add lunch mode checkbox and search in the same row
+    col_search, col_view, col_checkbox = st.columns([3, 1, 1])
+    
+    with col_search:
+        # Search box with placeholder text that changes based on lunch mode
+        search_placeholder = "🔍 Search by name or skills"
+        search_term = st.text_input("Search", "", placeholder=search_placeholder, label_visibility="collapsed")
+    
+    with col_view:
+        card_view = st.checkbox("🗂️ Card View", help="Show candidates as profile cards instead of a table")
+    
+    with col_checkbox:
+        lunch_mode = st.checkbox("🍽️ Lunch Mode", help="Enable to search for multiple people at once and see expanded profiles. Perfect for lunch meetings!")
+    
+    # Filter candidates based on search
+    display_df = filtered_df
+    
+    if search_term:
+        if lunch_mode:
+            # In lunch mode, split the search term by spaces and search for each name
+            # This allows pasting multiple names at once
+            names = search_term.replace(',', ' ').split()
+            
+            # Match any of the names with a single regex alternation
+            pattern = '|'.join(re.escape(name.lower()) for name in names)
+            if pattern:
+                mask = display_df['name_lc'].str.contains(pattern, regex=True)
+                display_df = display_df[mask]
+        else:
+            # Normal search mode - plain substring match on the precomputed lowercase name and skills
+            query = search_term.lower()
+            mask = display_df['name_lc'].str.contains(query, regex=False)
+            if 'skills_blob' in display_df.columns:
+                skills_mask = display_df['skills_blob'].str.contains(query, regex=False)
+                mask = mask | skills_mask
+            display_df = display_df[mask]
+    
+    # Display candidates in a grid
+    st.write(f"Showing {len(display_df)} candidates")
+    
+    # Table view is arrow-backed and virtualized in the browser, so it needs no pagination
+    table_view = not lunch_mode and not card_view
+    if table_view:
+        table_columns = [col for col in CANDIDATE_TABLE_COLUMNS if col in display_df.columns]
+        st.dataframe(
+            display_df[table_columns],
+            column_config=CANDIDATE_TABLE_CONFIG,
+            hide_index=True,
+            use_container_width=True
+        )
+    
+    # Paginate so each rerun only renders one page of cards
+    total_pages = max(1, -(-len(display_df) // CANDIDATES_PER_PAGE))
+    if not table_view and total_pages > 1:
+        page = st.number_input("Page", min_value=1, max_value=total_pages, value=1, step=1)
+        st.caption(f"Page {page} of {total_pages}")
+        start = (page - 1) * CANDIDATES_PER_PAGE
+        display_df = display_df.iloc[start:start + CANDIDATES_PER_PAGE]
+    
+    # Different display modes for lunch mode vs normal mode
+    if lunch_mode and len(display_df) > 0:
+        # Lunch mode: Show expanded profiles in a vertical list
+        st.markdown("### 🍽️ Lunch Group Profiles")
+        
+        for candidate in display_df.to_dict('records'):
+            # Create an expander for each person with more information
+            with st.container():
+                # Create a card-like container with more info
+                col_main, col_details = st.columns([1, 2])
+                
+                with col_main:
+                    # Profile section
+                    if 'avatar_url' in candidate and pd.notna(candidate['avatar_url']) and candidate['avatar_url']:
+                        st.markdown(
+                            f'<img src="{candidate["avatar_url"]}" class="lunch-avatar">',
+                            unsafe_allow_html=True
+                        )
+                    else:
+                        st.markdown(
+                            '<div class="lunch-avatar-placeholder">👤</div>',
+                            unsafe_allow_html=True
+                        )
+                    
+                    st.markdown(f"### {candidate.get('name', 'Unknown')}")
+                    
+                    # Status
+                    if 'status' in candidate:
+                        status_color = STATUS_EMOJIS.get(candidate['status'], STATUS_EMOJI_DEFAULT)
+                        st.markdown(f"{status_color} **{candidate['status']}**")
+                    
+                    # Location
+                    if 'location' in candidate:
+                        st.markdown(f"📍 **Location:** {candidate.get('location', 'N/A')}")
+                
+                with col_details:
+                    # Cofounder type
+                    effective_types = candidate.get('effective_cofounder_type')
+                    if effective_types and len(effective_types) > 0:
+                        type_texts = [f"{TYPE_EMOJIS.get(atype, '🏷️')} {atype}" for atype in effective_types]
+                        st.markdown(f"**Type:** {' | '.join(type_texts)}")
+                    
+                    # Tagline
+                    if 'tagline' in candidate and pd.notna(candidate['tagline']):
+                        st.markdown(f"**Tagline:** *{candidate['tagline']}*")
+                    
+                    # Bio/Description if available
+                    if 'bio' in candidate and pd.notna(candidate['bio']):
+                        st.markdown(f"**About:** {candidate['bio']}")
+                    elif 'description' in candidate and pd.notna(candidate['description']):
+                        st.markdown(f"**About:** {candidate['description']}")
+                    
+                    # Skills
+                    if 'skills' in candidate and isinstance(candidate['skills'], list) and len(candidate['skills']) > 0:
+                        st.markdown("**Skills:**")
+                        skills_html = ''.join(
+                            f'<span class="lunch-skill-badge">{skill}</span>'
+                            for skill in candidate['skills'][:10]  # Limit to 10 skills for readability
+                        )
+                        st.markdown(skills_html, unsafe_allow_html=True)
+                    
+                    # LinkedIn if available
+                    if 'linkedin' in candidate and pd.notna(candidate['linkedin']):
+                        st.markdown(f"🔗 [LinkedIn Profile]({candidate['linkedin']})")
+                    
+                    # Email if available  
+                    if 'email' in candidate and pd.notna(candidate['email']):
+                        st.markdown(f"✉️ **Email:** {candidate['email']}")
+                    
+                    # Categories if available
+                    if 'categories' in candidate and isinstance(candidate['categories'], list) and len(candidate['categories']) > 0:
+                        st.markdown(f"**Industries:** {', '.join(candidate['categories'][:5])}")
+                
+                st.markdown("---")
+    
+    elif card_view:
+        # Card view: Display in grid, emitted as a single HTML block
+        # Plain dicts per row instead of a Series per iterrows step
+        cards_html = ''.join(build_candidate_card(candidate) for candidate in display_df.to_dict('records'))
+        st.markdown(
+            f'<div class="candidate-grid">{cards_html}</div>',
+            unsafe_allow_html=True
+        )
+
+def render_skills_tab(filtered_df, selected_status, selected_antler_type, selected_location):
+    """
+    Render the Skills Analysis tab
+    
+    Args:
+        filtered_df: Candidates matching the sidebar filters
+        selected_status: Active team status filter
+        selected_antler_type: Active cofounder type filter
+        selected_location: Active location filter
+    """
+    st.subheader("🎯 Skills Analysis")
+    
+    # Count skills across all candidates (cached per filter selection)
+    skill_stats = compute_skill_stats(selected_status, selected_antler_type, selected_location)
+    skill_counts = skill_stats['skills']
+    
+    if not skill_counts.empty:
+        top_skills = skill_counts.head(15)
+        
+        # Create bar chart for top skills
+        fig_skills = make_bar(
+            top_skills,
+            horizontal=True,
+            colorscale='Teal',
+            height=500,
+            title="Top 15 Skills in the Cohort",
+            xaxis_title='Number of Candidates',
+            yaxis_title='Skill'
+        )
+        st.plotly_chart(fig_skills, use_container_width=True)
+        
+        # Skills by status
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            if 'status' in filtered_df.columns:
+                st.markdown("#### Skills Distribution by Status")
+                looking_skills = skill_stats['looking']
+                team_skills = skill_stats['team']
+                
+                if not looking_skills.empty:
+                    st.markdown("**Top skills among those looking:**")
+                    looking_top = looking_skills.head(5).rename_axis('Skill').reset_index(name='Count')
+                    st.dataframe(looking_top, hide_index=True, use_container_width=True)
+                
+                if not team_skills.empty:
+                    st.markdown("**Top skills among those in teams:**")
+                    team_top = team_skills.head(5).rename_axis('Skill').reset_index(name='Count')
+                    st.dataframe(team_top, hide_index=True, use_container_width=True)
+        
+        with col2:
+            # Skill categories distribution
+            if 'categories' in filtered_df.columns:
+                st.markdown("#### Category Distribution")
+                cat_counts = skill_stats['categories']
+                if len(cat_counts) > MAX_PIE_SLICES:
+                    top_cats = cat_counts.head(MAX_PIE_SLICES - 1)
+                    other = cat_counts.iloc[MAX_PIE_SLICES - 1:].sum()
+                    cat_counts = pd.concat([top_cats, pd.Series({'Other': other})])
+                
+                if not cat_counts.empty:
+                    fig_cats = px.pie(
+                        values=cat_counts.values,
+                        names=cat_counts.index,
+                        title="Domain Categories"
+                    )
+                    fig_cats.update_layout(uirevision='fixed')
+                    st.plotly_chart(fig_cats, use_container_width=True)
+
+def render_location_tab(filtered_df, selected_status, selected_antler_type, selected_location):
+    """
+    Render the Location Insights tab
+    
+    Args:
+        filtered_df: Candidates matching the sidebar filters
+        selected_status: Active team status filter
+        selected_antler_type: Active cofounder type filter
+        selected_location: Active location filter
+    """
+    st.subheader("📍 Location Insights")
+    
+    # Location aggregates (cached per filter selection)
+    location_stats = compute_location_stats(selected_status, selected_antler_type, selected_location)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Location by status
+        if 'status' in filtered_df.columns:
+            st.markdown("#### Team Formation by Location")
+            fig_location_status = px.bar(
+                location_stats['status_breakdown'],
+                x='location',
+                y='count',
+                color='status',
+                title="Status Distribution by Location",
+                color_discrete_map=STATUS_COLORS
+            )
+            fig_location_status.update_layout(height=400, hovermode='x', uirevision='fixed')
+            st.plotly_chart(fig_location_status, use_container_width=True)
+    
+    with col2:
+        # Location concentration
+        st.markdown("#### Geographic Concentration")
+        st.metric("Top 3 Cities Concentration", f"{location_stats['top_3_concentration']:.1f}%")
+        
+        # Show location distribution table
+        st.markdown("**Candidate Distribution:**")
+        st.dataframe(location_stats['table'], hide_index=True, use_container_width=True)
+
 def main():
     # Password protection
     if 'authenticated' not in st.session_state:
@@ -92,6 +1057,10 @@ def main():
             st.session_state.authenticated = False
             st.rerun()
     
+    # Styles are emitted once per run at page level; Streamlit drops elements that a
+    # rerun does not re-emit, so this cannot be skipped on later reruns
+    st.markdown(PAGE_CSS, unsafe_allow_html=True)
+    
     # Title and description
     st.title("🚀 Antler Cofounder Matching Dashboard")
     st.markdown("### Discover potential cofounders and explore the Antler cohort")
@@ -107,652 +1076,71 @@ def main():
     st.sidebar.header("🔍 Filters")
     
     # Status filter
-    status_options = ['All'] + list(df['status'].unique()) if 'status' in df.columns else ['All']
+    status_options = ['All'] + df['status'].cat.categories.tolist() if 'status' in df.columns else ['All']
     selected_status = st.sidebar.selectbox("Team Status", status_options)
     
-    # Create a helper function to get effective cofounder type
-    def get_effective_type(row):
-        """Get cofounder type with fallback logic"""
-        types = []
-        
-        # First try antler_cofounder_type
-        if 'antler_cofounder_type' in row and isinstance(row['antler_cofounder_type'], list) and len(row['antler_cofounder_type']) > 0:
-            types = row['antler_cofounder_type']
-        # Fallback to founder_type
-        elif 'founder_type' in row and pd.notna(row['founder_type']):
-            founder_type = row['founder_type']
-            # Map founder_type to antler format
-            if founder_type in ['technical', 'technology']:
-                types = ['Technology']
-            elif founder_type == 'business':
-                types = ['Business']
-        
-        return types
-
-    # Add effective type column for filtering
-    if 'antler_cofounder_type' in df.columns or 'founder_type' in df.columns:
-        df['effective_cofounder_type'] = df.apply(get_effective_type, axis=1)
-        
-        # Extract all unique types from effective types
-        all_types = []
-        for types in df['effective_cofounder_type']:
-            if isinstance(types, list):
-                all_types.extend(types)
-        unique_types = sorted(list(set(all_types)))
-        antler_type_options = ['All'] + unique_types
+    # Cofounder type filter (effective types are precomputed in load_data)
+    if 'effective_cofounder_type' in df.columns:
+        antler_type_options = ['All'] + df.attrs['unique_types']
         selected_antler_type = st.sidebar.selectbox("Cofounder Type", antler_type_options)
     else:
         selected_antler_type = 'All'
     
     # Location filter
     if 'location' in df.columns:
-        location_options = ['All'] + sorted(df['location'].dropna().unique().tolist())
+        location_options = ['All'] + df['location'].cat.categories.tolist()
         selected_location = st.sidebar.selectbox("Location", location_options)
     else:
         selected_location = 'All'
     
-    # Apply filters
-    filtered_df = df.copy()
-    if selected_status != 'All' and 'status' in df.columns:
-        filtered_df = filtered_df[filtered_df['status'] == selected_status]
-    if selected_antler_type != 'All' and 'effective_cofounder_type' in filtered_df.columns:
-        # Filter based on effective cofounder type containing the selected type
-        mask = filtered_df['effective_cofounder_type'].apply(
-            lambda x: selected_antler_type in x if isinstance(x, list) else False
-        )
-        filtered_df = filtered_df[mask]
-    if selected_location != 'All' and 'location' in df.columns:
-        filtered_df = filtered_df[filtered_df['location'] == selected_location]
+    # Apply filters (cached per filter combination)
+    filtered_df, metrics = apply_filters(selected_status, selected_antler_type, selected_location)
     
     # Key metrics
     col1, col2, col3, col4, col5 = st.columns(5)
     
     with col1:
-        st.metric("Total Participants", len(filtered_df))
+        st.metric("Total Participants", metrics['total'])
     
     with col2:
-        if 'status' in df.columns:
-            looking_count = len(filtered_df[filtered_df['status'] == 'Looking for co-founder'])
-            st.metric("Looking for Cofounder", looking_count)
+        if 'looking' in metrics:
+            st.metric("Looking for Cofounder", metrics['looking'])
     
     with col3:
-        if 'effective_cofounder_type' in filtered_df.columns:
-            tech_mask = filtered_df['effective_cofounder_type'].apply(
-                lambda x: 'Technology' in x if isinstance(x, list) else False
-            )
-            technical_count = tech_mask.sum()
-            st.metric("Technology Founders", technical_count)
+        if 'technology' in metrics:
+            st.metric("Technology Founders", metrics['technology'])
     
     with col4:
-        if 'effective_cofounder_type' in filtered_df.columns:
-            biz_mask = filtered_df['effective_cofounder_type'].apply(
-                lambda x: 'Business' in x if isinstance(x, list) else False
-            )
-            business_count = biz_mask.sum()
-            st.metric("Business Founders", business_count)
+        if 'business' in metrics:
+            st.metric("Business Founders", metrics['business'])
     
     with col5:
-        if 'location' in df.columns:
-            unique_locations = filtered_df['location'].nunique()
-            st.metric("Unique Locations", unique_locations)
+        if 'unique_locations' in metrics:
+            st.metric("Unique Locations", metrics['unique_locations'])
     
     st.markdown("---")
     
-    # Enhanced tab styling - more visible buttons
-    st.markdown("""
-        <style>
-        .stTabs [data-baseweb="tab-list"] {
-            gap: 12px;
-            margin-bottom: 30px;
-            border-bottom: 2px solid #2e3440;
-            padding-bottom: 0;
-        }
-        
-        .stTabs [data-baseweb="tab"] {
-            height: 55px;
-            padding-left: 28px;
-            padding-right: 28px;
-            background-color: #3b4252;
-            color: #d8dee9;
-            font-size: 20px;
-            font-weight: 700;
-            border: none;
-            border-radius: 8px 8px 0 0;
-            margin-bottom: -2px;
-            transition: all 0.2s ease;
-            cursor: pointer;
-        }
-        
-        .stTabs [data-baseweb="tab"]:hover {
-            background-color: #4c566a;
-            color: #eceff4;
-            transform: translateY(-2px);
-        }
-        
-        .stTabs [aria-selected="true"] {
-            background-color: #5e81ac !important;
-            color: #ffffff !important;
-            border-bottom: 2px solid #5e81ac !important;
-            transform: translateY(-2px);
-        }
-        
-        .stTabs [data-baseweb="tab-panel"] {
-            padding-top: 30px;
-        }
-        </style>
-    """, unsafe_allow_html=True)
-    
     # Main content area with tabs
-    tab1, tab2, tab3, tab4 = st.tabs(["📊 Overview", "👥 Candidates", "🎯 Skills Analysis", "📍 Location Insights"])
-    
-    with tab1:
-        # First row - three main charts
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            # Status distribution bar chart
-            st.subheader("Founder Status Distribution")
-            if 'status' in df.columns:
-                status_counts = filtered_df['status'].value_counts()
-                fig_status = px.bar(
-                    x=status_counts.index,
-                    y=status_counts.values,
-                    labels={'x': 'Status', 'y': 'Count'},
-                    color=status_counts.index,
-                    color_discrete_map={
-                        'Looking for co-founder': '#10B981',
-                        'In a team': '#3B82F6'
-                    },
-                    text=status_counts.values
-                )
-                fig_status.update_traces(texttemplate='%{text}', textposition='outside')
-                fig_status.update_layout(showlegend=False, height=400)
-                st.plotly_chart(fig_status, use_container_width=True)
-            else:
-                st.info("Status information not available")
-        
-        with col2:
-            # Cofounder type distribution bar chart
-            st.subheader("Cofounder Type Distribution")
-            if 'effective_cofounder_type' in filtered_df.columns:
-                # Count occurrences of each type across all effective arrays
-                type_counts = {}
-                for types in filtered_df['effective_cofounder_type']:
-                    if isinstance(types, list):
-                        for t in types:
-                            type_counts[t] = type_counts.get(t, 0) + 1
-                
-                if type_counts:
-                    fig_founder_type = px.bar(
-                        x=list(type_counts.keys()),
-                        y=list(type_counts.values()),
-                        labels={'x': 'Cofounder Type', 'y': 'Count'},
-                        color=list(type_counts.keys()),
-                        color_discrete_map={
-                            'Technology': '#8B5CF6',  # Purple for Technology
-                            'Business': '#F59E0B',    # Orange for Business
-                            'Domain': '#10B981'       # Green for Domain
-                        },
-                        text=list(type_counts.values())
-                    )
-                    fig_founder_type.update_traces(texttemplate='%{text}', textposition='outside')
-                    fig_founder_type.update_layout(showlegend=False, height=400)
-                    st.plotly_chart(fig_founder_type, use_container_width=True)
-                else:
-                    st.info("No cofounder type data available")
-            else:
-                st.info("Cofounder type information not available")
-        
-        with col3:
-            # Location distribution
-            st.subheader("Top Locations")
-            if 'location' in df.columns:
-                location_counts = filtered_df['location'].value_counts().head(8)  # Show fewer to fit in smaller column
-                fig_location = px.bar(
-                    y=location_counts.index,
-                    x=location_counts.values,
-                    orientation='h',
-                    labels={'x': 'Count', 'y': 'Location'},
-                    color=location_counts.values,
-                    color_continuous_scale='Viridis',
-                    text=location_counts.values
-                )
-                fig_location.update_traces(texttemplate='%{text}', textposition='outside')
-                fig_location.update_layout(showlegend=False, height=400)
-                st.plotly_chart(fig_location, use_container_width=True)
-            else:
-                st.info("Location information not available")
-        
-        # Second row - Cofounder matching insights
-        st.markdown("---")
-        st.subheader("🤝 Available for Cofounder Matching")
-        
-        # Center the chart in a single column
-        if 'status' in df.columns and 'effective_cofounder_type' in filtered_df.columns:
-            # Filter for those looking for cofounders
-            looking_df = filtered_df[filtered_df['status'] == 'Looking for co-founder']
-            
-            if len(looking_df) > 0:
-                # Count effective cofounder types among those looking for cofounders
-                type_counts = {}
-                for types in looking_df['effective_cofounder_type']:
-                    if isinstance(types, list):
-                        for t in types:
-                            type_counts[t] = type_counts.get(t, 0) + 1
-                
-                if type_counts:
-                    fig_looking = px.bar(
-                        x=list(type_counts.keys()),
-                        y=list(type_counts.values()),
-                        labels={'x': 'Antler Cofounder Type', 'y': 'Count'},
-                        title="Antler Cofounder Types Looking for Partners",
-                        color=list(type_counts.keys()),
-                        color_discrete_map={
-                            'Technology': '#8B5CF6',  # Purple for Technology
-                            'Business': '#F59E0B',    # Orange for Business
-                            'Domain': '#10B981'       # Green for Domain
-                        },
-                        text=list(type_counts.values())
-                    )
-                    fig_looking.update_traces(texttemplate='%{text}', textposition='outside')
-                    fig_looking.update_layout(showlegend=False, height=400)
-                    st.plotly_chart(fig_looking, use_container_width=True)
-                    
-                    # Show percentages and matching insights in columns
-                    col1, col2, col3 = st.columns(3)
-                    
-                    with col1:
-                        st.markdown("**📊 Breakdown:**")
-                        total_looking = len(looking_df)
-                        total_type_counts = sum(type_counts.values())
-                        for antler_type, count in type_counts.items():
-                            percentage = (count / total_type_counts * 100) if total_type_counts > 0 else 0
-                            st.write(f"• **{antler_type}**: {count} founders ({percentage:.1f}%)")
-                    
-                    with col2:
-                        st.markdown("**🎯 Matching Opportunities:**")
-                        tech_count = type_counts.get('Technology', 0)
-                        biz_count = type_counts.get('Business', 0)
-                        domain_count = type_counts.get('Domain', 0)
-                        
-                        if tech_count > biz_count and tech_count > domain_count:
-                            st.write("⚠️ More Technology founders looking")
-                            st.write("💡 Great opportunity for Business/Domain founders!")
-                        elif biz_count > tech_count and biz_count > domain_count:
-                            st.write("⚠️ More Business founders looking") 
-                            st.write("💡 Great opportunity for Technology/Domain founders!")
-                        elif domain_count > tech_count and domain_count > biz_count:
-                            st.write("⚠️ More Domain founders looking")
-                            st.write("💡 Great opportunity for Technology/Business founders!")
-                        else:
-                            st.write("✅ Balanced availability!")
-                            st.write("🤝 Good matching potential")
-                    
-                    with col3:
-                        st.markdown("**💼 Total Available:**")
-                        st.metric("Total Available", f"{total_looking} founders", help="Total founders looking for cofounders")
-                        if total_looking > 0:
-                            cohort_percentage = (total_looking / len(filtered_df) * 100) if len(filtered_df) > 0 else 0
-                            st.write(f"({cohort_percentage:.1f}% of cohort)")
-                else:
-                    st.info("No cofounder type data available for candidates looking for cofounders")
-            else:
-                st.info("No founders currently looking for cofounders with the applied filters")
-        else:
-            st.info("Status or cofounder type information not available")
-        
-    
-    with tab2:
-        st.subheader("👥 Candidate Profiles")
-        
-        # Add lunch mode checkbox and search in the same row
-        col_search, col_checkbox = st.columns([3, 1])
-        
-        with col_search:
-            # Search box with placeholder text that changes based on lunch mode
-            search_placeholder = "🔍 Search by name or skills"
-            search_term = st.text_input("Search", "", placeholder=search_placeholder, label_visibility="collapsed")
-        
-        with col_checkbox:
-            lunch_mode = st.checkbox("🍽️ Lunch Mode", help="Enable to search for multiple people at once and see expanded profiles. Perfect for lunch meetings!")
-        
-        # Filter candidates based on search
-        display_df = filtered_df.copy()
-        
-        if search_term:
-            if lunch_mode:
-                # In lunch mode, split the search term by spaces and search for each name
-                # This allows pasting multiple names at once
-                names = search_term.replace(',', ' ').split()
-                
-                # Create a mask for any name that matches
-                mask = pd.Series([False] * len(display_df))
-                for name in names:
-                    if name.strip():  # Skip empty strings
-                        name_mask = display_df['name'].str.contains(name.strip(), case=False, na=False)
-                        mask = mask | name_mask
-                
-                display_df = display_df[mask]
-            else:
-                # Normal search mode - search in name and skills
-                mask = display_df['name'].str.contains(search_term, case=False, na=False)
-                if 'skills' in display_df.columns:
-                    skills_mask = display_df['skills'].apply(
-                        lambda x: any(search_term.lower() in str(skill).lower() for skill in x) if isinstance(x, list) else False
-                    )
-                    mask = mask | skills_mask
-                display_df = display_df[mask]
-        
-        # Display candidates in a grid
-        st.write(f"Showing {len(display_df)} candidates")
-        
-        # Different display modes for lunch mode vs normal mode
-        if lunch_mode and len(display_df) > 0:
-            # Lunch mode: Show expanded profiles in a vertical list
-            st.markdown("### 🍽️ Lunch Group Profiles")
-            
-            for idx, candidate in display_df.iterrows():
-                # Create an expander for each person with more information
-                with st.container():
-                    # Create a card-like container with more info
-                    col_main, col_details = st.columns([1, 2])
-                    
-                    with col_main:
-                        # Profile section
-                        if 'avatar_url' in candidate and pd.notna(candidate['avatar_url']) and candidate['avatar_url']:
-                            st.markdown(
-                                f'<img src="{candidate["avatar_url"]}" style="border-radius: 50%; width: 100px; height: 100px; object-fit: cover;">',
-                                unsafe_allow_html=True
-                            )
-                        else:
-                            st.markdown(
-                                '<div style="width: 100px; height: 100px; border-radius: 50%; background-color: #f0f0f0; display: flex; align-items: center; justify-content: center; font-size: 48px;">👤</div>',
-                                unsafe_allow_html=True
-                            )
-                        
-                        st.markdown(f"### {candidate.get('name', 'Unknown')}")
-                        
-                        # Status
-                        if 'status' in candidate:
-                            status_color = "🟢" if candidate['status'] == 'Looking for co-founder' else "🔵"
-                            st.markdown(f"{status_color} **{candidate['status']}**")
-                        
-                        # Location
-                        if 'location' in candidate:
-                            st.markdown(f"📍 **Location:** {candidate.get('location', 'N/A')}")
-                    
-                    with col_details:
-                        # Cofounder type
-                        effective_types = get_effective_type(candidate)
-                        if effective_types and len(effective_types) > 0:
-                            type_emojis = {
-                                'Technology': '💻',
-                                'Business': '💼', 
-                                'Domain': '🎯'
-                            }
-                            type_texts = []
-                            for atype in effective_types:
-                                emoji = type_emojis.get(atype, '🏷️')
-                                type_texts.append(f"{emoji} {atype}")
-                            st.markdown(f"**Type:** {' | '.join(type_texts)}")
-                        
-                        # Tagline
-                        if 'tagline' in candidate and pd.notna(candidate['tagline']):
-                            st.markdown(f"**Tagline:** *{candidate['tagline']}*")
-                        
-                        # Bio/Description if available
-                        if 'bio' in candidate and pd.notna(candidate['bio']):
-                            st.markdown(f"**About:** {candidate['bio']}")
-                        elif 'description' in candidate and pd.notna(candidate['description']):
-                            st.markdown(f"**About:** {candidate['description']}")
-                        
-                        # Skills
-                        if 'skills' in candidate and isinstance(candidate['skills'], list) and len(candidate['skills']) > 0:
-                            st.markdown("**Skills:**")
-                            skills_html = ""
-                            for skill in candidate['skills'][:10]:  # Limit to 10 skills for readability
-                                skills_html += f'<span style="display: inline-block; background-color: #e8f4f8; color: #1f77b4; padding: 4px 10px; margin: 3px; border-radius: 15px; font-size: 14px; border: 1px solid #d0e8f2;">{skill}</span>'
-                            st.markdown(skills_html, unsafe_allow_html=True)
-                        
-                        # LinkedIn if available
-                        if 'linkedin' in candidate and pd.notna(candidate['linkedin']):
-                            st.markdown(f"🔗 [LinkedIn Profile]({candidate['linkedin']})")
-                        
-                        # Email if available  
-                        if 'email' in candidate and pd.notna(candidate['email']):
-                            st.markdown(f"✉️ **Email:** {candidate['email']}")
-                        
-                        # Categories if available
-                        if 'categories' in candidate and isinstance(candidate['categories'], list) and len(candidate['categories']) > 0:
-                            st.markdown(f"**Industries:** {', '.join(candidate['categories'][:5])}")
-                    
-                    st.markdown("---")
-        
-        else:
-            # Normal mode: Display in grid as before
-            # Create columns for candidate cards
-            num_cols = 3
-            for i in range(0, len(display_df), num_cols):
-                cols = st.columns(num_cols)
-                for j, col in enumerate(cols):
-                    if i + j < len(display_df):
-                        candidate = display_df.iloc[i + j]
-                        with col:
-                            # Enhanced card styling with circular profile picture
-                            st.markdown(
-                                """
-                                <style>
-                                .candidate-card {
-                                    background: white;
-                                    padding: 1rem;
-                                    border-radius: 10px;
-                                    border: 1px solid #e0e0e0;
-                                    margin-bottom: 1rem;
-                                }
-                                .profile-pic {
-                                    border-radius: 50%;
-                                    width: 60px;
-                                    height: 60px;
-                                    object-fit: cover;
-                                }
-                                </style>
-                                """,
-                                unsafe_allow_html=True
-                            )
-                            
-                            with st.container():
-                                # Profile picture and name in horizontal layout
-                                col_avatar, col_info = st.columns([1, 4])
-                                
-                                with col_avatar:
-                                    if 'avatar_url' in candidate and pd.notna(candidate['avatar_url']) and candidate['avatar_url']:
-                                        st.markdown(
-                                            f'<img src="{candidate["avatar_url"]}" class="profile-pic">',
-                                            unsafe_allow_html=True
-                                        )
-                                    else:
-                                        st.markdown(
-                                            '<div style="width: 60px; height: 60px; border-radius: 50%; background-color: #f0f0f0; display: flex; align-items: center; justify-content: center; font-size: 24px;">👤</div>',
-                                            unsafe_allow_html=True
-                                        )
-                                
-                                with col_info:
-                                    st.markdown(f"**{candidate.get('name', 'Unknown')}**")
-                                
-                                # Status and founder type on the same line
-                                status_founder_line = ""
-                                if 'status' in candidate:
-                                    status_color = "🟢" if candidate['status'] == 'Looking for co-founder' else "🔵"
-                                    status_founder_line = f"{status_color} {candidate['status']}"
-                                
-                                # Use effective cofounder type (with fallback logic)
-                                effective_types = get_effective_type(candidate)
-                                if effective_types and len(effective_types) > 0:
-                                    # Handle array of cofounder types
-                                    type_emojis = {
-                                        'Technology': '💻',
-                                        'Business': '💼', 
-                                        'Domain': '🎯'
-                                    }
-                                    type_texts = []
-                                    for atype in effective_types:
-                                        emoji = type_emojis.get(atype, '🏷️')
-                                        type_texts.append(f"{emoji} {atype}")
-                                    
-                                    type_text = " | ".join(type_texts)
-                                    if status_founder_line:
-                                        status_founder_line += f" | {type_text}"
-                                    else:
-                                        status_founder_line = type_text
-                                
-                                if status_founder_line:
-                                    st.markdown(status_founder_line)
-                                
-                                if 'location' in candidate:
-                                    st.markdown(f"📍 {candidate.get('location', 'N/A')}")
-                                
-                                if 'tagline' in candidate and pd.notna(candidate['tagline']):
-                                    st.markdown(f"*{candidate['tagline']}*")
-                                
-                                if 'skills' in candidate and isinstance(candidate['skills'], list):
-                                    # Create skills badges
-                                    skills_html = ""
-                                    for skill in candidate['skills']:
-                                        skills_html += f'<span style="display: inline-block; background-color: #e8f4f8; color: #1f77b4; padding: 2px 8px; margin: 2px; border-radius: 12px; font-size: 12px; border: 1px solid #d0e8f2;">{skill}</span>'
-                                    st.markdown(skills_html, unsafe_allow_html=True)
-                                
-                                st.markdown("---")
-    
-    with tab3:
-        st.subheader("🎯 Skills Analysis")
-        
-        if 'skills' in df.columns:
-            # Extract all skills
-            all_skills = []
-            for skills in filtered_df['skills'].dropna():
-                if isinstance(skills, list):
-                    all_skills.extend(skills)
-            
-            if all_skills:
-                # Count skills
-                skill_counts = Counter(all_skills)
-                top_skills = dict(skill_counts.most_common(15))
-                
-                # Create bar chart for top skills
-                fig_skills = px.bar(
-                    x=list(top_skills.values()),
-                    y=list(top_skills.keys()),
-                    orientation='h',
-                    labels={'x': 'Number of Candidates', 'y': 'Skill'},
-                    title="Top 15 Skills in the Cohort",
-                    color=list(top_skills.values()),
-                    color_continuous_scale='Teal',
-                    text=list(top_skills.values())
-                )
-                fig_skills.update_traces(texttemplate='%{text}', textposition='outside')
-                fig_skills.update_layout(showlegend=False, height=500)
-                st.plotly_chart(fig_skills, use_container_width=True)
-                
-                # Skills by status
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    if 'status' in df.columns:
-                        st.markdown("#### Skills Distribution by Status")
-                        looking_df = filtered_df[filtered_df['status'] == 'Looking for co-founder']
-                        team_df = filtered_df[filtered_df['status'] == 'In a team']
-                        
-                        looking_skills = []
-                        for skills in looking_df['skills'].dropna():
-                            if isinstance(skills, list):
-                                looking_skills.extend(skills)
-                        
-                        team_skills = []
-                        for skills in team_df['skills'].dropna():
-                            if isinstance(skills, list):
-                                team_skills.extend(skills)
-                        
-                        if looking_skills:
-                            st.markdown("**Top skills among those looking:**")
-                            looking_top = Counter(looking_skills).most_common(5)
-                            for skill, count in looking_top:
-                                st.write(f"- {skill}: {count}")
-                        
-                        if team_skills:
-                            st.markdown("**Top skills among those in teams:**")
-                            team_top = Counter(team_skills).most_common(5)
-                            for skill, count in team_top:
-                                st.write(f"- {skill}: {count}")
-                
-                with col2:
-                    # Skill categories distribution
-                    if 'categories' in df.columns:
-                        st.markdown("#### Category Distribution")
-                        all_categories = []
-                        for cats in filtered_df['categories'].dropna():
-                            if isinstance(cats, list):
-                                all_categories.extend(cats)
-                        
-                        if all_categories:
-                            cat_counts = Counter(all_categories)
-                            fig_cats = px.pie(
-                                values=list(cat_counts.values()),
-                                names=list(cat_counts.keys()),
-                                title="Domain Categories"
-                            )
-                            st.plotly_chart(fig_cats, use_container_width=True)
-        else:
-            st.info("Skills information not available")
+    # Tab-style navigation: unlike st.tabs, only the selected view is rendered,
+    # so hidden views build no figures and send nothing to the browser
+    # Views whose source column has no data at all are left out of the navigation
+    available_columns = df.attrs['available_columns']
+    tab_labels = [
+        label for label in TAB_LABELS
+        if label not in TAB_REQUIRED_COLUMNS or TAB_REQUIRED_COLUMNS[label] in available_columns
+    ]
+    if st.session_state.get('active_tab') not in tab_labels:
+        st.session_state.pop('active_tab', None)
+    active_tab = st.radio("View", tab_labels, horizontal=True, label_visibility="collapsed", key="active_tab")
     
-    with tab4:
-        st.subheader("📍 Location Insights")
-        
-        if 'location' in df.columns:
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                # Location by status
-                if 'status' in df.columns:
-                    st.markdown("#### Team Formation by Location")
-                    location_status = filtered_df.groupby(['location', 'status']).size().reset_index(name='count')
-                    
-                    # Get top 10 locations
-                    top_locations = filtered_df['location'].value_counts().head(10).index
-                    location_status_filtered = location_status[location_status['location'].isin(top_locations)]
-                    
-                    fig_location_status = px.bar(
-                        location_status_filtered,
-                        x='location',
-                        y='count',
-                        color='status',
-                        title="Status Distribution by Location",
-                        color_discrete_map={
-                            'Looking for co-founder': '#10B981',
-                            'In a team': '#3B82F6'
-                        }
-                    )
-                    fig_location_status.update_layout(height=400)
-                    st.plotly_chart(fig_location_status, use_container_width=True)
-            
-            with col2:
-                # Location concentration
-                st.markdown("#### Geographic Concentration")
-                location_counts = filtered_df['location'].value_counts()
-                
-                # Calculate concentration metrics
-                top_3_concentration = (location_counts.head(3).sum() / location_counts.sum() * 100) if len(location_counts) > 0 else 0
-                st.metric("Top 3 Cities Concentration", f"{top_3_concentration:.1f}%")
-                
-                # Show location distribution table
-                st.markdown("**Candidate Distribution:**")
-                location_table = pd.DataFrame({
-                    'Location': location_counts.index[:10],
-                    'Count': location_counts.values[:10],
-                    'Percentage': (location_counts.values[:10] / location_counts.sum() * 100).round(1)
-                })
-                st.dataframe(location_table, hide_index=True, use_container_width=True)
-        else:
-            st.info("Location information not available")
+    if active_tab == TAB_LABELS[0]:
+        render_overview_tab(filtered_df, selected_status, selected_antler_type, selected_location)
+    elif active_tab == TAB_LABELS[1]:
+        render_candidates_tab(filtered_df)
+    elif active_tab == TAB_LABELS[2]:
+        render_skills_tab(filtered_df, selected_status, selected_antler_type, selected_location)
+    elif active_tab == TAB_LABELS[3]:
+        render_location_tab(filtered_df, selected_status, selected_antler_type, selected_location)
     
     # Footer
     st.markdown("---")
@@ -6,106 +6,779 @@ Analyzes tagline, about_me, skills, and categories fields to determine founder t
 
 import os
 import json
-from pymongo import MongoClient
+import asyncio
+import argparse
+import time
+import hashlib
+import importlib.util
+from itertools import islice
+from pymongo import MongoClient, UpdateOne
+from pymongo.errors import BulkWriteError
 from dotenv import load_dotenv
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
-import time
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 
 # Load environment variables
 load_dotenv()
 
+# Maximum number of OpenAI requests in flight at once
+MAX_CONCURRENCY = 20
+
+# OpenAI HTTP connection pool, reused for every request in the run
+HTTP_MAX_CONNECTIONS = 100
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 50
+OPENAI_TIMEOUT = 60.0
+
+# Default OpenAI rate limits (override with --max-requests-per-minute / --max-tokens-per-minute)
+MAX_REQUESTS_PER_MINUTE = 500
+MAX_TOKENS_PER_MINUTE = 200000
+
+# Completion token budget per request, counted against the token bucket
+MAX_COMPLETION_TOKENS = 10
+
+# Structured Outputs schemas: the model can only answer with one of FOUNDER_TYPES
+FOUNDER_TYPES = ['technical', 'business']
+
+SINGLE_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "founder_type",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {"t": {"type": "string", "enum": FOUNDER_TYPES}},
+            "required": ["t"],
+            "additionalProperties": False
+        }
+    }
+}
+
+GROUP_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "founder_types",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "results": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "i": {"type": "integer"},
+                            "t": {"type": "string", "enum": FOUNDER_TYPES}
+                        },
+                        "required": ["i", "t"],
+                        "additionalProperties": False
+                    }
+                }
+            },
+            "required": ["results"],
+            "additionalProperties": False
+        }
+    }
+}
+
+# Retry schedule for rate-limited requests: 0.5s, 1s, 2s, 4s
+MAX_RETRIES = 4
+RETRY_BASE_DELAY = 0.5
+
+# Founders packed into one live chat completion (override with --group-size)
+FOUNDERS_PER_REQUEST = 20
+
+# Completion tokens budgeted per founder in a grouped JSON response
+GROUP_TOKENS_PER_FOUNDER = 16
+
+# Static instructions live in the system message so every request shares a
+# byte-identical prefix, which OpenAI's automatic prompt caching can reuse
+CLASSIFICATION_CRITERIA = """You are an expert at analyzing founder profiles to determine if they are primarily technical or business-oriented founders.
+
+Technical founders typically have:
+- Software development, engineering, or data science skills
+- Experience building products, coding, or system architecture
+- Technical degrees or certifications
+- Focus on product development, algorithms, or technical solutions
+
+Business founders typically have:
+- Marketing, sales, strategy, or finance skills
+- Experience in business development, operations, or management
+- Business degrees (MBA, etc.) or business-focused backgrounds
+- Focus on growth, partnerships, revenue, or business model
+
+Consider their skills, background, and focus areas."""
+
+SYSTEM_PROMPT = CLASSIFICATION_CRITERIA + """
+
+The user message contains one founder profile. Classify this founder as either 'technical' or 'business'.
+
+Return ONLY a JSON object of the form {"t": "technical"} or {"t": "business"}."""
+
+GROUP_SYSTEM_PROMPT = CLASSIFICATION_CRITERIA + """
+
+The user message contains several numbered founder profiles. Classify every founder as either 'technical' or 'business'.
+
+Return ONLY a JSON object of the form {"results": [{"i": 0, "t": "technical"}, {"i": 1, "t": "business"}]}
+with one entry per founder, where "i" is the founder number and "t" is either 'technical' or 'business'."""
+
+# Per-founder profile block of the user message, always in the same field order
+PROFILE_TEMPLATE = """
+Name: {name}
+Tagline: {tagline}
+About: {about_me}
+Skills: {skills}
+Categories: {categories}
+"""
+
+# Local cache of classifications keyed by profile hash (disable with --no-cache)
+CACHE_FILE = '.founder_classify_cache.json'
+
+# Prompt input caps: classification only needs the opening of long profile fields
+MAX_TAGLINE_CHARS = 200
+MAX_ABOUT_CHARS = 800
+MAX_LIST_ITEMS = 30
+
+# Fields read by the classifier; everything else stays on the server
+PROFILE_PROJECTION = {"_id": 1, "name": 1, "tagline": 1, "about_me": 1, "skills": 1, "categories": 1}
+
+# Documents fetched per cursor round-trip
+CURSOR_BATCH_SIZE = 200
+
+# Founders pulled from the cursor and classified per pass in live mode
+CLASSIFY_CHUNK_SIZE = 1000
+
+# Database updates sent per bulk_write round-trip
+BULK_WRITE_SIZE = 500
+
+# Seconds between status checks when running through the Batch API (--batch)
+BATCH_POLL_INTERVAL = 30
+BATCH_TERMINAL_STATUSES = ('completed', 'failed', 'expired', 'cancelled')
+
 def setup_openai():
-    """Initialize OpenAI client"""
+    """Initialize async OpenAI client on a shared keep-alive connection pool"""
     api_key = os.getenv('OPENAI_API_KEY')
     if not api_key:
         raise ValueError("OPENAI_API_KEY not found in .env file")
     
-    from openai import OpenAI
-    return OpenAI(api_key=api_key)
+    import httpx
+    from openai import AsyncOpenAI
+    
+    # HTTP/2 multiplexes concurrent requests over one connection; it needs the
+    # optional 'h2' package (pip install httpx[http2]), otherwise use HTTP/1.1
+    http_client = httpx.AsyncClient(
+        http2=importlib.util.find_spec('h2') is not None,
+        limits=httpx.Limits(max_connections=HTTP_MAX_CONNECTIONS,
+                            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS),
+        timeout=OPENAI_TIMEOUT
+    )
+    return AsyncOpenAI(api_key=api_key, http_client=http_client)
 
-def classify_founder(founder_data: Dict, client) -> str:
+class RateLimiter:
+    """Token-bucket throttle for OpenAI requests-per-minute and tokens-per-minute limits"""
+    
+    def __init__(self, max_requests_per_minute: float, max_tokens_per_minute: float):
+        self.max_requests_per_minute = max_requests_per_minute
+        self.max_tokens_per_minute = max_tokens_per_minute
+        self.available_request_capacity = max_requests_per_minute
+        self.available_token_capacity = max_tokens_per_minute
+        self.last_update = time.monotonic()
+    
+    def _refill(self):
+        """Add capacity for the time elapsed since the last refill"""
+        now = time.monotonic()
+        elapsed = now - self.last_update
+        self.last_update = now
+        self.available_request_capacity = min(
+            self.max_requests_per_minute,
+            self.available_request_capacity + elapsed * self.max_requests_per_minute / 60
+        )
+        self.available_token_capacity = min(
+            self.max_tokens_per_minute,
+            self.available_token_capacity + elapsed * self.max_tokens_per_minute / 60
+        )
+    
+    async def acquire(self, tokens: int):
+        """
+        Wait until both buckets have room for one request of the given size
+        
+        Args:
+            tokens: Estimated total tokens (prompt + completion) of the request
+        """
+        tokens = min(tokens, self.max_tokens_per_minute)
+        while True:
+            self._refill()
+            if self.available_request_capacity >= 1 and self.available_token_capacity >= tokens:
+                self.available_request_capacity -= 1
+                self.available_token_capacity -= tokens
+                return
+            await asyncio.sleep(0.05)
+
+def text_list(value) -> List[str]:
     """
-    Classify a founder as 'technical' or 'business' using OpenAI
+    Coerce a skills/categories field to a list of strings
+    
+    Args:
+        value: Field value from the founder document (normally a list of strings)
+        
+    Returns:
+        Non-empty items as strings, so one malformed entry can't break prompt building
+    """
+    if isinstance(value, str):
+        value = [value]
+    elif not isinstance(value, (list, tuple)):
+        return []
+    return [str(item) for item in value if item is not None and item != '']
+
+def extract_profile(founder_data: Dict) -> Dict:
+    """
+    Extract the classification-relevant fields of a founder, trimmed to bound prompt size
+    
+    The opening of the free-text fields carries enough signal to classify a founder,
+    so long taglines/bios and skill/category lists are cut off rather than sent verbatim.
     
     Args:
         founder_data: Dictionary containing founder information
-        client: OpenAI client
         
     Returns:
-        'technical' or 'business'
+        Dictionary with name, tagline, about_me, skills and categories
     """
-    # Extract relevant fields
-    name = founder_data.get('name', 'Unknown')
-    tagline = founder_data.get('tagline', '')
-    about_me = founder_data.get('about_me', '')
-    skills = founder_data.get('skills', [])
-    categories = founder_data.get('categories', [])
+    return {
+        "name": str(founder_data.get('name', 'Unknown')),
+        "tagline": str(founder_data.get('tagline') or '')[:MAX_TAGLINE_CHARS],
+        "about_me": str(founder_data.get('about_me') or '')[:MAX_ABOUT_CHARS],
+        "skills": text_list(founder_data.get('skills'))[:MAX_LIST_ITEMS],
+        "categories": text_list(founder_data.get('categories'))[:MAX_LIST_ITEMS],
+    }
+
+def build_profile_text(founder_data: Dict) -> str:
+    """
+    Summarize the classification-relevant fields of a founder
     
-    # Create a profile summary for the LLM
-    profile_text = f"""
-    Name: {name}
-    Tagline: {tagline}
-    About: {about_me}
-    Skills: {', '.join(skills) if skills else 'None listed'}
-    Categories: {', '.join(categories) if categories else 'None listed'}
+    Args:
+        founder_data: Dictionary containing founder information
+        
+    Returns:
+        Profile summary for the LLM
     """
+    profile = extract_profile(founder_data)
+    return PROFILE_TEMPLATE.format_map({
+        **profile,
+        "skills": ', '.join(profile['skills']) or 'None listed',
+        "categories": ', '.join(profile['categories']) or 'None listed',
+    })
+
+def profile_cache_key(founder_data: Dict) -> str:
+    """
+    Hash the classification-relevant fields of a founder
     
-    # Create the prompt for classification
-    prompt = f"""You are an expert at analyzing founder profiles to determine if they are primarily technical or business-oriented founders.
+    Args:
+        founder_data: Dictionary containing founder information
+        
+    Returns:
+        SHA-256 hex digest that changes whenever the prompt input would change
+    """
+    fields = extract_profile(founder_data)
+    profile = {
+        "n": fields['name'],
+        "t": fields['tagline'],
+        "a": fields['about_me'],
+        # Prompt order, so the key only matches when the prompt text would match
+        "s": fields['skills'],
+        "c": fields['categories'],
+    }
+    return hashlib.sha256(json.dumps(profile, sort_keys=True).encode('utf-8')).hexdigest()
 
-Analyze the following founder profile and classify them as either 'technical' or 'business'.
+def load_cache(path: str = CACHE_FILE) -> Dict[str, str]:
+    """Load cached classifications, or an empty cache if the file is missing or unreadable"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict):
+        return {}
+    # Only trust entries that are a valid classification
+    return {key: value for key, value in cache.items() if value in FOUNDER_TYPES}
 
-Technical founders typically have:
-- Software development, engineering, or data science skills
-- Experience building products, coding, or system architecture
-- Technical degrees or certifications
-- Focus on product development, algorithms, or technical solutions
+def save_cache(cache: Dict[str, str], path: str = CACHE_FILE):
+    """Write cached classifications atomically"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(cache, f)
+    os.replace(tmp_path, path)
 
-Business founders typically have:
-- Marketing, sales, strategy, or finance skills
-- Experience in business development, operations, or management
-- Business degrees (MBA, etc.) or business-focused backgrounds
-- Focus on growth, partnerships, revenue, or business model
+def build_prompt(founder_data: Dict) -> str:
+    """
+    Build the user message for classifying a single founder
+    
+    Args:
+        founder_data: Dictionary containing founder information
+        
+    Returns:
+        Profile text for the user message
+    """
+    return f"Profile to analyze:{build_profile_text(founder_data)}"
 
-Profile to analyze:
-{profile_text}
+def build_group_prompt(founders: List[Dict]) -> str:
+    """
+    Build the user message for classifying several founders in one request
+    
+    Args:
+        founders: List of founder documents, numbered by position in the prompt
+        
+    Returns:
+        Numbered profile texts for the user message
+    """
+    return "Profiles to analyze:\n" + "\n".join(
+        f"Founder {i}:{build_profile_text(founder)}" for i, founder in enumerate(founders)
+    )
 
-Based on this profile, classify this founder as either 'technical' or 'business'.
-Consider their skills, background, and focus areas.
+def build_chat_request(prompt: str, system_prompt: str = SYSTEM_PROMPT,
+                       max_tokens: int = MAX_COMPLETION_TOKENS,
+                       response_format: Dict = SINGLE_RESPONSE_FORMAT) -> Dict:
+    """
+    Build the chat completion request body shared by live and batch classification
+    
+    Args:
+        prompt: User message from build_prompt or build_group_prompt
+        system_prompt: Static classification instructions
+        max_tokens: Completion token limit
+        response_format: Structured Outputs schema constraining the answer
+        
+    Returns:
+        Keyword arguments for client.chat.completions.create
+    """
+    return {
+        "model": "gpt-4o-mini",  # Using GPT-4o-mini for better accuracy
+        "messages": [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": prompt}
+        ],
+        "temperature": 0.1,  # Low temperature for consistent classification
+        "max_tokens": max_tokens,  # We only need one short answer per founder
+        "response_format": response_format,
+    }
 
-Return ONLY one word: either 'technical' or 'business'.
-"""
+def parse_classification(content: str, name: str) -> str:
+    """
+    Normalize a model response to 'technical' or 'business'
+    
+    Args:
+        content: Raw message content returned by the model
+        name: Founder name, used in the warning message
+        
+    Returns:
+        'technical' or 'business'
+    """
+    classification = (content or '').strip().lower()
+    
+    # Validate the response
+    if classification not in FOUNDER_TYPES:
+        print(f"Warning: Unexpected classification '{classification}' for {name}, defaulting to 'business'")
+        classification = 'business'
+    
+    return classification
 
+async def request_completion(request: Dict, estimated_tokens: int, client, sem: asyncio.Semaphore,
+                             limiter: RateLimiter) -> str:
+    """
+    Send one chat completion within the rate limits, retrying with backoff on 429s
+    
+    Args:
+        request: Request body from build_chat_request
+        estimated_tokens: Estimated prompt + completion tokens, charged to the rate limiter
+        client: AsyncOpenAI client
+        sem: Semaphore bounding the number of concurrent requests
+        limiter: Rate limiter shared by all requests
+        
+    Returns:
+        Message content of the response
+    """
+    from openai import RateLimitError
+    
+    for attempt in range(MAX_RETRIES + 1):
+        await limiter.acquire(estimated_tokens)
+        try:
+            # Use OpenAI Chat Completion with Structured Outputs
+            async with sem:
+                response = await client.chat.completions.create(**request)
+            return response.choices[0].message.content
+        except RateLimitError:
+            if attempt == MAX_RETRIES:
+                raise
+            # Exponential backoff before retrying
+            await asyncio.sleep(RETRY_BASE_DELAY * 2 ** attempt)
+
+async def classify_founder(founder_data: Dict, client, sem: asyncio.Semaphore, limiter: RateLimiter) -> Optional[str]:
+    """
+    Classify a single founder as 'technical' or 'business' in its own OpenAI request
+    
+    Args:
+        founder_data: Founder document
+        client: AsyncOpenAI client
+        sem: Semaphore bounding the number of concurrent requests
+        limiter: Rate limiter shared by all requests
+        
+    Returns:
+        'technical' or 'business', or None if the request failed
+    """
+    name = founder_data.get('name', 'Unknown')
     try:
-        # Use OpenAI Chat Completion
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",  # Using GPT-4o-mini for better accuracy
-            messages=[
-                {"role": "system", "content": "You are an expert at classifying founder types based on their profiles."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.1,  # Low temperature for consistent classification
-            max_tokens=10,  # We only need one word
-        )
+        prompt = build_prompt(founder_data)
+        # Rough token estimate (~4 characters per token) for the rate limiter
+        estimated_tokens = (len(SYSTEM_PROMPT) + len(prompt)) // 4 + MAX_COMPLETION_TOKENS
+        content = await request_completion(build_chat_request(prompt), estimated_tokens, client, sem, limiter)
+        return parse_classification(json.loads(content)["t"], name)
+    except Exception as e:
+        print(f"Error classifying {name}: {e}")
+        return None
+
+async def classify_founder_group(founders: List[Dict], client, sem: asyncio.Semaphore, limiter: RateLimiter) -> List[Optional[str]]:
+    """
+    Classify several founders as 'technical' or 'business' in one OpenAI request
+    
+    Founders the grouped request fails to classify are retried one at a time,
+    so a bad response only costs extra requests, not wrong labels.
+    
+    Args:
+        founders: List of founder documents
+        client: AsyncOpenAI client
+        sem: Semaphore bounding the number of concurrent requests
+        limiter: Rate limiter shared by all requests
         
-        # Extract and clean the response
-        classification = response.choices[0].message.content.strip().lower()
+    Returns:
+        List of classifications in the same order as founders (None where even the retry failed)
+    """
+    max_tokens = GROUP_TOKENS_PER_FOUNDER * len(founders) + MAX_COMPLETION_TOKENS
+    
+    try:
+        prompt = build_group_prompt(founders)
         
-        # Validate the response
-        if classification not in ['technical', 'business']:
-            print(f"Warning: Unexpected classification '{classification}' for {name}, defaulting to 'business'")
-            classification = 'business'
+        # Rough token estimate (~4 characters per token) for the rate limiter
+        estimated_tokens = (len(GROUP_SYSTEM_PROMPT) + len(prompt)) // 4 + max_tokens
         
-        return classification
+        content = await request_completion(
+            build_chat_request(prompt, GROUP_SYSTEM_PROMPT, max_tokens, GROUP_RESPONSE_FORMAT),
+            estimated_tokens, client, sem, limiter
+        )
+        results = json.loads(content).get("results", [])
+        by_index = {r.get("i"): r.get("t") for r in results if isinstance(r, dict)}
         
     except Exception as e:
-        print(f"Error classifying {name}: {e}")
-        # Default to business if there's an error
-        return 'business'
+        print(f"Error classifying group of {len(founders)} founders: {e}")
+        by_index = {}
+    
+    founder_types = []
+    for i, founder in enumerate(founders):
+        if i in by_index:
+            founder_types.append(parse_classification(by_index[i], founder.get('name', 'Unknown')))
+        else:
+            founder_types.append(None)
+    
+    # Retry whoever the grouped request left out on their own (a group of one was already a single request)
+    missing = [i for i, founder_type in enumerate(founder_types) if founder_type is None]
+    if missing and len(founders) > 1:
+        print(f"Retrying {len(missing)} founders missing from the grouped response one at a time")
+        retried = await asyncio.gather(*(classify_founder(founders[i], client, sem, limiter) for i in missing))
+        for i, founder_type in zip(missing, retried):
+            founder_types[i] = founder_type
+    return founder_types
+
+async def classify_founders(founders: List[Dict], client,
+                            max_requests_per_minute: float = MAX_REQUESTS_PER_MINUTE,
+                            max_tokens_per_minute: float = MAX_TOKENS_PER_MINUTE,
+                            group_size: int = FOUNDERS_PER_REQUEST) -> AsyncIterator[Tuple[int, Optional[str]]]:
+    """
+    Classify founders concurrently within the OpenAI rate limits
+    
+    Args:
+        founders: List of founder documents
+        client: AsyncOpenAI client
+        max_requests_per_minute: Request budget per minute
+        max_tokens_per_minute: Token budget per minute
+        group_size: Number of founders packed into each request
+        
+    Yields:
+        (index into founders, classification or None if the request failed),
+        as each request completes
+    """
+    sem = asyncio.Semaphore(MAX_CONCURRENCY)
+    limiter = RateLimiter(max_requests_per_minute, max_tokens_per_minute)
+    
+    async def classify_group_at(start: int) -> Tuple[int, List[Optional[str]]]:
+        group = founders[start:start + group_size]
+        return start, await classify_founder_group(group, client, sem, limiter)
+    
+    tasks = [
+        asyncio.create_task(classify_group_at(start))
+        for start in range(0, len(founders), group_size)
+    ]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            start, results = await next_done
+            for offset, founder_type in enumerate(results):
+                yield start + offset, founder_type
+    finally:
+        # Stop outstanding requests if the consumer bails out early
+        for task in tasks:
+            task.cancel()
+
+async def classify_founders_batch_api(founders: List[Dict], client) -> AsyncIterator[Tuple[int, Optional[str]]]:
+    """
+    Classify founders through the OpenAI Batch API (half price, up to 24h turnaround)
+    
+    Args:
+        founders: List of founder documents
+        client: AsyncOpenAI client
+        
+    Yields:
+        (index into founders, classification or None if the request failed),
+        once the whole batch has completed
+    """
+    # One JSONL request line per founder, keyed by its MongoDB _id
+    lines = [
+        json.dumps({
+            "custom_id": str(founder["_id"]),
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": build_chat_request(build_prompt(founder)),
+        })
+        for founder in founders
+    ]
+    batch_file = await client.files.create(
+        file=("founders.jsonl", "\n".join(lines).encode("utf-8")),
+        purpose="batch"
+    )
+    batch = await client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h"
+    )
+    print(f"Submitted batch {batch.id} with {len(lines)} requests")
+    
+    # Poll until the batch reaches a terminal state
+    while batch.status not in BATCH_TERMINAL_STATUSES:
+        await asyncio.sleep(BATCH_POLL_INTERVAL)
+        batch = await client.batches.retrieve(batch.id)
+        counts = batch.request_counts
+        if counts:
+            print(f"  Batch {batch.status}: {counts.completed}/{counts.total} done")
+    
+    if batch.status != 'completed':
+        raise RuntimeError(f"Batch {batch.id} ended with status '{batch.status}'")
+    
+    # Map each result line back to its founder by custom_id
+    results = {}
+    if batch.output_file_id:
+        output = await client.files.content(batch.output_file_id)
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            response = record.get("response") or {}
+            if response.get("status_code") != 200:
+                continue
+            content = response["body"]["choices"][0]["message"]["content"]
+            try:
+                results[record["custom_id"]] = json.loads(content)["t"]
+            except (TypeError, ValueError, KeyError):
+                continue
+    
+    for i, founder in enumerate(founders):
+        name = founder.get('name', 'Unknown')
+        content = results.get(str(founder["_id"]))
+        if content is None:
+            print(f"Error classifying {name}: no result in batch output")
+            yield i, None
+        else:
+            yield i, parse_classification(content, name)
+
+async def classify_pending(founders: List[Dict], client, use_batch: bool = False,
+                           cache: Optional[Dict[str, str]] = None,
+                           max_requests_per_minute: float = MAX_REQUESTS_PER_MINUTE,
+                           max_tokens_per_minute: float = MAX_TOKENS_PER_MINUTE,
+                           group_size: int = FOUNDERS_PER_REQUEST) -> AsyncIterator[Tuple[int, Optional[str]]]:
+    """
+    Classify founders, reusing cached results for profiles that have not changed
+    and sending each distinct profile only once
+    
+    Args:
+        founders: List of founder documents
+        client: AsyncOpenAI client
+        use_batch: Send uncached founders through the Batch API instead of live requests
+        cache: Local classification cache, read and updated in place (None to disable)
+        max_requests_per_minute: Request budget per minute (live requests only)
+        max_tokens_per_minute: Token budget per minute (live requests only)
+        group_size: Number of founders packed into each live request
+        
+    Yields:
+        (index into founders, classification or None if its request failed),
+        cached results first and the rest as their requests complete
+    """
+    keys = []
+    unreadable = []
+    for i, founder in enumerate(founders):
+        try:
+            keys.append(profile_cache_key(founder))
+        except Exception as e:
+            print(f"Error reading profile of {founder.get('name', 'Unknown')}: {e}")
+            keys.append(None)
+            unreadable.append(i)
+    
+    # Group uncached founders with byte-identical profiles so each is classified once
+    groups: Dict[str, List[int]] = {}
+    cached = []
+    for i, key in enumerate(keys):
+        if key is None:
+            continue
+        if cache is not None and key in cache:
+            cached.append(i)
+        else:
+            groups.setdefault(key, []).append(i)
+    pending_count = len(founders) - len(cached) - len(unreadable)
+    
+    if cached:
+        print(f"Reusing {len(cached)} cached classifications")
+    if len(groups) < pending_count:
+        print(f"Skipping {pending_count - len(groups)} duplicate profiles")
+    
+    for i in cached:
+        yield i, cache[keys[i]]
+    
+    # A profile that can't be read only falls back for that founder
+    for i in unreadable:
+        yield i, 'business'
+    
+    if not groups:
+        return
+    
+    group_keys = list(groups)
+    subset = [founders[groups[key][0]] for key in group_keys]
+    if use_batch:
+        # Classify all uncached founders in one Batch API job
+        results = classify_founders_batch_api(subset, client)
+    else:
+        # Classify all uncached founders concurrently, streaming results as they complete
+        results = classify_founders(
+            subset, client, max_requests_per_minute, max_tokens_per_minute, group_size
+        )
+    
+    try:
+        async for j, founder_type in results:
+            key = group_keys[j]
+            # Failed requests are neither cached nor stored, so the next run retries them
+            if cache is not None and founder_type is not None:
+                cache[key] = founder_type
+            for i in groups[key]:
+                yield i, founder_type
+    finally:
+        # Keep completed results even if the run is interrupted
+        if cache is not None:
+            save_cache(cache)
+
+def flush_updates(collection, pending_ops: List[UpdateOne]) -> int:
+    """
+    Send queued founder updates in one unordered bulk_write and clear the queue
+    
+    Args:
+        collection: MongoDB collection
+        pending_ops: Queued UpdateOne operations (emptied in place)
+        
+    Returns:
+        Number of documents modified
+    """
+    if not pending_ops:
+        return 0
+    try:
+        result = collection.bulk_write(pending_ops, ordered=False)
+        modified = result.modified_count
+    except BulkWriteError as e:
+        # Unordered writes keep going past failures; count what succeeded
+        print(f"  ✗ {len(e.details.get('writeErrors', []))} database updates failed")
+        modified = e.details.get('nModified', 0)
+    pending_ops.clear()
+    return modified
+
+async def classify_and_store(collection, query: Dict, client, args, total: int) -> Dict[str, int]:
+    """
+    Stream unclassified founders from MongoDB, classify them chunk by chunk and write the results
+    
+    Args:
+        collection: MongoDB collection
+        query: Filter selecting unclassified founders
+        client: AsyncOpenAI client
+        args: Parsed command line arguments
+        total: Number of unclassified founders, for progress output
+        
+    Returns:
+        Counts of 'technical', 'business', 'processed', 'updated' and 'failed' founders
+    """
+    cache = None if args.no_cache else load_cache()
+    cursor = collection.find(query, PROFILE_PROJECTION).batch_size(CURSOR_BATCH_SIZE)
+    # A Batch API run submits every founder as a single job
+    chunk_size = None if args.batch else CLASSIFY_CHUNK_SIZE
+    
+    counts = {"technical": 0, "business": 0, "processed": 0, "updated": 0, "failed": 0}
+    pending_ops = []
+    
+    try:
+        while True:
+            founders = list(islice(cursor, chunk_size))
+            if not founders:
+                break
+            
+            # Write and report each founder as soon as its classification arrives
+            async for i, founder_type in classify_pending(
+                founders, client, use_batch=args.batch, cache=cache,
+                max_requests_per_minute=args.max_requests_per_minute,
+                max_tokens_per_minute=args.max_tokens_per_minute,
+                group_size=max(1, args.group_size)
+            ):
+                founder = founders[i]
+                if founder_type is None:
+                    # Left unclassified in the database so the next run picks it up again
+                    counts["failed"] += 1
+                    print(f"\n  ✗ Could not classify {founder.get('name', 'Unknown')}, leaving it for the next run")
+                    continue
+                
+                counts["processed"] += 1
+                counts[founder_type] += 1
+                print(f"\n[{counts['processed']}/{total}] Classified: {founder.get('name', 'Unknown')}")
+                print(f"  → Classified as: {founder_type}")
+                
+                # Queue the database update
+                pending_ops.append(UpdateOne(
+                    {"_id": founder["_id"]},
+                    {
+                        "$set": {
+                            "founder_type": founder_type,
+                            "founder_type_classified_at": datetime.now(timezone.utc)
+                        }
+                    }
+                ))
+                if len(pending_ops) >= BULK_WRITE_SIZE:
+                    counts["updated"] += flush_updates(collection, pending_ops)
+    finally:
+        counts["updated"] += flush_updates(collection, pending_ops)
+        cursor.close()
+    
+    return counts
 
 def main():
     """Main function to classify all founders in the database"""
+    parser = argparse.ArgumentParser(description='Classify founders as technical or business using OpenAI')
+    parser.add_argument('--max-requests-per-minute', type=float, default=MAX_REQUESTS_PER_MINUTE,
+                        help=f'OpenAI requests per minute (default: {MAX_REQUESTS_PER_MINUTE})')
+    parser.add_argument('--max-tokens-per-minute', type=float, default=MAX_TOKENS_PER_MINUTE,
+                        help=f'OpenAI tokens per minute (default: {MAX_TOKENS_PER_MINUTE})')
+    parser.add_argument('--group-size', type=int, default=FOUNDERS_PER_REQUEST,
+                        help=f'Founders classified per live request (default: {FOUNDERS_PER_REQUEST})')
+    parser.add_argument('--batch', action='store_true',
+                        help='Use the OpenAI Batch API (50%% cheaper, results within 24h)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help=f'Ignore and do not update the local classification cache ({CACHE_FILE})')
+    
+    args = parser.parse_args()
     
     # Setup MongoDB connection
     mongo_uri = os.getenv('MONGO_URI')
@@ -124,21 +797,27 @@ def main():
     try:
         # Connect to MongoDB
         print("Connecting to MongoDB...")
-        mongo_client = MongoClient(mongo_uri)
+        # zlib wire compression shrinks the about_me-heavy cursor batches; the
+        # appname tags this script's connections in server logs and currentOp
+        mongo_client = MongoClient(
+            mongo_uri,
+            compressors='zlib',
+            zlibCompressionLevel=3,
+            serverSelectionTimeoutMS=10000,
+            appname='classify_founder_types'
+        )
         db = mongo_client['last-recruiter-mvp']
         collection = db['users']
         
         print(f"Connected to database: {db.name}")
         print(f"Working with collection: {collection.name}")
         
+        # Index founder_type so the unclassified lookup and distribution counts are index seeks
+        collection.create_index("founder_type")
+        
         # Get all documents that don't have founder_type yet or have null/empty values
-        query = {
-            "$or": [
-                {"founder_type": {"$exists": False}},
-                {"founder_type": None},
-                {"founder_type": ""}
-            ]
-        }
+        # (matching None also matches documents where the field is missing)
+        query = {"founder_type": {"$in": [None, ""]}}
         unclassified_count = collection.count_documents(query)
         
         if unclassified_count == 0:
@@ -162,51 +841,11 @@ def main():
         
         print("\nStarting classification...")
         
-        # Process each unclassified founder
-        founders = list(collection.find(query))
-        
-        technical_count = 0
-        business_count = 0
-        errors = 0
-        
-        for i, founder in enumerate(founders, 1):
-            try:
-                name = founder.get('name', 'Unknown')
-                print(f"\n[{i}/{unclassified_count}] Classifying: {name}")
-                
-                # Classify the founder
-                founder_type = classify_founder(founder, client)
-                
-                # Update the database
-                result = collection.update_one(
-                    {"_id": founder["_id"]},
-                    {
-                        "$set": {
-                            "founder_type": founder_type,
-                            "founder_type_classified_at": datetime.now(timezone.utc)
-                        }
-                    }
-                )
-                
-                if result.modified_count > 0:
-                    print(f"  → Classified as: {founder_type}")
-                    if founder_type == 'technical':
-                        technical_count += 1
-                    else:
-                        business_count += 1
-                else:
-                    print(f"  ✗ Failed to update database")
-                    errors += 1
-                
-                # Rate limiting to avoid hitting API limits
-                # OpenAI has rate limits, so we add a small delay
-                if i < unclassified_count:
-                    time.sleep(0.5)  # 500ms delay between requests
-                    
-            except Exception as e:
-                print(f"  ✗ Error processing {founder.get('name', 'Unknown')}: {e}")
-                errors += 1
-                continue
+        # Stream, classify and store each unclassified founder
+        counts = asyncio.run(classify_and_store(collection, query, client, args, unclassified_count))
+        technical_count = counts["technical"]
+        business_count = counts["business"]
+        errors = counts["processed"] - counts["updated"]
         
         # Print summary
         print("\n" + "="*50)
@@ -215,8 +854,10 @@ def main():
         print(f"Total processed: {unclassified_count}")
         print(f"Technical founders: {technical_count}")
         print(f"Business founders: {business_count}")
+        if counts["failed"] > 0:
+            print(f"Failed classifications (left for the next run): {counts['failed']}")
         if errors > 0:
-            print(f"Errors: {errors}")
+            print(f"Failed database updates: {errors}")
         
         # Show overall distribution
         total_technical = collection.count_documents({"founder_type": "technical"})
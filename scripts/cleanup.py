@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Script to clean up fields in the MongoDB users collection from declarative specs.
+Each spec is a JSON file of the form:
+    {"unset": ["field", ...], "set": {"field": value, ...}, "match": {...}}
+The optional "match" is a MongoDB filter restricting which documents the cleanup touches.
+All specs given on the command line are merged and applied in a single update_many
+that only matches documents still needing a change, so specs combined in one run
+must share the same "match".
+
+Usage:
+    python scripts/cleanup.py --spec scripts/cleanups/contact_fields.json [--spec ...] [--verbose]
+"""
+
+import os
+import json
+import argparse
+from typing import Dict, List, Tuple
+from pymongo import MongoClient
+from dotenv import load_dotenv
+
+def load_spec(path: str) -> Dict:
+    """
+    Load and validate a cleanup spec
+    
+    Args:
+        path: Path to a JSON spec file
+    
+    Returns:
+        Spec with 'unset' (list of fields), 'set' (field -> value) and 'match' (filter, {} for all) keys
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        spec = json.load(f)
+    
+    unknown = set(spec) - {'unset', 'set', 'match'}
+    if unknown:
+        raise ValueError(f"{path}: unknown spec keys {sorted(unknown)}")
+    
+    match = spec.get('match', {})
+    if not isinstance(match, dict):
+        raise ValueError(f"{path}: 'match' must be a filter object")
+    
+    return {"unset": list(spec.get('unset', [])), "set": dict(spec.get('set', {})), "match": match}
+
+def merge_specs(specs: List[Dict]) -> Dict:
+    """
+    Merge several specs into one so they can run as a single update
+    
+    Args:
+        specs: Specs from load_spec
+    
+    Returns:
+        Combined spec
+    """
+    merged = {"unset": [], "set": {}, "match": specs[0]['match'] if specs else {}}
+    for spec in specs:
+        # One update_many has one filter, so every spec must target the same documents
+        if spec['match'] != merged['match']:
+            raise ValueError("Specs with different 'match' filters can't be combined; run them separately")
+        for field in spec['unset']:
+            if field not in merged['unset']:
+                merged['unset'].append(field)
+        for field, value in spec['set'].items():
+            if field in merged['set'] and merged['set'][field] != value:
+                raise ValueError(f"Conflicting values for '{field}' across specs")
+            merged['set'][field] = value
+    
+    conflicts = set(merged['unset']) & set(merged['set'])
+    if conflicts:
+        raise ValueError(f"Fields both set and unset across specs: {sorted(conflicts)}")
+    
+    return merged
+
+def build_cleanup(spec: Dict) -> Tuple[Dict, Dict]:
+    """
+    Build the filter and update document for a spec
+    
+    Args:
+        spec: Spec from load_spec or merge_specs
+    
+    Returns:
+        (filter matching only documents that still need a change, update document)
+    """
+    # $ne also matches documents where the field is missing
+    conditions = [{field: {"$exists": True}} for field in spec['unset']]
+    conditions += [{field: {"$ne": value}} for field, value in spec['set'].items()]
+    
+    update = {}
+    if spec['set']:
+        update["$set"] = spec['set']
+    if spec['unset']:
+        update["$unset"] = {field: "" for field in spec['unset']}
+    
+    query = {"$or": conditions}
+    if spec['match']:
+        query = {"$and": [spec['match'], query]}
+    
+    return query, update
+
+def main():
+    """Main function to apply cleanup specs to the users collection"""
+    parser = argparse.ArgumentParser(description='Apply declarative field cleanups to all users')
+    parser.add_argument('--spec', action='append', required=True,
+                        help='Path to a JSON cleanup spec (repeat to combine several cleanups)')
+    parser.add_argument('--verbose', action='store_true', help='Count affected documents before and after the cleanup')
+    
+    args = parser.parse_args()
+    
+    try:
+        spec = merge_specs([load_spec(path) for path in args.spec])
+    except (OSError, ValueError) as e:
+        print(f"Error loading cleanup spec: {e}")
+        return
+    
+    if not spec['unset'] and not spec['set']:
+        print("Cleanup specs are empty. Nothing to do.")
+        return
+    
+    query, update = build_cleanup(spec)
+    
+    # Load environment variables
+    load_dotenv()
+    
+    mongo_uri = os.getenv('MONGO_URI')
+    if not mongo_uri:
+        print("Error: MONGO_URI not found in environment variables")
+        return
+    
+    try:
+        # Connect to MongoDB
+        print("Connecting to MongoDB...")
+        client = MongoClient(mongo_uri)
+        db = client['last-recruiter-mvp']
+        collection = db['users']
+        
+        print(f"Connected to database: {db.name}")
+        print(f"Working with collection: {collection.name}")
+        
+        # Get total document count (from collection metadata, no scan)
+        total_docs = collection.estimated_document_count()
+        
+        if total_docs == 0:
+            print("No documents found in the collection.")
+            return
+        
+        print(f"\nCurrent state:")
+        print(f"  Total documents: {total_docs}")
+        
+        if args.verbose:
+            docs_to_clean = collection.count_documents(query)
+            print(f"  Documents needing cleanup: {docs_to_clean}")
+            
+            if docs_to_clean == 0:
+                print("\nAll documents are already clean. Nothing to clean up!")
+                return
+        
+        # Ask for confirmation
+        print(f"\nThis will:")
+        if spec['match']:
+            print(f"  - Only touch documents matching {spec['match']}")
+        for field in spec['unset']:
+            print(f"  - Remove '{field}' field from every document that has it")
+        for field, value in spec['set'].items():
+            print(f"  - Set '{field}' field to {value!r} in every document")
+        
+        confirm = input("\nProceed with cleanup? (y/N): ").strip().lower()
+        if confirm != 'y':
+            print("Cleanup cancelled.")
+            return
+        
+        print("\nStarting cleanup...")
+        
+        # Apply every cleanup in a single update, touching only documents that need it
+        result = collection.update_many(query, update)
+        print(f"  ✓ Matched {result.matched_count} documents, modified {result.modified_count}")
+        
+        if result.matched_count == 0:
+            print("\nAll documents are already clean. Nothing to clean up!")
+        elif args.verbose:
+            # Verify final state
+            print("\nVerifying final state...")
+            remaining = collection.count_documents(query)
+            
+            print(f"Final state:")
+            print(f"  Documents needing cleanup: {remaining}")
+            
+            if remaining == 0:
+                print("\n✅ Cleanup completed successfully!")
+            else:
+                print("\n⚠️  Cleanup may not be complete - some fields still exist")
+        else:
+            print("\n✅ Cleanup completed successfully!")
+        
+        # Sample a few documents to show the result
+        fields = spec['unset'] + list(spec['set'])
+        print("\nSample of cleaned documents:")
+        sample_docs = list(collection.find(spec['match'], {"name": 1, **{field: 1 for field in fields}}).limit(3))
+        for i, doc in enumerate(sample_docs, 1):
+            values = ", ".join(f"{field}={doc[field]!r}" if field in doc else f"{field}=REMOVED" for field in fields)
+            print(f"  Sample {i}: name='{doc.get('name', 'N/A')}', {values}")
+    
+    except Exception as e:
+        print(f"Error during cleanup: {e}")
+    finally:
+        try:
+            client.close()
+            print("\nDatabase connection closed.")
+        except:
+            pass
+
+if __name__ == "__main__":
+    main()
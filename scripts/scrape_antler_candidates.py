@@ -6,31 +6,235 @@ Scrapes candidate information from Antler Hub and stores in MongoDB
 
 import os
 import sys
-import time
+import json
 import getpass
+import argparse
+from multiprocessing import Pool
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import List, Dict
+from typing import List, Dict, Any, Optional
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
-from pymongo import MongoClient, errors
+from webdriver_manager.core.os_manager import OperationSystemManager, ChromeType
+from bs4 import BeautifulSoup, SoupStrainer
+from pymongo import MongoClient, UpdateOne, IndexModel, errors
 from dotenv import load_dotenv
 
+# Number of threads used to parse candidate containers on a page
+PARSE_WORKERS = 8
+
+# Only build the parts of the page we read: profile containers and (fallback) name paragraphs.
+# While parsing, the strainer sees the raw class string, so split it to match multi-class elements.
+CANDIDATE_CLASSES = frozenset({'css-iuxpug', 'css-5gltw'})
+CANDIDATE_STRAINER = SoupStrainer(
+    ['div', 'p'],
+    class_=lambda classes: classes is not None and not CANDIDATE_CLASSES.isdisjoint(classes.split())
+)
+
+# Condition polling instead of fixed sleeps (seconds)
+WAIT_POLL_INTERVAL = 0.2
+PAGE_LOAD_TIMEOUT = 10
+LOGIN_TIMEOUT = 15
+NAVIGATION_TIMEOUT = 10
+CANDIDATES_TIMEOUT = 20
+
+# Resolves (async script) as soon as a candidate card or name is in the DOM, using a MutationObserver
+# instead of polling. Returns false if none shows up within arguments[0] seconds.
+WAIT_FOR_CANDIDATES_SCRIPT = """
+const timeoutSeconds = arguments[0];
+const done = arguments[arguments.length - 1];
+const selector = 'div.css-iuxpug, p.css-5gltw';
+if (document.querySelector(selector)) {
+    done(true);
+    return;
+}
+const observer = new MutationObserver(() => {
+    if (document.querySelector(selector)) {
+        observer.disconnect();
+        clearTimeout(timer);
+        done(true);
+    }
+});
+const timer = setTimeout(() => {
+    observer.disconnect();
+    done(false);
+}, timeoutSeconds * 1000);
+observer.observe(document.documentElement, {childList: true, subtree: true});
+"""
+
+# Indexes on the users collection. The unique name/antler_profile_url indexes serve the two upsert filters.
+USER_INDEXES = [
+    IndexModel("name", unique=True, sparse=True),
+    IndexModel("antler_profile_url", unique=True, sparse=True),
+    # Dashboard filter fields and the multikey skills array
+    IndexModel([("status", 1), ("founder_type", 1), ("location", 1)]),
+    IndexModel("skills")
+]
+
+# Resolved chromedriver path, reused across runs while the installed Chrome version is unchanged
+DRIVER_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.antler_scraper_driver.json')
+
+# Persistent Chrome profile, so the Antler login (cookies/localStorage) survives between runs
+PROFILE_DIR = os.path.join(os.path.expanduser('~'), '.antler_scraper_profile')
+
+# Requests the scraper never needs: fonts, media and analytics/tracking scripts.
+# Images are not blocked: Chakra avatars only render their <img> (and so avatar_url) once the image has loaded.
+BLOCKED_URL_PATTERNS = [
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*.mp4", "*.webm", "*.mp3",
+    "*google-analytics.com*", "*googletagmanager.com*", "*segment.io*", "*segment.com*",
+    "*hotjar.com*", "*intercom.io*", "*sentry.io*"
+]
+
+# Login form locators: each alternative set is one union selector, so a lookup is a single WebDriver call
+EMAIL_SELECTOR = ", ".join((
+    "input[type='email']",
+    "input[name='email']",
+    "input[id*='email']",
+    "input[placeholder*='email' i]",
+    "input[autocomplete='email']"
+))
+PASSWORD_SELECTOR = ", ".join((
+    "input[type='password']",
+    "input[name='password']",
+    "input[id*='password']",
+    "input[placeholder*='password' i]"
+))
+LOGIN_BUTTON_XPATH = " | ".join((
+    "//button[@type='submit']",
+    "//button[contains(@class, 'login')]",
+    "//button[contains(@class, 'signin')]",
+    "//button[contains(text(), 'Log in')]",
+    "//button[contains(text(), 'Sign in')]",
+    "//input[@type='submit']"
+))
+
+# Clicks the first enabled, visible button matched by a list of XPaths (tried in order).
+# Returns the 1-based index of the XPath that matched, or 0 if none did.
+CLICK_FIRST_BUTTON_SCRIPT = """
+const xpaths = arguments[0];
+for (let i = 0; i < xpaths.length; i++) {
+    const result = document.evaluate(xpaths[i], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    for (let j = 0; j < result.snapshotLength; j++) {
+        const button = result.snapshotItem(j);
+        if (!button.disabled && button.getClientRects().length > 0) {
+            button.click();
+            return i + 1;
+        }
+    }
+}
+return 0;
+"""
+
+# Extracts the raw fields of every candidate card in the browser, so neither the page source nor a
+# Python-side parse is needed. Mirrors extract_full_candidate_info; arguments[0] is the list of
+# Antler cofounder types. Text is read like BeautifulSoup's get_text(strip=True).
+EXTRACT_CANDIDATES_SCRIPT = """
+const types = new Set(arguments[0]);
+const text = (el) => {
+    if (!el) return null;
+    const walker = document.createTreeWalker(el, NodeFilter.SHOW_TEXT);
+    let out = '';
+    for (let node = walker.nextNode(); node; node = walker.nextNode()) {
+        out += node.nodeValue.trim();
+    }
+    return out;
+};
+return Array.from(document.querySelectorAll('div.css-iuxpug'), (card) => {
+    const first = (selector) => text(card.querySelector(selector));
+    const all = (selector) => Array.from(card.querySelectorAll(selector), text);
+    
+    // Strategy 1: css-10pjdbc; Strategy 2: any p/span/div with exactly a type name, outside skill tags
+    let antlerTypes = all('p.css-10pjdbc').filter((t) => types.has(t));
+    if (!antlerTypes.length) {
+        antlerTypes = Array.from(card.querySelectorAll('p, span, div'))
+            .filter((el) => types.has(text(el)))
+            .filter((el) => !(el.parentElement && el.parentElement.classList.contains('css-olbwyb')))
+            .map(text);
+    }
+    
+    const avatar = card.querySelector('img.chakra-avatar__img');
+    return {
+        name: first('p.css-5gltw'),
+        tagline: first('p.css-1s1jbr2'),
+        location: first('span.css-1l60zjl'),
+        status: first('p.css-f9cheu') ?? first('p.css-viedx2'),
+        about_me: first('p.css-1b5s80b'),
+        skills: all('p.css-olbwyb'),
+        avatar_url: avatar ? (avatar.getAttribute('src') || '') : null,
+        antler_cofounder_type: antlerTypes,
+        categories: Array.from(card.querySelectorAll('div.css-i310wq'), (div) => text(div.querySelector('p.css-olbwyb')))
+            .filter((t) => t !== null)
+    };
+});
+"""
+
+# Section headers that share the skill/category classes but are not skills themselves
+SECTION_HEADERS = frozenset({'Technology', 'Technical Software', 'Domain', 'Business'})
+ANTLER_COFOUNDER_TYPES = frozenset({'Technology', 'Business', 'Domain'})
+
+
+def load_driver_cache(chrome_version: Optional[str]) -> Optional[str]:
+    """
+    Load the cached chromedriver path if it still matches the installed Chrome
+    
+    Args:
+        chrome_version: Installed Chrome version, or None if it could not be detected
+        
+    Returns:
+        Cached chromedriver path, or None if it must be resolved again
+    """
+    # Without a known Chrome version we can't tell whether the cached driver still fits
+    if not chrome_version or not os.path.exists(DRIVER_CACHE_FILE):
+        return None
+    try:
+        with open(DRIVER_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    # Re-resolve if the binary moved or lost its executable bit (e.g. the webdriver-manager cache was cleared)
+    path = cached.get('path', '')
+    if cached.get('chrome_version') == chrome_version and os.path.isfile(path) and os.access(path, os.X_OK):
+        return path
+    return None
+
+def save_driver_cache(path: str, chrome_version: Optional[str]):
+    """
+    Remember the resolved chromedriver path for the installed Chrome version
+    
+    Args:
+        path: Path to the chromedriver executable
+        chrome_version: Installed Chrome version, or None if it could not be detected
+    """
+    if not chrome_version:
+        return
+    try:
+        with open(DRIVER_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump({'path': path, 'chrome_version': chrome_version}, f)
+    except OSError as e:
+        print(f"Could not cache chromedriver path: {e}")
+
 
 class AntlerScraper:
     """Scraper for Antler Hub candidate information"""
     
-    def __init__(self, headless: bool = False):
+    def __init__(self, headless: bool = False, refresh: bool = False, profile_dir: Optional[str] = PROFILE_DIR):
         """
         Initialize the scraper
         
         Args:
             headless: Run browser in headless mode (default: False for debugging)
+            refresh: Re-scrape candidates that are already stored (default: only scrape new ones)
+            profile_dir: Chrome user data directory to keep the login in, or None for a throwaway profile
         """
         load_dotenv()
         self.mongo_uri = os.getenv('MONGO_URI')
@@ -48,6 +252,9 @@ class AntlerScraper:
         self.db = None
         self.collection = None
         self.headless = headless
+        self.refresh = refresh
+        self.profile_dir = profile_dir
+        self.known_names = set()
         
     def setup_driver(self):
         """Setup Chrome driver with appropriate options"""
@@ -63,7 +270,42 @@ class AntlerScraper:
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option('useAutomationExtension', False)
         options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+        # Talk to the local chromedriver directly, even if HTTP(S)_PROXY is set in the environment
+        options.ignore_local_proxy_environment_variables()
+        
+        if self.profile_dir:
+            # Reusing the profile keeps us logged in, so login_if_needed can skip the login form
+            os.makedirs(self.profile_dir, exist_ok=True)
+            options.add_argument(f'--user-data-dir={self.profile_dir}')
+        
+        chrome_version = OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE)
+        driver_path = load_driver_cache(chrome_version)
+        if driver_path:
+            print(f"Using cached chromedriver: {driver_path}")
+        else:
+            driver_path = self.resolve_chromedriver_path()
+            if driver_path:
+                save_driver_cache(driver_path, chrome_version)
+        
+        # Fallback to system chromedriver
+        service = Service(driver_path) if driver_path else Service()
+            
+        # Reuse one pooled HTTP connection to chromedriver for every WebDriver command
+        self.driver = webdriver.Chrome(service=service, options=options, keep_alive=True)
+        self.wait = WebDriverWait(self.driver, 20, poll_frequency=WAIT_POLL_INTERVAL)
+        
+        # Skip downloading resources that play no part in scraping
+        self.driver.execute_cdp_cmd('Network.enable', {})
+        self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+        print("Chrome driver setup complete")
+        
+    def resolve_chromedriver_path(self) -> Optional[str]:
+        """
+        Download/locate a chromedriver matching the installed Chrome with webdriver-manager
         
+        Returns:
+            Path to the chromedriver executable, or None to use the system chromedriver
+        """
         # Fix for ARM Mac - find the actual chromedriver executable
         import platform
         import glob
@@ -91,18 +333,13 @@ class AntlerScraper:
             if chromedriver_path:
                 # Make sure it's executable
                 os.chmod(chromedriver_path, 0o755)
-                service = Service(chromedriver_path)
-            else:
-                # Fallback to system chromedriver
-                print("Could not find chromedriver in webdriver-manager cache, trying system chromedriver...")
-                service = Service()
-        else:
-            # For other systems, use the standard approach
-            service = Service(ChromeDriverManager().install())
+                return chromedriver_path
             
-        self.driver = webdriver.Chrome(service=service, options=options)
-        self.wait = WebDriverWait(self.driver, 20)
-        print("Chrome driver setup complete")
+            print("Could not find chromedriver in webdriver-manager cache, trying system chromedriver...")
+            return None
+        
+        # For other systems, use the standard approach
+        return ChromeDriverManager().install()
         
     def setup_mongodb(self):
         """Setup MongoDB connection and collection"""
@@ -114,22 +351,85 @@ class AntlerScraper:
             self.db = self.db_client['last-recruiter-mvp']
             self.collection = self.db['users']
             
-            self.collection.create_index("name", unique=True, sparse=True)
-            self.collection.create_index("antler_profile_url", unique=True, sparse=True)
+            # Only create indexes that don't exist yet (one round trip when they all do)
+            existing_indexes = self.collection.index_information()
+            missing_indexes = [index for index in USER_INDEXES if index.document['name'] not in existing_indexes]
+            if missing_indexes:
+                self.collection.create_indexes(missing_indexes)
+                print(f"Created {len(missing_indexes)} missing indexes")
+            
+            # Names already stored, so unchanged candidates can be skipped without parsing or writing them
+            if not self.refresh:
+                self.known_names = set(self.collection.distinct('name'))
+                print(f"Loaded {len(self.known_names)} already-scraped candidate names")
             
             print(f"Connected to MongoDB. Using database: {self.db.name}, collection: {self.collection.name}")
         except errors.ServerSelectionTimeoutError:
             print("Failed to connect to MongoDB. Please check your connection string.")
             raise
             
+    def wait_for(self, condition, timeout: float) -> bool:
+        """
+        Poll until a condition holds instead of sleeping for a fixed time
+        
+        Args:
+            condition: Callable taking the driver, e.g. an expected_conditions predicate
+            timeout: Maximum number of seconds to wait
+            
+        Returns:
+            True if the condition was met, False on timeout
+        """
+        try:
+            WebDriverWait(
+                self.driver, timeout, poll_frequency=WAIT_POLL_INTERVAL,
+                ignored_exceptions=(StaleElementReferenceException,)
+            ).until(condition)
+            return True
+        except TimeoutException:
+            return False
+    
+    def is_login_url(self, url: str) -> bool:
+        """Check whether a URL is one of the login/auth pages"""
+        url = url.lower()
+        return "login" in url or "signin" in url or "auth" in url
+        
+    def candidates_present(self):
+        """Expected condition that holds once candidate cards or names are in the DOM"""
+        return EC.any_of(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "div.css-iuxpug")),
+            EC.presence_of_element_located((By.CSS_SELECTOR, "p.css-5gltw"))
+        )
+        
+    def find_visible_element(self, by: str, selector: str, require_enabled: bool = False):
+        """
+        Find the first visible element matching a (union) selector in one lookup
+        
+        Args:
+            by: Locator strategy, e.g. By.CSS_SELECTOR or By.XPATH
+            selector: Selector, possibly combining several alternatives
+            require_enabled: Also require the element to be enabled
+            
+        Returns:
+            The first visible match, else the first match, else None
+        """
+        elements = self.driver.find_elements(by, selector)
+        for element in elements:
+            try:
+                if element.is_displayed() and (not require_enabled or element.is_enabled()):
+                    return element
+            except StaleElementReferenceException:
+                continue
+        return elements[0] if elements else None
+        
     def login_if_needed(self):
         """Handle login if required"""
         print(f"Navigating to {self.founders_url}...")
         self.driver.get(self.founders_url)
-        time.sleep(3)
+        # Either we get redirected to a login page or the candidates start rendering
+        self.wait_for(EC.any_of(lambda d: self.is_login_url(d.current_url), self.candidates_present()), PAGE_LOAD_TIMEOUT)
         
         current_url = self.driver.current_url
-        if "login" in current_url.lower() or "signin" in current_url.lower() or "auth" in current_url.lower():
+        if self.is_login_url(current_url):
             print("\nLogin required...")
             
             # Use credentials from .env if available
@@ -144,25 +444,10 @@ class AntlerScraper:
             
             try:
                 # Wait for login form to be fully loaded
-                time.sleep(2)
+                self.wait_for(EC.presence_of_element_located((By.CSS_SELECTOR, EMAIL_SELECTOR)), PAGE_LOAD_TIMEOUT)
                 
                 # Try multiple selectors for email field
-                email_selectors = [
-                    "input[type='email']",
-                    "input[name='email']",
-                    "input[id*='email']",
-                    "input[placeholder*='email' i]",
-                    "input[autocomplete='email']"
-                ]
-                
-                email_field = None
-                for selector in email_selectors:
-                    try:
-                        email_field = self.driver.find_element(By.CSS_SELECTOR, selector)
-                        if email_field.is_displayed():
-                            break
-                    except:
-                        continue
+                email_field = self.find_visible_element(By.CSS_SELECTOR, EMAIL_SELECTOR)
                 
                 if not email_field:
                     raise Exception("Could not find email field")
@@ -170,24 +455,12 @@ class AntlerScraper:
                 # Clear and enter email
                 email_field.clear()
                 email_field.send_keys(email)
-                time.sleep(1)
                 
-                # Try multiple selectors for password field
-                password_selectors = [
-                    "input[type='password']",
-                    "input[name='password']",
-                    "input[id*='password']",
-                    "input[placeholder*='password' i]"
-                ]
+                # The password field may only render after the email has been entered
+                self.wait_for(EC.presence_of_element_located((By.CSS_SELECTOR, PASSWORD_SELECTOR)), PAGE_LOAD_TIMEOUT)
                 
-                password_field = None
-                for selector in password_selectors:
-                    try:
-                        password_field = self.driver.find_element(By.CSS_SELECTOR, selector)
-                        if password_field.is_displayed():
-                            break
-                    except:
-                        continue
+                # Try multiple selectors for password field
+                password_field = self.find_visible_element(By.CSS_SELECTOR, PASSWORD_SELECTOR)
                 
                 if not password_field:
                     raise Exception("Could not find password field")
@@ -195,31 +468,9 @@ class AntlerScraper:
                 # Clear and enter password
                 password_field.clear()
                 password_field.send_keys(password)
-                time.sleep(1)
                 
                 # Find and click login button
-                login_button_selectors = [
-                    "button[type='submit']",
-                    "button[class*='login']",
-                    "button[class*='signin']",
-                    "button:contains('Log in')",
-                    "button:contains('Sign in')",
-                    "input[type='submit']"
-                ]
-                
-                login_button = None
-                for selector in login_button_selectors:
-                    try:
-                        if ':contains' in selector:
-                            # Use XPath for text content
-                            text = selector.split("'")[1]
-                            login_button = self.driver.find_element(By.XPATH, f"//button[contains(text(), '{text}')]")
-                        else:
-                            login_button = self.driver.find_element(By.CSS_SELECTOR, selector)
-                        if login_button.is_displayed() and login_button.is_enabled():
-                            break
-                    except:
-                        continue
+                login_button = self.find_visible_element(By.XPATH, LOGIN_BUTTON_XPATH, require_enabled=True)
                 
                 if login_button:
                     login_button.click()
@@ -229,8 +480,12 @@ class AntlerScraper:
                 
                 print("Logging in...")
                 
-                # Wait for login to complete
-                time.sleep(5)
+                # Wait for login to complete: we leave the login page or an error shows up
+                self.wait_for(
+                    lambda d: not self.is_login_url(d.current_url)
+                    or any(e.is_displayed() for e in d.find_elements(By.CSS_SELECTOR, "[class*='error'], [class*='alert']")),
+                    LOGIN_TIMEOUT
+                )
                 
                 # Check if still on login page
                 current_url = self.driver.current_url
@@ -249,7 +504,7 @@ class AntlerScraper:
                 # Navigate to founders page
                 print(f"Navigating to founders page: {self.founders_url}")
                 self.driver.get(self.founders_url)
-                time.sleep(4)
+                self.wait_for(EC.url_contains("/cohort/founder"), PAGE_LOAD_TIMEOUT)
                 
                 # Double check we're on the right page
                 current_url = self.driver.current_url
@@ -258,16 +513,14 @@ class AntlerScraper:
                     try:
                         cohort_link = self.driver.find_element(By.LINK_TEXT, "Cohort")
                         cohort_link.click()
-                        time.sleep(2)
                         
                         # Then click on Founders tab
-                        founders_tab = self.driver.find_element(By.LINK_TEXT, "Founders")
+                        founders_tab = self.wait.until(EC.element_to_be_clickable((By.LINK_TEXT, "Founders")))
                         founders_tab.click()
-                        time.sleep(2)
+                        self.wait_for(EC.url_contains("/cohort/founder"), PAGE_LOAD_TIMEOUT)
                     except:
                         # Direct navigation as fallback
                         self.driver.get(self.founders_url)
-                        time.sleep(3)
                     
             except Exception as e:
                 print(f"Login process encountered an error: {e}")
@@ -275,13 +528,11 @@ class AntlerScraper:
                 input("Press Enter after you've logged in manually...")
                 # After manual login, navigate to founders page
                 self.driver.get(self.founders_url)
-                time.sleep(3)
         else:
             # Already logged in, ensure we're on the founders page
             if "/cohort/founder" not in self.driver.current_url:
                 print(f"Already logged in. Navigating to founders page: {self.founders_url}")
                 self.driver.get(self.founders_url)
-                time.sleep(3)
                 
         # Final verification
         final_url = self.driver.current_url
@@ -297,56 +548,17 @@ class AntlerScraper:
         """Wait for candidate cards to load on the page"""
         print("Waiting for candidates to load...")
         
-        # Give the page a moment to start loading
-        time.sleep(5)
-        
-        # Check if candidates are already loaded
+        # Let the browser tell us when the first card mounts (one round trip, no polling)
+        self.driver.set_script_timeout(CANDIDATES_TIMEOUT + 5)
         try:
-            candidate_containers = self.driver.find_elements(By.CSS_SELECTOR, "div.css-iuxpug")
-            if candidate_containers:
-                print(f"Candidates already loaded: {len(candidate_containers)} found")
-                return True
-            
-            name_elements = self.driver.find_elements(By.CSS_SELECTOR, "p.css-5gltw")
-            if name_elements:
-                print(f"Candidate names already loaded: {len(name_elements)} found")
-                return True
-        except:
-            pass
-        
-        # If not loaded yet, wait with polling
-        print("Candidates not immediately visible, waiting...")
-        max_wait_time = 15  # seconds
-        wait_interval = 3   # seconds
-        total_waited = 0
+            loaded = self.driver.execute_async_script(WAIT_FOR_CANDIDATES_SCRIPT, CANDIDATES_TIMEOUT)
+        except TimeoutException:
+            loaded = False
         
-        while total_waited < max_wait_time:
-            print(f"Still waiting for candidates... ({total_waited}s elapsed)")
-            
-            try:
-                # Scroll to trigger any lazy loading
-                self.driver.execute_script("window.scrollTo(0, 500)")
-                time.sleep(1)
-                self.driver.execute_script("window.scrollTo(0, 0)")
-                
-                # Check again
-                candidate_containers = self.driver.find_elements(By.CSS_SELECTOR, "div.css-iuxpug")
-                if candidate_containers:
-                    print(f"Found {len(candidate_containers)} candidate containers")
-                    return True
-                
-                name_elements = self.driver.find_elements(By.CSS_SELECTOR, "p.css-5gltw")
-                if name_elements:
-                    print(f"Found {len(name_elements)} name elements")
-                    return True
-                    
-            except Exception as e:
-                print(f"Error during wait: {e}")
-            
-            time.sleep(wait_interval)
-            total_waited += wait_interval
-        
-        print("Proceeding with scraping regardless...")
+        if loaded:
+            print("Candidates loaded")
+        else:
+            print(f"No candidates appeared within {CANDIDATES_TIMEOUT}s. Proceeding with scraping regardless...")
         return True
             
     def scrape_current_page(self) -> List[Dict]:
@@ -357,29 +569,62 @@ class AntlerScraper:
             List of candidate dictionaries
         """
         candidates = []
+        # Names already taken from this page, to drop duplicate cards as we go
+        seen_names = set()
+        # One timestamp for every candidate on this page
+        scraped_at = datetime.now(timezone.utc)
+        
+        skipped = 0
+        soup = None
         
         print("Scraping current page...")
-        soup = BeautifulSoup(self.driver.page_source, 'lxml')
+        # Extract the fields inside the browser; parse the page source only if that fails
+        parsed = self.extract_candidates_in_browser(scraped_at)
         
-        # Find all candidate profile containers
-        # Look for the main profile containers that contain all candidate info
-        profile_containers = soup.find_all('div', class_='css-iuxpug')
+        if parsed is None:
+            soup = BeautifulSoup(self.driver.page_source, 'lxml', parse_only=CANDIDATE_STRAINER)
+            
+            # Find all candidate profile containers
+            # Look for the main profile containers that contain all candidate info
+            profile_containers = soup.find_all('div', class_='css-iuxpug')
+            
+            if profile_containers and not self.refresh:
+                new_containers = [c for c in profile_containers if self.container_name(c) not in self.known_names]
+                skipped = len(profile_containers) - len(new_containers)
+                profile_containers = new_containers
+            
+            # Containers are independent, so parse them in parallel (map keeps page order)
+            with ThreadPoolExecutor(max_workers=PARSE_WORKERS) as executor:
+                parsed = list(executor.map(
+                    lambda container: self.extract_full_candidate_info(container, scraped_at),
+                    profile_containers
+                ))
+        elif not self.refresh:
+            new_candidates = [c for c in parsed if not (c and c['name'] in self.known_names)]
+            skipped = len(parsed) - len(new_candidates)
+            parsed = new_candidates
         
-        if profile_containers:
-            print(f"Found {len(profile_containers)} candidate profiles")
+        if parsed:
+            print(f"Found {len(parsed)} candidate profiles")
             
-            for container in profile_containers:
-                candidate_data = self.extract_full_candidate_info(container)
+            for candidate_data in parsed:
                 if candidate_data and candidate_data.get('name'):
                     # Skip test account
                     if candidate_data['name'] == 'Chris (Test) Klam':
                         print("Skipping test account: Chris (Test) Klam")
                         continue
+                    if candidate_data['name'] in seen_names:
+                        continue
+                    seen_names.add(candidate_data['name'])
                     candidates.append(candidate_data)
+            
+            self.add_empty_phones(candidates)
         
         # Fallback: Try the original name-only approach
-        if not candidates:
+        if not candidates and not skipped:
             print("No profile containers found, trying name-only extraction...")
+            if soup is None:
+                soup = BeautifulSoup(self.driver.page_source, 'lxml', parse_only=CANDIDATE_STRAINER)
             name_elements = soup.find_all('p', class_='css-5gltw')
             
             if name_elements:
@@ -394,43 +639,169 @@ class AntlerScraper:
                     if name_text == 'Michiel(you)':
                         name_text = 'Michiel Voortman'
                         print("Found 'Michiel(you)' - normalizing to 'Michiel Voortman'")
+                    if not self.refresh and name_text in self.known_names:
+                        skipped += 1
+                        continue
+                    if not name_text or name_text in seen_names:
+                        continue
+                    seen_names.add(name_text)
                     candidates.append({
                         'name': name_text,
-                        'scraped_at': datetime.now(timezone.utc),
+                        'scraped_at': scraped_at,
                         'source': 'antler_hub'
                     })
         
-        # Remove duplicates based on name
-        seen_names = set()
-        unique_candidates = []
+        if skipped:
+            print(f"Skipped {skipped} already-scraped candidates (use --refresh to re-scrape them)")
+        print(f"Found {len(candidates)} unique candidates on this page")
         
-        for candidate in candidates:
-            name = candidate.get('name', '')
-            if name and name not in seen_names:
-                seen_names.add(name)
-                unique_candidates.append(candidate)
+        return candidates
         
-        print(f"Found {len(unique_candidates)} unique candidates on this page")
+    def extract_candidates_in_browser(self, scraped_at: datetime) -> Optional[List[Optional[Dict]]]:
+        """
+        Extract all candidate cards with a single script run in the page
+        
+        Args:
+            scraped_at: Timestamp shared by all candidates scraped from the same page
+            
+        Returns:
+            Candidate dictionaries (None for cards without a name), or None if the script failed
+        """
+        try:
+            rows = self.driver.execute_script(EXTRACT_CANDIDATES_SCRIPT, sorted(ANTLER_COFOUNDER_TYPES))
+        except Exception as e:
+            print(f"In-browser extraction failed, parsing page source instead: {e}")
+            return None
         
-        return unique_candidates
+        if not isinstance(rows, list):
+            return None
+        return [self.candidate_from_row(row, scraped_at) for row in rows]
         
-    def extract_full_candidate_info(self, container) -> Dict:
+    def candidate_from_row(self, row: Dict, scraped_at: datetime) -> Optional[Dict]:
+        """
+        Build a candidate dictionary from fields extracted by EXTRACT_CANDIDATES_SCRIPT
+        
+        Args:
+            row: Raw card fields; missing elements are None
+            scraped_at: Timestamp shared by all candidates scraped from the same page
+            
+        Returns:
+            Candidate dictionary like extract_full_candidate_info, or None if the card has no name
+        """
+        candidate = {
+            'scraped_at': scraped_at,
+            'source': 'antler_hub'
+        }
+        
+        name = row.get('name')
+        if name is not None:
+            # Normalize "Michiel(you)" to "Michiel Voortman"
+            if name == 'Michiel(you)':
+                name = 'Michiel Voortman'
+                print("Found 'Michiel(you)' - normalizing to 'Michiel Voortman'")
+            candidate['name'] = name
+        
+        for field in ('tagline', 'location', 'status', 'about_me'):
+            if row.get(field) is not None:
+                candidate[field] = row[field]
+        
+        # Filter out section headers and non-skill text
+        filtered_skills = [skill for skill in row.get('skills', []) if skill not in SECTION_HEADERS]
+        if filtered_skills:
+            candidate['skills'] = filtered_skills
+        
+        if row.get('avatar_url') is not None:
+            candidate['avatar_url'] = row['avatar_url']
+        
+        antler_types = set(row.get('antler_cofounder_type', [])) & ANTLER_COFOUNDER_TYPES
+        if antler_types:
+            candidate['antler_cofounder_type'] = sorted(antler_types)
+        
+        categories = [cat for cat in row.get('categories', []) if cat not in SECTION_HEADERS]
+        if categories:
+            candidate['categories'] = categories
+        
+        return candidate if candidate.get('name') else None
+        
+    def container_name(self, container) -> str:
+        """
+        Read just the candidate name from a profile container
+        
+        Args:
+            container: BeautifulSoup element containing candidate profile
+            
+        Returns:
+            Normalized candidate name, or an empty string if the container has none
+        """
+        name_elem = container.find('p', class_='css-5gltw')
+        if not name_elem:
+            return ''
+        name = name_elem.get_text(strip=True)
+        return 'Michiel Voortman' if name == 'Michiel(you)' else name
+        
+    def add_empty_phones(self, candidates: List[Dict]):
+        """
+        Add an empty phone field to candidates that have no stored phone number
+        
+        Existing candidates are looked up with one query per page rather than one per candidate.
+        
+        Args:
+            candidates: Candidate dictionaries from the current page (updated in place)
+        """
+        names = [c['name'] for c in candidates if 'antler_profile_url' not in c]
+        urls = [c['antler_profile_url'] for c in candidates if 'antler_profile_url' in c]
+        
+        existing_by_name = {}
+        existing_by_url = {}
+        for doc in self.collection.find(
+            {'$or': [{'name': {'$in': names}}, {'antler_profile_url': {'$in': urls}}]},
+            {'name': 1, 'antler_profile_url': 1, 'phone': 1}
+        ):
+            existing_by_name[doc.get('name')] = doc
+            if doc.get('antler_profile_url'):
+                existing_by_url[doc['antler_profile_url']] = doc
+        
+        for candidate in candidates:
+            if 'antler_profile_url' in candidate:
+                existing_candidate = existing_by_url.get(candidate['antler_profile_url'])
+            else:
+                existing_candidate = existing_by_name.get(candidate['name'])
+            
+            # Only set phone to empty if no existing phone data or if existing phone is empty
+            if not existing_candidate or not existing_candidate.get('phone'):
+                candidate['phone'] = ""
+        
+    def extract_full_candidate_info(self, container, scraped_at: datetime) -> Dict:
         """
         Extract complete information from a candidate profile container
         
         Args:
             container: BeautifulSoup element containing candidate profile
+            scraped_at: Timestamp shared by all candidates scraped from the same page
             
         Returns:
             Dictionary with complete candidate information
         """
         candidate = {
-            'scraped_at': datetime.now(timezone.utc),
+            'scraped_at': scraped_at,
             'source': 'antler_hub'
         }
         
+        # Index the container's elements by (tag, class) in a single traversal
+        by_class = defaultdict(list)
+        text_elements = []
+        for elem in container.find_all(True):
+            for cls in elem.get('class', []):
+                by_class[(elem.name, cls)].append(elem)
+            if elem.name in ('p', 'span', 'div'):
+                text_elements.append(elem)
+        
+        def first(tag, cls):
+            elems = by_class.get((tag, cls))
+            return elems[0] if elems else None
+        
         # Extract name (css-5gltw class)
-        name_elem = container.find('p', class_='css-5gltw')
+        name_elem = first('p', 'css-5gltw')
         if name_elem:
             name = name_elem.get_text(strip=True)
             # Normalize "Michiel(you)" to "Michiel Voortman"
@@ -440,47 +811,36 @@ class AntlerScraper:
             candidate['name'] = name
         
         # Extract tagline/description (css-1s1jbr2 class)
-        tagline_elem = container.find('p', class_='css-1s1jbr2')
+        tagline_elem = first('p', 'css-1s1jbr2')
         if tagline_elem:
             candidate['tagline'] = tagline_elem.get_text(strip=True)
         
         # Extract location
-        location_elem = container.find('span', class_='css-1l60zjl')
+        location_elem = first('span', 'css-1l60zjl')
         if location_elem:
             candidate['location'] = location_elem.get_text(strip=True)
         
         # Extract status (In a team / Looking for co-founder)
-        status_elem = container.find('p', class_='css-f9cheu') or container.find('p', class_='css-viedx2')
+        status_elem = first('p', 'css-f9cheu') or first('p', 'css-viedx2')
         if status_elem:
             candidate['status'] = status_elem.get_text(strip=True)
         
         # Extract About Me section
-        about_section = container.find('p', class_='css-1b5s80b')
+        about_section = first('p', 'css-1b5s80b')
         if about_section:
             candidate['about_me'] = about_section.get_text(strip=True)
         
         # Extract skills
-        skill_elements = container.find_all('p', class_='css-olbwyb')
+        skill_elements = by_class.get(('p', 'css-olbwyb'))
         if skill_elements:
             skills = [skill.get_text(strip=True) for skill in skill_elements]
             # Filter out section headers and non-skill text
-            filtered_skills = [skill for skill in skills if skill not in ['Technology', 'Technical Software', 'Domain', 'Business']]
+            filtered_skills = [skill for skill in skills if skill not in SECTION_HEADERS]
             if filtered_skills:
                 candidate['skills'] = filtered_skills
         
-        # Check if phone data already exists for this candidate, only add empty field if none exists
-        existing_candidate = None
-        if 'antler_profile_url' in candidate:
-            existing_candidate = self.collection.find_one({'antler_profile_url': candidate['antler_profile_url']})
-        else:
-            existing_candidate = self.collection.find_one({'name': candidate['name']})
-        
-        # Only set phone to empty if no existing phone data or if existing phone is empty
-        if not existing_candidate or not existing_candidate.get('phone'):
-            candidate['phone'] = ""
-        
         # Extract profile image URL
-        avatar_img = container.find('img', class_='chakra-avatar__img')
+        avatar_img = first('img', 'chakra-avatar__img')
         if avatar_img:
             candidate['avatar_url'] = avatar_img.get('src', '')
         
@@ -489,21 +849,19 @@ class AntlerScraper:
         antler_types_set = set()  # Use set to avoid duplicates
         
         # Strategy 1: Look for css-10pjdbc class
-        cofounder_type_elements = container.find_all('p', class_='css-10pjdbc')
-        for type_elem in cofounder_type_elements:
+        for type_elem in by_class.get(('p', 'css-10pjdbc'), []):
             type_text = type_elem.get_text(strip=True)
-            if type_text in ['Technology', 'Business', 'Domain']:
+            if type_text in ANTLER_COFOUNDER_TYPES:
                 antler_types_set.add(type_text)
         
         # Strategy 2: Look for any element containing these exact words (if Strategy 1 didn't find anything)
         if not antler_types_set:
-            all_elements = container.find_all(['p', 'span', 'div'])
-            for elem in all_elements:
+            for elem in text_elements:
                 elem_text = elem.get_text(strip=True)
-                if elem_text in ['Technology', 'Business', 'Domain']:
+                if elem_text in ANTLER_COFOUNDER_TYPES:
                     # Make sure this isn't part of the skills/categories sections
-                    parent_classes = elem.parent.get('class', []) if elem.parent else []
-                    if not any('css-olbwyb' in str(cls) for cls in parent_classes):
+                    parent_classes = elem.parent.get('class', ()) if elem.parent else ()
+                    if 'css-olbwyb' not in parent_classes:
                         antler_types_set.add(elem_text)
         
         # Convert set to list and save if any types found
@@ -511,14 +869,14 @@ class AntlerScraper:
             candidate['antler_cofounder_type'] = sorted(list(antler_types_set))
         
         # Extract categories/tags (about me tags)
-        category_elements = container.find_all('div', class_='css-i310wq')
+        category_elements = by_class.get(('div', 'css-i310wq'))
         if category_elements:
             categories = []
             for cat_div in category_elements:
                 cat_p = cat_div.find('p', class_='css-olbwyb')
                 if cat_p:
                     cat_text = cat_p.get_text(strip=True)
-                    if cat_text not in ['Technology', 'Technical Software', 'Domain', 'Business']:
+                    if cat_text not in SECTION_HEADERS:
                         categories.append(cat_text)
             if categories:
                 candidate['categories'] = categories
@@ -539,40 +897,25 @@ class AntlerScraper:
             next_page = current_page + 1
             print(f"Looking for page {next_page} button...")
             
-            # Strategy 1: Look for button with specific next page number
-            try:
-                next_page_button = self.driver.find_element(By.XPATH, f"//button[.//div[text()='{next_page}']]")
-                if next_page_button.is_enabled() and next_page_button.is_displayed():
-                    print(f"Found page {next_page} button, clicking...")
-                    next_page_button.click()
-                    time.sleep(4)
-                    return True
-            except:
-                pass
-            
-            # Strategy 2: Look for any button containing the next page number
-            try:
-                buttons_with_next_page = self.driver.find_elements(By.XPATH, f"//button[contains(text(), '{next_page}')]")
-                for button in buttons_with_next_page:
-                    if button.is_enabled() and button.is_displayed():
-                        print(f"Found button with '{next_page}', clicking...")
-                        button.click()
-                        time.sleep(4)
-                        return True
-            except:
-                pass
-            
-            # Strategy 3: Look for next page arrow or similar
-            try:
-                next_buttons = self.driver.find_elements(By.XPATH, "//button[contains(@class, 'pagination') or contains(@aria-label, 'next') or contains(@class, 'next')]")
-                for button in next_buttons:
-                    if button.is_enabled() and button.is_displayed():
-                        print("Found next page arrow button, clicking...")
-                        button.click()
-                        time.sleep(4)
-                        return True
-            except:
-                pass
+            # Remember the current first card so we can tell when the next page has rendered
+            current_cards = self.driver.find_elements(By.CSS_SELECTOR, "div.css-iuxpug")
+            old_card = current_cards[0] if current_cards else None
+            
+            # Find and click the button in the browser: one WebDriver round trip instead of
+            # a find/is_enabled/is_displayed call per candidate button
+            xpaths = [
+                # Strategy 1: Look for button with specific next page number
+                f"//button[.//div[text()='{next_page}']]",
+                # Strategy 2: Look for any button containing the next page number
+                f"//button[contains(text(), '{next_page}')]",
+                # Strategy 3: Look for next page arrow or similar
+                "//button[contains(@class, 'pagination') or contains(@aria-label, 'next') or contains(@class, 'next')]"
+            ]
+            strategy = self.driver.execute_script(CLICK_FIRST_BUTTON_SCRIPT, xpaths)
+            if strategy:
+                print(f"Found page {next_page} button (strategy {strategy}), clicked")
+                self.wait_for_page_change(old_card)
+                return True
             
             print(f"No page {next_page} button found")
             return False
@@ -581,6 +924,30 @@ class AntlerScraper:
             print(f"Error navigating to next page: {e}")
             return False
             
+    def wait_for_page_change(self, old_card):
+        """
+        Wait until the previous page's first card is replaced or re-rendered
+        
+        Args:
+            old_card: First candidate card element before navigating, or None
+        """
+        if old_card is None:
+            return
+        
+        try:
+            old_text = old_card.text
+        except StaleElementReferenceException:
+            return
+        
+        def page_changed(driver):
+            try:
+                return old_card.text != old_text
+            except StaleElementReferenceException:
+                return True
+        
+        if not self.wait_for(page_changed, NAVIGATION_TIMEOUT):
+            print(f"Page did not change within {NAVIGATION_TIMEOUT}s after navigation")
+            
     def save_candidates(self, candidates: List[Dict]) -> int:
         """
         Save candidates to MongoDB
@@ -593,44 +960,101 @@ class AntlerScraper:
         """
         if not candidates:
             return 0
-            
-        inserted_count = 0
-        updated_count = 0
         
-        for candidate in candidates:
-            try:
-                if 'antler_profile_url' in candidate:
-                    result = self.collection.update_one(
-                        {'antler_profile_url': candidate['antler_profile_url']},
-                        {'$set': candidate},
-                        upsert=True
-                    )
-                else:
-                    result = self.collection.update_one(
-                        {'name': candidate['name']},
-                        {'$set': candidate},
-                        upsert=True
-                    )
-                    
-                if result.upserted_id:
-                    inserted_count += 1
-                elif result.modified_count > 0:
+        # One upsert per candidate, keyed the same way as the unique indexes
+        operations = [
+            UpdateOne(
+                {'antler_profile_url': candidate['antler_profile_url']} if 'antler_profile_url' in candidate
+                else {'name': candidate['name']},
+                {'$set': candidate},
+                upsert=True
+            )
+            for candidate in candidates
+        ]
+        
+        try:
+            # Unordered so a failing document doesn't stop the rest of the batch
+            result = self.collection.bulk_write(operations, ordered=False)
+            inserted_count = result.upserted_count
+            updated_count = result.modified_count
+        except errors.BulkWriteError as e:
+            inserted_count = e.details.get('nUpserted', 0)
+            updated_count = e.details.get('nModified', 0)
+            for write_error in e.details.get('writeErrors', []):
+                if write_error.get('code') == 11000:
+                    # Duplicate key: the candidate is already stored
                     updated_count += 1
-                    
-            except errors.DuplicateKeyError:
-                updated_count += 1
-            except Exception as e:
-                print(f"Error saving candidate {candidate.get('name', 'Unknown')}: {e}")
+                else:
+                    name = candidates[write_error['index']].get('name', 'Unknown')
+                    print(f"Error saving candidate {name}: {write_error.get('errmsg')}")
                 
         print(f"Saved {inserted_count} new candidates, updated {updated_count} existing")
+        self.known_names.update(candidate['name'] for candidate in candidates if candidate.get('name'))
         return inserted_count
         
-    def scrape(self, max_pages: int = 2):
+    def export_session(self) -> Dict[str, Any]:
+        """
+        Capture the logged-in browser session so other browsers can reuse it
+        
+        Returns:
+            Dictionary with the session cookies and localStorage contents
+        """
+        return {
+            'cookies': self.driver.get_cookies(),
+            'local_storage': self.driver.execute_script("return Object.assign({}, window.localStorage);")
+        }
+        
+    def restore_session(self, session: Dict[str, Any]):
+        """
+        Load a session captured by export_session into this browser and open the founders page
+        
+        Args:
+            session: Dictionary returned by export_session
+        """
+        # Cookies and storage can only be set for the domain that is currently open
+        self.driver.get(self.base_url)
+        for cookie in session['cookies']:
+            try:
+                self.driver.add_cookie(cookie)
+            except Exception as e:
+                print(f"Could not restore cookie {cookie.get('name')}: {e}")
+        self.driver.execute_script(
+            "for (const [key, value] of Object.entries(arguments[0])) { window.localStorage.setItem(key, value); }",
+            session['local_storage']
+        )
+        self.driver.get(self.founders_url)
+        
+    def scrape_pages_in_parallel(self, max_pages: int, workers: int) -> List[Dict]:
+        """
+        Scrape pages in separate processes, each with its own browser sharing this login
+        
+        Args:
+            max_pages: Number of pages to scrape
+            workers: Number of worker processes
+            
+        Returns:
+            Candidates from all pages, in page order
+        """
+        session = self.export_session()
+        jobs = [(page_num, session, self.headless, self.refresh) for page_num in range(1, max_pages + 1)]
+        
+        print(f"Scraping {max_pages} pages with {workers} worker processes...")
+        with Pool(processes=min(workers, max_pages)) as pool:
+            pages = pool.starmap(scrape_page_worker, jobs)
+        
+        all_candidates = []
+        for page_num, candidates in enumerate(pages, 1):
+            print(f"Found {len(candidates)} candidates on page {page_num}")
+            all_candidates.extend(candidates)
+        return all_candidates
+        
+    def scrape(self, max_pages: int = 2, workers: int = 1):
         """
         Main scraping function
         
         Args:
             max_pages: Maximum number of pages to scrape
+            workers: Number of browser processes to scrape pages with (default: 1, sequential)
         """
         try:
             self.setup_driver()
@@ -640,32 +1064,42 @@ class AntlerScraper:
                 print("Login failed. Exiting.")
                 return
                 
-            all_candidates = []
-            
-            for page_num in range(1, max_pages + 1):
-                print(f"\n--- Scraping page {page_num} ---")
+            if workers > 1 and max_pages > 1:
+                all_candidates = self.scrape_pages_in_parallel(max_pages, workers)
+                if all_candidates:
+                    self.save_candidates(all_candidates)
+            else:
+                all_candidates = []
                 
-                # Wait for candidates to load on every page, not just the first
-                if not self.wait_for_candidates_to_load():
-                    print(f"Failed to load candidates on page {page_num}")
-                    break
+                # Save each page in the background while the browser moves on to the next one.
+                # A single writer keeps the saves in page order.
+                with ThreadPoolExecutor(max_workers=1) as save_executor:
+                    saves = []
+                    for page_num in range(1, max_pages + 1):
+                        print(f"\n--- Scraping page {page_num} ---")
                         
-                candidates = self.scrape_current_page()
-                print(f"Found {len(candidates)} candidates on page {page_num}")
-                all_candidates.extend(candidates)
-                
-                if page_num < max_pages:
-                    if not self.navigate_to_next_page(page_num):
-                        print(f"Could not navigate to page {page_num + 1}. Stopping.")
-                        break
-                    # Give extra time after navigation for the page to start loading
-                    time.sleep(3)
+                        # Wait for candidates to load on every page, not just the first
+                        if not self.wait_for_candidates_to_load():
+                            print(f"Failed to load candidates on page {page_num}")
+                            break
+                                
+                        candidates = self.scrape_current_page()
+                        print(f"Found {len(candidates)} candidates on page {page_num}")
+                        all_candidates.extend(candidates)
+                        if candidates:
+                            saves.append(save_executor.submit(self.save_candidates, candidates))
+                        
+                        if page_num < max_pages:
+                            if not self.navigate_to_next_page(page_num):
+                                print(f"Could not navigate to page {page_num + 1}. Stopping.")
+                                break
+                    
+                    # Surface any error from the background saves
+                    for save in saves:
+                        save.result()
                     
             print(f"\n--- Scraping Complete ---")
             print(f"Total candidates found: {len(all_candidates)}")
-            
-            if all_candidates:
-                self.save_candidates(all_candidates)
                 
             total_in_db = self.collection.count_documents({})
             print(f"Total candidates in database: {total_in_db}")
@@ -686,18 +1120,64 @@ class AntlerScraper:
             print("Database connection closed")
             
 
+def scrape_page_worker(page_num: int, session: Dict[str, Any], headless: bool, refresh: bool) -> List[Dict]:
+    """
+    Scrape a single results page in its own browser (worker process for --workers)
+    
+    Pagination is driven by buttons rather than URLs, so the worker clicks through to its page
+    before parsing it.
+    
+    Args:
+        page_num: Page to scrape (1-based)
+        session: Logged-in session from AntlerScraper.export_session
+        headless: Run browser in headless mode
+        refresh: Re-scrape candidates that are already stored
+        
+    Returns:
+        List of candidate dictionaries from that page
+    """
+    # A profile directory can only be used by one Chrome at a time; workers get the session restored instead
+    scraper = AntlerScraper(headless=headless, refresh=refresh, profile_dir=None)
+    try:
+        scraper.setup_driver()
+        scraper.setup_mongodb()
+        scraper.restore_session(session)
+        
+        for current_page in range(1, page_num):
+            scraper.wait_for_candidates_to_load()
+            if not scraper.navigate_to_next_page(current_page):
+                print(f"Could not navigate to page {current_page + 1}. Skipping page {page_num}.")
+                return []
+        
+        print(f"\n--- Scraping page {page_num} ---")
+        scraper.wait_for_candidates_to_load()
+        return scraper.scrape_current_page()
+    except Exception as e:
+        print(f"Error scraping page {page_num}: {e}")
+        return []
+    finally:
+        scraper.cleanup()
+        
+
 def main():
     """Main entry point"""
+    parser = argparse.ArgumentParser(description='Scrape candidate profiles from Antler Hub')
+    parser.add_argument('--refresh', action='store_true',
+                        help='Re-scrape and update candidates that are already in the database')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Number of browser processes to scrape pages in parallel (default: 1)')
+    args = parser.parse_args()
+    
     print("=== Antler Hub Candidate Scraper ===\n")
     
     headless = input("Run in headless mode? (y/n, default: n): ").lower() == 'y'
     max_pages = input("Number of pages to scrape (default: 2): ").strip()
     max_pages = int(max_pages) if max_pages.isdigit() else 2
     
-    scraper = AntlerScraper(headless=headless)
+    scraper = AntlerScraper(headless=headless, refresh=args.refresh)
     
     try:
-        scraper.scrape(max_pages=max_pages)
+        scraper.scrape(max_pages=max_pages, workers=args.workers)
         print("\nScraping completed successfully!")
     except KeyboardInterrupt:
         print("\n\nScraping interrupted by user")
@@ -5,35 +5,300 @@ Scrapes phone numbers from individual candidate profiles and optionally updates
 """
 
 import os
+import re
 import sys
+import csv
+import json
 import time
+import signal
 import getpass
 import argparse
+from html import unescape
 from datetime import datetime, timezone
-from typing import List, Dict, Optional
+from multiprocessing import Pool
+from multiprocessing.util import Finalize
+from typing import List, Dict, Optional, Any, Iterable
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
-from pymongo import MongoClient, errors
+from webdriver_manager.core.os_manager import OperationSystemManager, ChromeType
+from bs4 import BeautifulSoup, SoupStrainer
+from pymongo import MongoClient, UpdateOne, errors
 from dotenv import load_dotenv
 
+# Documents per round trip when streaming candidates from MongoDB
+CANDIDATE_BATCH_SIZE = 200
+
+# Only the parent process talks to MongoDB (one read up front, one bulk_write at the end; workers never
+# connect), so a small pool kept warm across the scrape is all it needs
+MONGO_MAX_POOL_SIZE = 2
+MONGO_MIN_POOL_SIZE = 1
+
+# Delay between worker start-ups (per page) so parallel browsers don't hit Antler all at once
+WORKER_STAGGER_SECONDS = 0.1
+
+# Condition polling instead of fixed sleeps (seconds)
+WAIT_POLL_INTERVAL = 0.2
+PAGE_LOAD_TIMEOUT = 10
+LOGIN_TIMEOUT = 15
+NAVIGATION_TIMEOUT = 10
+
+# Login form locators: each alternative set is one union selector, so a lookup is a single WebDriver call
+EMAIL_SELECTOR = ", ".join((
+    "input[type='email']",
+    "input[name='email']",
+    "input[id*='email']",
+    "input[placeholder*='email' i]",
+    "input[autocomplete='email']"
+))
+PASSWORD_SELECTOR = ", ".join((
+    "input[type='password']",
+    "input[name='password']",
+    "input[id*='password']",
+    "input[placeholder*='password' i]"
+))
+LOGIN_BUTTON_XPATH = " | ".join((
+    "//button[@type='submit']",
+    "//button[contains(@class, 'login')]",
+    "//button[contains(@class, 'signin')]",
+    "//button[contains(text(), 'Log in')]",
+    "//button[contains(text(), 'Sign in')]",
+    "//input[@type='submit']"
+))
+
+# Chrome switches that skip background work the scraper never needs
+LEAN_BROWSER_FLAGS = [
+    '--disable-extensions', '--no-first-run', '--disable-background-networking', '--disable-sync',
+    '--metrics-recording-only', '--disable-renderer-backgrounding', '--disable-backgrounding-occluded-windows'
+]
+
+# Extra switches for headless runs, where nothing is drawn on screen
+HEADLESS_FLAGS = ['--headless=new', '--disable-gpu', '--disable-software-rasterizer']
+
+# Resolved chromedriver path, reused across runs while the installed Chrome version is unchanged
+# (same file as the candidate scraper, since both use the same chromedriver)
+DRIVER_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.antler_scraper_driver.json')
+
+# Persistent Chrome profile, so the Antler login (cookies/localStorage) survives between runs.
+# Separate from the candidate scraper's profile, since Chrome locks a profile to one running browser.
+PROFILE_DIR = os.path.join(os.path.expanduser('~'), '.antler_phone_scraper_profile')
+
+# Phones found by earlier runs (name -> phone and time found), so a re-run (e.g. dry run, then --save)
+# doesn't click Contact Info again for candidates scraped recently
+PHONE_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.antler_phone_cache.json')
+PHONE_CACHE_TTL = 86400  # seconds
+
+# Requests the phone scraper never needs: images, fonts, media and analytics/tracking scripts.
+# Stylesheets still load, since visibility checks (is_displayed) depend on them.
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*.mp4", "*.webm", "*.mp3",
+    "*google-analytics.com*", "*googletagmanager.com*", "*segment.io*", "*segment.com*",
+    "*hotjar.com*", "*intercom.io*", "*sentry.io*"
+]
+
+# How long to keep waiting for clicked Contact Info buttons after the last new phone showed up, in seconds.
+# The overall wait is capped at this much per clicked card, the budget each card had when clicked one by one.
+CONTACT_INFO_TIMEOUT = 2
+
+# Phone number matching, compiled once for every extractor
+PHONE_RE = re.compile(r'[\+]?[(]?[0-9]{1,4}[)]?[-\s\.]?[(]?[0-9]{1,4}[)]?[-\s\.]?[0-9]{1,5}[-\s\.]?[0-9]{1,5}')
+NON_DIGIT_RE = re.compile(r'\D')
+TEL_HREF_RE = re.compile(r'^tel:')
+TAG_RE = re.compile(r'<[^>]*>')
+TEL_LINK_RE = re.compile(r'<a\b[^>]*\bhref="tel:([^"]*)"')
+SCRIPT_STYLE_RE = re.compile(r'<(script|style)\b.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+
+# Only the candidate cards are needed from a page snapshot
+CARD_STRAINER = SoupStrainer('div', class_=lambda classes: classes is not None and 'css-iuxpug' in classes.split())
+
+# Reads every card on the page in one call: its element, name (text read like get_text(strip=True)),
+# full text, tel: links and whether it has a Contact Info button
+EXTRACT_CARDS_SCRIPT = """
+const text = (el) => {
+    if (!el) return null;
+    const walker = document.createTreeWalker(el, NodeFilter.SHOW_TEXT);
+    let out = '';
+    for (let node = walker.nextNode(); node; node = walker.nextNode()) {
+        out += node.nodeValue.trim();
+    }
+    return out;
+};
+return Array.from(document.querySelectorAll('div.css-iuxpug'), (card) => ({
+    element: card,
+    name: text(card.querySelector('p.css-5gltw')),
+    text: card.textContent,
+    tels: Array.from(card.querySelectorAll('a[href^="tel:"]'), (a) => a.getAttribute('href')),
+    has_contact_button: Array.from(card.querySelectorAll('button')).some((b) => b.textContent.includes('Contact Info'))
+}));
+"""
+
+# Clicks the Contact Info button of every given [card, expected name] pair in one call, without waiting in between.
+# A card that no longer shows the expected name (re-rendered) is not clicked, so a phone can't be misattributed.
+# Returns one boolean per pair: whether it was clicked.
+CLICK_CONTACT_INFO_SCRIPT = """
+const text = (el) => {
+    const walker = document.createTreeWalker(el, NodeFilter.SHOW_TEXT);
+    let out = '';
+    for (let node = walker.nextNode(); node; node = walker.nextNode()) {
+        out += node.nodeValue.trim();
+    }
+    return out;
+};
+return arguments[0].map(([card, expectedName]) => {
+    const nameElement = card.querySelector('p.css-5gltw');
+    if (!nameElement || text(nameElement) !== expectedName) {
+        return false;
+    }
+    const button = Array.from(card.querySelectorAll('button')).find((b) => b.textContent.includes('Contact Info'));
+    if (!button) {
+        return false;
+    }
+    button.scrollIntoView({block: 'center'});
+    button.click();
+    return true;
+});
+"""
+
+# Reads the text and tel: links of the given cards in one call
+READ_CARD_CONTACTS_SCRIPT = """
+return arguments[0].map((card) => ({
+    text: card.textContent,
+    tels: Array.from(card.querySelectorAll('a[href^="tel:"]'), (a) => a.getAttribute('href'))
+}));
+"""
+
+# Placeholder values shown in place of a phone number; never written to the database
+SENTINEL_PHONES = frozenset({
+    'NO PHONE',
+    'NOT FOUND - Could not click profile',
+    'NO PROFILE AVAILABLE',
+    'NOT FOUND - Candidate not in list'
+})
+
+
+def load_driver_cache(chrome_version: Optional[str]) -> Optional[str]:
+    """
+    Load the cached chromedriver path if it still matches the installed Chrome
+    
+    Args:
+        chrome_version: Installed Chrome version, or None if it could not be detected
+        
+    Returns:
+        Cached chromedriver path, or None if it must be resolved again
+    """
+    # Without a known Chrome version we can't tell whether the cached driver still fits
+    if not chrome_version or not os.path.exists(DRIVER_CACHE_FILE):
+        return None
+    try:
+        with open(DRIVER_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    # Re-resolve if the binary moved or lost its executable bit (e.g. the webdriver-manager cache was cleared)
+    path = cached.get('path', '')
+    if cached.get('chrome_version') == chrome_version and os.path.isfile(path) and os.access(path, os.X_OK):
+        return path
+    return None
+
+def save_driver_cache(path: str, chrome_version: Optional[str]):
+    """
+    Remember the resolved chromedriver path for the installed Chrome version
+    
+    Args:
+        path: Path to the chromedriver executable
+        chrome_version: Installed Chrome version, or None if it could not be detected
+    """
+    if not chrome_version:
+        return
+    try:
+        with open(DRIVER_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump({'path': path, 'chrome_version': chrome_version}, f)
+    except OSError as e:
+        print(f"Could not cache chromedriver path: {e}")
+
+def read_phone_cache_file() -> Dict[str, Dict]:
+    """
+    Read the raw phone cache
+    
+    Returns:
+        Dictionary of candidate name -> {'phone', 'found_at'}, empty if there is no usable cache
+    """
+    if not os.path.exists(PHONE_CACHE_FILE):
+        return {}
+    try:
+        with open(PHONE_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cached if isinstance(cached, dict) else {}
+
+def load_phone_cache(ttl: float) -> Dict[str, str]:
+    """
+    Load the phones found by earlier runs that are still fresh
+    
+    Args:
+        ttl: Maximum age of a cached phone in seconds
+        
+    Returns:
+        Dictionary of candidate name -> cached phone number
+    """
+    cutoff = time.time() - ttl
+    return {
+        name: entry['phone']
+        for name, entry in read_phone_cache_file().items()
+        if isinstance(entry, dict) and entry.get('phone') and entry.get('found_at', 0) >= cutoff
+    }
+
+def save_phone_cache(results: List[Dict], ttl: float):
+    """
+    Add the phones found in this run to the cache, dropping entries older than the TTL
+    
+    Args:
+        results: {'name', 'phone'} results of this run
+        ttl: Maximum age of a cached phone in seconds
+    """
+    now = time.time()
+    cached = {
+        name: entry
+        for name, entry in read_phone_cache_file().items()
+        if isinstance(entry, dict) and entry.get('found_at', 0) >= now - ttl
+    }
+    # Only found phones are cached, so candidates without one are tried again next run
+    for result in results:
+        if result['phone'] and result['phone'] not in SENTINEL_PHONES:
+            cached.setdefault(result['name'], {'phone': result['phone'], 'found_at': now})
+    try:
+        with open(PHONE_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(cached, f)
+    except OSError as e:
+        print(f"Could not cache phone numbers: {e}")
+
 
 class AntlerPhoneScraper:
     """Scraper for Antler Hub candidate phone numbers"""
     
-    def __init__(self, headless: bool = False, save_to_db: bool = False):
+    def __init__(self, headless: bool = False, save_to_db: bool = False, headed_login: bool = False,
+                 profile_dir: Optional[str] = PROFILE_DIR, cache_ttl: float = PHONE_CACHE_TTL,
+                 csv_path: Optional[str] = None):
         """
         Initialize the scraper
         
         Args:
             headless: Run browser in headless mode (default: False for debugging)
             save_to_db: Whether to save results to database (default: False)
+            headed_login: Log in with a visible browser, then continue headless (default: False)
+            profile_dir: Chrome user data directory to keep the login in, or None for a throwaway profile
+            cache_ttl: Seconds a phone found by an earlier run is reused without scraping again, 0 to disable
+            csv_path: CSV file to append each page's results to as soon as it is scraped (default: None, no CSV)
         """
         load_dotenv()
         self.mongo_uri = os.getenv('MONGO_URI')
@@ -52,15 +317,29 @@ class AntlerPhoneScraper:
         self.collection = None
         self.headless = headless
         self.save_to_db = save_to_db
-        self.results = []  # Store results for output
+        self.headed_login = headed_login
+        self.profile_dir = profile_dir
+        self.cache_ttl = cache_ttl
+        self.csv_path = csv_path
+        self.csv_file = None
+        self.csv_writer = None
+        self.pending_updates = []  # Phone updates waiting to be written in one batch
+        
+    def setup_driver(self, headless: Optional[bool] = None):
+        """
+        Setup Chrome driver with appropriate options
         
-    def setup_driver(self):
-        """Setup Chrome driver with appropriate options"""
+        Args:
+            headless: Override the scraper's headless setting for this browser
+        """
         print("Setting up Chrome driver...")
         options = Options()
         
-        if self.headless:
-            options.add_argument('--headless')
+        if self.headless if headless is None else headless:
+            for flag in HEADLESS_FLAGS:
+                options.add_argument(flag)
+        for flag in LEAN_BROWSER_FLAGS:
+            options.add_argument(flag)
             
         options.add_argument('--no-sandbox')
         options.add_argument('--disable-dev-shm-usage')
@@ -68,7 +347,50 @@ class AntlerPhoneScraper:
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option('useAutomationExtension', False)
         options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+        # Talk to the local chromedriver directly, even if HTTP(S)_PROXY is set in the environment
+        options.ignore_local_proxy_environment_variables()
+        
+        if self.profile_dir:
+            # Reusing the profile keeps us logged in, so login_if_needed can skip the login form
+            os.makedirs(self.profile_dir, exist_ok=True)
+            options.add_argument(f'--user-data-dir={self.profile_dir}')
+        
+        # Avatars play no part in phone extraction, and notification prompts only get in the way
+        options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.default_content_setting_values.notifications': 2
+        })
+        
+        chrome_version = OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE)
+        driver_path = load_driver_cache(chrome_version)
+        if driver_path:
+            print(f"Using cached chromedriver: {driver_path}")
+        else:
+            driver_path = self.resolve_chromedriver_path()
+            if driver_path:
+                save_driver_cache(driver_path, chrome_version)
+        
+        # Fallback to system chromedriver
+        service = Service(driver_path) if driver_path else Service()
+            
+        # Reuse one pooled HTTP connection to chromedriver for every WebDriver command
+        self.driver = webdriver.Chrome(service=service, options=options, keep_alive=True)
+        self.wait = WebDriverWait(self.driver, 20, poll_frequency=WAIT_POLL_INTERVAL)
         
+        # Skip downloading resources that play no part in scraping (Network.enable is only needed for the
+        # blocking: contact API responses aren't read, since a page's Contact Info buttons are clicked
+        # together and their responses can't be tied back to a card)
+        self.driver.execute_cdp_cmd('Network.enable', {})
+        self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+        print("Chrome driver setup complete")
+        
+    def resolve_chromedriver_path(self) -> Optional[str]:
+        """
+        Download/locate a chromedriver matching the installed Chrome with webdriver-manager
+        
+        Returns:
+            Path to the chromedriver executable, or None to use the system chromedriver
+        """
         # Fix for ARM Mac - find the actual chromedriver executable
         import platform
         import glob
@@ -96,24 +418,28 @@ class AntlerPhoneScraper:
             if chromedriver_path:
                 # Make sure it's executable
                 os.chmod(chromedriver_path, 0o755)
-                service = Service(chromedriver_path)
-            else:
-                # Fallback to system chromedriver
-                print("Could not find chromedriver in webdriver-manager cache, trying system chromedriver...")
-                service = Service()
-        else:
-            # For other systems, use the standard approach
-            service = Service(ChromeDriverManager().install())
+                return chromedriver_path
             
-        self.driver = webdriver.Chrome(service=service, options=options)
-        self.wait = WebDriverWait(self.driver, 20)
-        print("Chrome driver setup complete")
+            print("Could not find chromedriver in webdriver-manager cache, trying system chromedriver...")
+            return None
+        
+        # For other systems, use the standard approach
+        return ChromeDriverManager().install()
         
     def setup_mongodb(self):
         """Setup MongoDB connection and collection"""
         print("Connecting to MongoDB...")
         try:
-            self.db_client = MongoClient(self.mongo_uri, serverSelectionTimeoutMS=5000)
+            # retryWrites lets the final bulk_write survive a single dropped connection or failover;
+            # pymongo 4 always enables TCP keepalive, so there is no socketKeepAlive option
+            self.db_client = MongoClient(
+                self.mongo_uri,
+                serverSelectionTimeoutMS=5000,
+                maxPoolSize=MONGO_MAX_POOL_SIZE,
+                minPoolSize=MONGO_MIN_POOL_SIZE,
+                retryWrites=True,
+                appname='scrape_phone'
+            )
             self.db_client.server_info()
             
             self.db = self.db_client['last-recruiter-mvp']
@@ -124,14 +450,68 @@ class AntlerPhoneScraper:
             print("Failed to connect to MongoDB. Please check your connection string.")
             raise
             
+    def wait_for(self, condition, timeout: float) -> bool:
+        """
+        Poll until a condition holds instead of sleeping for a fixed time
+        
+        Args:
+            condition: Callable taking the driver, e.g. an expected_conditions predicate
+            timeout: Maximum number of seconds to wait
+            
+        Returns:
+            True if the condition was met, False on timeout
+        """
+        try:
+            WebDriverWait(
+                self.driver, timeout, poll_frequency=WAIT_POLL_INTERVAL,
+                ignored_exceptions=(StaleElementReferenceException,)
+            ).until(condition)
+            return True
+        except TimeoutException:
+            return False
+    
+    def is_login_url(self, url: str) -> bool:
+        """Check whether a URL is one of the login/auth pages"""
+        url = url.lower()
+        return "login" in url or "signin" in url or "auth" in url
+        
+    def candidates_present(self):
+        """Expected condition that holds once candidate cards or names are in the DOM"""
+        return EC.any_of(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "div.css-iuxpug")),
+            EC.presence_of_element_located((By.CSS_SELECTOR, "p.css-5gltw"))
+        )
+        
+    def find_visible_element(self, by: str, selector: str, require_enabled: bool = False):
+        """
+        Find the first visible element matching a (union) selector in one lookup
+        
+        Args:
+            by: Locator strategy, e.g. By.CSS_SELECTOR or By.XPATH
+            selector: Selector, possibly combining several alternatives
+            require_enabled: Also require the element to be enabled
+            
+        Returns:
+            The first visible match, else the first match, else None
+        """
+        elements = self.driver.find_elements(by, selector)
+        for element in elements:
+            try:
+                if element.is_displayed() and (not require_enabled or element.is_enabled()):
+                    return element
+            except StaleElementReferenceException:
+                continue
+        return elements[0] if elements else None
+        
     def login_if_needed(self):
         """Handle login if required"""
         print(f"Navigating to {self.founders_url}...")
         self.driver.get(self.founders_url)
-        time.sleep(3)
+        # Either we get redirected to a login page or the candidates start rendering
+        self.wait_for(EC.any_of(lambda d: self.is_login_url(d.current_url), self.candidates_present()), PAGE_LOAD_TIMEOUT)
         
         current_url = self.driver.current_url
-        if "login" in current_url.lower() or "signin" in current_url.lower() or "auth" in current_url.lower():
+        if self.is_login_url(current_url):
             print("\nLogin required...")
             
             # Use credentials from .env if available
@@ -146,25 +526,10 @@ class AntlerPhoneScraper:
             
             try:
                 # Wait for login form to be fully loaded
-                time.sleep(2)
+                self.wait_for(EC.presence_of_element_located((By.CSS_SELECTOR, EMAIL_SELECTOR)), PAGE_LOAD_TIMEOUT)
                 
                 # Try multiple selectors for email field
-                email_selectors = [
-                    "input[type='email']",
-                    "input[name='email']",
-                    "input[id*='email']",
-                    "input[placeholder*='email' i]",
-                    "input[autocomplete='email']"
-                ]
-                
-                email_field = None
-                for selector in email_selectors:
-                    try:
-                        email_field = self.driver.find_element(By.CSS_SELECTOR, selector)
-                        if email_field.is_displayed():
-                            break
-                    except:
-                        continue
+                email_field = self.find_visible_element(By.CSS_SELECTOR, EMAIL_SELECTOR)
                 
                 if not email_field:
                     raise Exception("Could not find email field")
@@ -172,24 +537,12 @@ class AntlerPhoneScraper:
                 # Clear and enter email
                 email_field.clear()
                 email_field.send_keys(email)
-                time.sleep(1)
                 
-                # Try multiple selectors for password field
-                password_selectors = [
-                    "input[type='password']",
-                    "input[name='password']",
-                    "input[id*='password']",
-                    "input[placeholder*='password' i]"
-                ]
+                # The password field may only render after the email has been entered
+                self.wait_for(EC.presence_of_element_located((By.CSS_SELECTOR, PASSWORD_SELECTOR)), PAGE_LOAD_TIMEOUT)
                 
-                password_field = None
-                for selector in password_selectors:
-                    try:
-                        password_field = self.driver.find_element(By.CSS_SELECTOR, selector)
-                        if password_field.is_displayed():
-                            break
-                    except:
-                        continue
+                # Try multiple selectors for password field
+                password_field = self.find_visible_element(By.CSS_SELECTOR, PASSWORD_SELECTOR)
                 
                 if not password_field:
                     raise Exception("Could not find password field")
@@ -197,31 +550,9 @@ class AntlerPhoneScraper:
                 # Clear and enter password
                 password_field.clear()
                 password_field.send_keys(password)
-                time.sleep(1)
                 
                 # Find and click login button
-                login_button_selectors = [
-                    "button[type='submit']",
-                    "button[class*='login']",
-                    "button[class*='signin']",
-                    "button:contains('Log in')",
-                    "button:contains('Sign in')",
-                    "input[type='submit']"
-                ]
-                
-                login_button = None
-                for selector in login_button_selectors:
-                    try:
-                        if ':contains' in selector:
-                            # Use XPath for text content
-                            text = selector.split("'")[1]
-                            login_button = self.driver.find_element(By.XPATH, f"//button[contains(text(), '{text}')]")
-                        else:
-                            login_button = self.driver.find_element(By.CSS_SELECTOR, selector)
-                        if login_button.is_displayed() and login_button.is_enabled():
-                            break
-                    except:
-                        continue
+                login_button = self.find_visible_element(By.XPATH, LOGIN_BUTTON_XPATH, require_enabled=True)
                 
                 if login_button:
                     login_button.click()
@@ -231,13 +562,17 @@ class AntlerPhoneScraper:
                 
                 print("Logging in...")
                 
-                # Wait for login to complete
-                time.sleep(5)
+                # Wait for login to complete: we leave the login page or an error shows up
+                self.wait_for(
+                    lambda d: not self.is_login_url(d.current_url)
+                    or any(e.is_displayed() for e in d.find_elements(By.CSS_SELECTOR, "[class*='error'], [class*='alert']")),
+                    LOGIN_TIMEOUT
+                )
                 
                 # Navigate to founders page
                 print(f"Navigating to founders page: {self.founders_url}")
                 self.driver.get(self.founders_url)
-                time.sleep(4)
+                self.wait_for(EC.url_contains("/cohort/founder"), PAGE_LOAD_TIMEOUT)
                     
             except Exception as e:
                 print(f"Login process encountered an error: {e}")
@@ -245,7 +580,6 @@ class AntlerPhoneScraper:
                 input("Press Enter after you've logged in manually...")
                 # After manual login, navigate to founders page
                 self.driver.get(self.founders_url)
-                time.sleep(3)
                 
         return True
         
@@ -253,200 +587,145 @@ class AntlerPhoneScraper:
         """Wait for candidate cards to load on the page"""
         print("Waiting for candidates to load...")
         
-        # Give the page a moment to start loading
-        time.sleep(5)
+        # Resolve as soon as candidates are in the DOM
+        if self.wait_for(self.candidates_present(), PAGE_LOAD_TIMEOUT):
+            print("Candidates loaded")
+            return True
         
-        # Check if candidates are already loaded
+        # If not loaded yet, scroll to trigger any lazy loading and wait once more
+        print(f"Candidates not visible after {PAGE_LOAD_TIMEOUT}s, scrolling and waiting...")
         try:
-            candidate_containers = self.driver.find_elements(By.CSS_SELECTOR, "div.css-iuxpug")
-            if candidate_containers:
-                print(f"Candidates already loaded: {len(candidate_containers)} found")
-                return True
-            
-            name_elements = self.driver.find_elements(By.CSS_SELECTOR, "p.css-5gltw")
-            if name_elements:
-                print(f"Candidate names already loaded: {len(name_elements)} found")
-                return True
-        except:
-            pass
+            self.driver.execute_script("window.scrollTo(0, 500)")
+            self.driver.execute_script("window.scrollTo(0, 0)")
+        except Exception as e:
+            print(f"Error during wait: {e}")
         
-        # If not loaded yet, wait with polling
-        print("Candidates not immediately visible, waiting...")
-        max_wait_time = 15  # seconds
-        wait_interval = 3   # seconds
-        total_waited = 0
+        if self.wait_for(self.candidates_present(), PAGE_LOAD_TIMEOUT):
+            print("Candidates loaded")
+            return True
         
-        while total_waited < max_wait_time:
-            print(f"Still waiting for candidates... ({total_waited}s elapsed)")
-            
+        print("Proceeding with scraping regardless...")
+        return True
+        
+    def export_session(self) -> Dict[str, Any]:
+        """
+        Capture the logged-in browser session so other browsers can reuse it
+        
+        Returns:
+            Dictionary with the session cookies and localStorage contents
+        """
+        return {
+            'cookies': self.driver.get_cookies(),
+            'local_storage': self.driver.execute_script("return Object.assign({}, window.localStorage);")
+        }
+        
+    def restore_session(self, session: Dict[str, Any]):
+        """
+        Load a session captured by export_session into this browser
+        
+        Args:
+            session: Dictionary returned by export_session
+        """
+        # Cookies and storage can only be set for the domain that is currently open
+        self.driver.get(self.base_url)
+        for cookie in session['cookies']:
             try:
-                # Scroll to trigger any lazy loading
-                self.driver.execute_script("window.scrollTo(0, 500)")
-                time.sleep(1)
-                self.driver.execute_script("window.scrollTo(0, 0)")
-                
-                # Check again
-                candidate_containers = self.driver.find_elements(By.CSS_SELECTOR, "div.css-iuxpug")
-                if candidate_containers:
-                    print(f"Found {len(candidate_containers)} candidate containers")
-                    return True
-                
-                name_elements = self.driver.find_elements(By.CSS_SELECTOR, "p.css-5gltw")
-                if name_elements:
-                    print(f"Found {len(name_elements)} name elements")
-                    return True
-                    
+                self.driver.add_cookie(cookie)
             except Exception as e:
-                print(f"Error during wait: {e}")
-            
-            time.sleep(wait_interval)
-            total_waited += wait_interval
+                print(f"Could not restore cookie {cookie.get('name')}: {e}")
+        self.driver.execute_script(
+            "for (const [key, value] of Object.entries(arguments[0] || {})) { window.localStorage.setItem(key, value); }",
+            session['local_storage']
+        )
         
-        print("Proceeding with scraping regardless...")
-        return True
+    def switch_to_headless(self):
+        """Carry the logged-in session from the visible login browser over to a new headless one"""
+        print("Logged in, continuing in a headless browser...")
+        session = self.export_session()
+        self.driver.quit()
+        self.setup_driver(headless=True)
+        self.restore_session(session)
+        self.driver.get(self.founders_url)
         
-    def get_candidates_without_phone(self) -> List[Dict]:
+    def get_candidates_without_phone(self) -> Iterable[Dict]:
         """
-        Get list of candidates from MongoDB that don't have phone numbers
+        Stream candidates from MongoDB that don't have phone numbers
         
         Returns:
-            List of candidate documents without phone numbers
+            Cursor over {'_id', 'name'} documents of candidates without phone numbers
         """
-        # Find candidates without phone numbers or with empty phone field
+        # Find candidates without phone numbers or with empty phone field ($in with None also matches a missing field)
         # Exclude the test account
         query = {
-            '$and': [
-                {'name': {'$ne': 'Chris (Test) Klam'}},
-                {'$or': [
-                    {'phone': {'$exists': False}},
-                    {'phone': ''},
-                    {'phone': None}
-                ]}
-            ]
+            'name': {'$ne': 'Chris (Test) Klam'},
+            'phone': {'$in': [None, '']}
         }
         
-        candidates = list(self.collection.find(query))
-        print(f"Found {len(candidates)} candidates without phone numbers")
-        return candidates
+        # Only the name and id are needed, so don't pull whole profiles over the wire
+        return self.collection.find(query, {'_id': 1, 'name': 1}).batch_size(CANDIDATE_BATCH_SIZE)
         
-    def get_candidate_contact_info(self, name: str) -> Optional[str]:
+    def get_existing_phones(self) -> Dict[str, str]:
         """
-        Get contact info for a candidate by clicking Contact Info button
+        Load the candidates that already have a phone number, in one query
         
-        Args:
-            name: Name of the candidate
-            
         Returns:
-            Phone number if found, None otherwise
+            Dictionary of candidate name -> stored phone number
         """
-        try:
-            # Handle special case for Michiel
-            search_name = name
-            if name == 'Michiel Voortman':
-                try:
-                    elem = self.driver.find_element(By.XPATH, "//p[@class='css-5gltw' and text()='Michiel(you)']")
-                    if elem:
-                        search_name = 'Michiel(you)'
-                except:
-                    pass
-            
-            # Find all candidate containers
-            containers = self.driver.find_elements(By.CSS_SELECTOR, "div.css-iuxpug")
-            
-            for container in containers:
-                try:
-                    # Check if this container has the candidate's name
-                    name_elem = container.find_element(By.CSS_SELECTOR, "p.css-5gltw")
-                    if name_elem.text.strip() != search_name:
-                        continue
-                    
-                    # Found the right container, look for Contact Info button
-                    try:
-                        contact_btn = container.find_element(By.XPATH, ".//button[contains(., 'Contact Info') or contains(., 'Contact info')]")
-                        
-                        # Scroll into view
-                        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", contact_btn)
-                        time.sleep(1)
-                        
-                        # Click using JavaScript to avoid interception
-                        self.driver.execute_script("arguments[0].click();", contact_btn)
-                        time.sleep(2)
-                        
-                        # Extract phone from the revealed contact info
-                        phone = self.extract_phone_from_container(container)
-                        if phone:
-                            return phone
-                        
-                        # Check if a modal opened with contact info
-                        try:
-                            modal = self.driver.find_element(By.CSS_SELECTOR, "[role='dialog'], .modal, .popup")
-                            if modal.is_displayed():
-                                phone = self.extract_phone_from_element(modal)
-                                if phone:
-                                    return phone
-                        except:
-                            pass
-                        
-                        return None
-                        
-                    except:
-                        # No Contact Info button - try to find phone directly in container
-                        phone = self.extract_phone_from_container(container)
-                        if phone:
-                            return phone
-                        
-                        print(f"No contact info available for {name}")
-                        return None
-                        
-                except:
-                    continue
-            
-            # Candidate not found on this page
-            return None
-            
-        except:
-            return None
-            
-    def extract_phone_from_container(self, container) -> Optional[str]:
-        """Extract phone from a web element container"""
-        try:
-            html = container.get_attribute('innerHTML')
-            soup = BeautifulSoup(html, 'lxml')
-            return self.extract_phone_from_soup(soup)
-        except:
-            return None
-            
+        existing = {}
+        for doc in self.collection.find({'phone': {'$nin': [None, '']}}, {'name': 1, 'phone': 1}):
+            phone = doc.get('phone')
+            if doc.get('name') and isinstance(phone, str) and phone.strip():
+                existing[doc['name']] = phone
+        print(f"{len(existing)} candidates already have a phone number")
+        return existing
+        
     def extract_phone_from_element(self, element) -> Optional[str]:
         """Extract phone from a web element"""
         try:
-            html = element.get_attribute('innerHTML')
-            soup = BeautifulSoup(html, 'lxml')
-            return self.extract_phone_from_soup(soup)
+            return self.extract_phone_from_html(element.get_attribute('innerHTML'))
         except:
             return None
             
-    def extract_phone_from_soup(self, soup) -> Optional[str]:
-        """Extract phone number from BeautifulSoup object"""
-        import re
-        phone_pattern = re.compile(r'[\+]?[(]?[0-9]{1,4}[)]?[-\s\.]?[(]?[0-9]{1,4}[)]?[-\s\.]?[0-9]{1,5}[-\s\.]?[0-9]{1,5}')
+    def extract_phone_from_html(self, html: str) -> Optional[str]:
+        """
+        Extract phone number from an element's HTML with regexes, without building a parse tree
         
-        # Check all text elements
-        all_text = soup.get_text()
-        matches = phone_pattern.findall(all_text)
+        Args:
+            html: innerHTML of a candidate card, or a whole page
+            
+        Returns:
+            Phone number string or None if not found
+        """
+        # Tags are stripped the same way get_text() joins text nodes
+        return self.extract_phone_from_text(
+            unescape(TAG_RE.sub('', html)),
+            [unescape(href) for href in TEL_LINK_RE.findall(html)]
+        )
+        
+    def extract_phone_from_text(self, text: str, tel_hrefs: List[str]) -> Optional[str]:
+        """
+        Extract phone number from an element's text, falling back to its tel: links
+        
+        Args:
+            text: All text of the element
+            tel_hrefs: href values of its tel: links
+            
+        Returns:
+            Phone number string or None if not found
+        """
+        matches = PHONE_RE.findall(text)
         
         for match in matches:
             # Validate it's a reasonable phone number (at least 7 digits)
-            digits_only = re.sub(r'\D', '', match)
+            digits_only = NON_DIGIT_RE.sub('', match)
             if len(digits_only) >= 7:
                 return match
         
         # Look for tel: links
-        tel_links = soup.find_all('a', href=re.compile(r'^tel:'))
-        if tel_links:
-            for link in tel_links:
-                phone = link.get('href').replace('tel:', '').strip()
-                if phone:
-                    return phone
+        for href in tel_hrefs:
+            phone = href.replace('tel:', '').strip()
+            if phone:
+                return phone
         
         return None
             
@@ -459,58 +738,14 @@ class AntlerPhoneScraper:
         """
         try:
             # Wait for profile to fully load
-            time.sleep(2)
-            
-            # Parse the page
-            soup = BeautifulSoup(self.driver.page_source, 'lxml')
-            
-            # Look for phone number in various possible locations
-            # Strategy 1: Look for elements with phone-like text patterns
-            import re
-            phone_pattern = re.compile(r'[\+]?[(]?[0-9]{1,4}[)]?[-\s\.]?[(]?[0-9]{1,4}[)]?[-\s\.]?[0-9]{1,5}[-\s\.]?[0-9]{1,5}')
-            
-            # Check all text elements
-            all_text_elements = soup.find_all(['p', 'span', 'div'], string=True)
-            
-            for element in all_text_elements:
-                text = element.get_text(strip=True)
-                if text:
-                    # Look for phone patterns
-                    match = phone_pattern.search(text)
-                    if match:
-                        phone = match.group(0)
-                        # Validate it's a reasonable phone number (at least 7 digits)
-                        digits_only = re.sub(r'\D', '', phone)
-                        if len(digits_only) >= 7:
-                            print(f"Found phone number: {phone}")
-                            return phone
-            
-            # Strategy 2: Look for specific phone-related labels
-            phone_labels = ['Phone', 'Mobile', 'Cell', 'Contact', 'Number', 'Tel']
-            for label in phone_labels:
-                # Look for label followed by number
-                label_element = soup.find(string=re.compile(label, re.IGNORECASE))
-                if label_element:
-                    parent = label_element.parent
-                    if parent:
-                        # Check parent and siblings for phone number
-                        parent_text = parent.get_text(strip=True)
-                        match = phone_pattern.search(parent_text)
-                        if match:
-                            phone = match.group(0)
-                            digits_only = re.sub(r'\D', '', phone)
-                            if len(digits_only) >= 7:
-                                print(f"Found phone number near '{label}': {phone}")
-                                return phone
-            
-            # Strategy 3: Look for tel: links
-            tel_links = soup.find_all('a', href=re.compile(r'^tel:'))
-            if tel_links:
-                for link in tel_links:
-                    phone = link.get('href').replace('tel:', '').strip()
-                    if phone:
-                        print(f"Found phone number in tel link: {phone}")
-                        return phone
+            self.wait_for(lambda d: d.execute_script("return document.readyState") == 'complete', PAGE_LOAD_TIMEOUT)
+            
+            # Same text and tel: link search as for cards, minus inline scripts/styles (ids and
+            # timestamps in embedded JSON would look like phone numbers)
+            phone = self.extract_phone_from_html(SCRIPT_STYLE_RE.sub('', self.driver.page_source))
+            if phone:
+                print(f"Found phone number: {phone}")
+                return phone
             
             print("No phone number found on profile")
             return None
@@ -524,11 +759,10 @@ class AntlerPhoneScraper:
         try:
             # Try using browser back button
             self.driver.back()
-            time.sleep(3)
         except:
             # If back doesn't work, navigate directly
             self.driver.get(self.founders_url)
-            time.sleep(4)
+        self.wait_for(self.candidates_present(), PAGE_LOAD_TIMEOUT)
             
     def navigate_to_page(self, page_num: int) -> bool:
         """
@@ -546,6 +780,10 @@ class AntlerPhoneScraper:
         try:
             print(f"Looking for page {page_num} button...")
             
+            # Remember the current first card so we can tell when the new page has rendered
+            current_cards = self.driver.find_elements(By.CSS_SELECTOR, "div.css-iuxpug")
+            old_card = current_cards[0] if current_cards else None
+            
             # Strategy 1: Look for button with specific page number
             try:
                 page_button = self.driver.find_element(By.XPATH, f"//button[.//div[text()='{page_num}']]")
@@ -553,9 +791,8 @@ class AntlerPhoneScraper:
                     print(f"Found page {page_num} button, clicking...")
                     # Scroll into view and use JavaScript click
                     self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", page_button)
-                    time.sleep(1)
                     self.driver.execute_script("arguments[0].click();", page_button)
-                    time.sleep(4)
+                    self.wait_for_page_change(old_card)
                     return True
             except:
                 pass
@@ -567,9 +804,8 @@ class AntlerPhoneScraper:
                     if button.is_enabled() and button.is_displayed():
                         print(f"Found button with '{page_num}', clicking...")
                         self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", button)
-                        time.sleep(1)
                         self.driver.execute_script("arguments[0].click();", button)
-                        time.sleep(4)
+                        self.wait_for_page_change(old_card)
                         return True
             except:
                 pass
@@ -581,43 +817,173 @@ class AntlerPhoneScraper:
             print(f"Error navigating to page {page_num}: {e}")
             return False
             
-    def update_candidate_phone(self, candidate_id, phone: str):
+    def wait_for_page_change(self, old_card):
         """
-        Update candidate's phone number in MongoDB (if save_to_db is True)
+        Wait until the previous page's first card is replaced or re-rendered
         
         Args:
-            candidate_id: MongoDB document ID
-            phone: Phone number to save
+            old_card: First candidate card element before navigating, or None
         """
-        if self.save_to_db:
+        if old_card is None:
+            return
+        
+        try:
+            old_text = old_card.text
+        except StaleElementReferenceException:
+            return
+        
+        def page_changed(driver):
             try:
-                result = self.collection.update_one(
-                    {'_id': candidate_id},
-                    {'$set': {'phone': phone}}
-                )
-                if result.modified_count > 0:
-                    print(f"  → Saved to database")
-            except Exception as e:
-                print(f"Error updating phone in database: {e}")
+                return old_card.text != old_text
+            except StaleElementReferenceException:
+                return True
+        
+        if not self.wait_for(page_changed, NAVIGATION_TIMEOUT):
+            print(f"Page did not change within {NAVIGATION_TIMEOUT}s after navigation")
+            
+    def click_contact_info(self, cards: List[List]) -> List[bool]:
+        """
+        Click the Contact Info button of several cards with one script call
+        
+        Args:
+            cards: [card element, name the card is expected to show] pairs
+            
+        Returns:
+            Per card, True if clicked, False if it has no button or no longer shows that name
+        """
+        if not cards:
+            return []
+        return [bool(clicked) for clicked in self.driver.execute_script(CLICK_CONTACT_INFO_SCRIPT, cards)]
+        
+    def wait_for_contact_phones(self, containers: List) -> List[Optional[str]]:
+        """
+        Wait for several clicked cards to reveal their phone numbers, reading all of them per poll
+        
+        Args:
+            containers: Candidate cards whose Contact Info button was just clicked
+            
+        Returns:
+            Phone per card, None for cards that showed none in time
+        """
+        phones = [None] * len(containers)
+        last_change = {'phones': list(phones), 'at': time.monotonic()}
+        
+        def settled(driver):
+            rows = driver.execute_script(READ_CARD_CONTACTS_SCRIPT, containers)
+            for index, row in enumerate(rows):
+                phones[index] = self.extract_phone_from_text(row['text'], row['tels'])
+            if all(phones):
+                return True
+            # Cards without a phone never reveal one, so stop once the reveals have stopped coming in
+            if phones != last_change['phones']:
+                last_change.update(phones=list(phones), at=time.monotonic())
+            return time.monotonic() - last_change['at'] >= CONTACT_INFO_TIMEOUT
+        
+        if containers:
+            self.wait_for(settled, CONTACT_INFO_TIMEOUT * len(containers))
+        return phones
+        
+    def update_candidate_phone(self, name: str, phone: str):
+        """
+        Queue an update of a candidate's phone number (if save_to_db is True)
+        
+        Args:
+            name: Candidate name (unique in the collection)
+            phone: Phone number to save
+        """
+        # Nothing to write when no phone was found
+        if self.save_to_db and phone and phone not in SENTINEL_PHONES:
+            self.pending_updates.append(UpdateOne({'name': name}, {'$set': {'phone': phone}}))
+            
+    def flush_updates(self):
+        """Write all queued phone updates to MongoDB in a single unordered bulk_write"""
+        if not self.pending_updates:
+            return
+        
+        updates, self.pending_updates = self.pending_updates, []
+        try:
+            result = self.collection.bulk_write(updates, ordered=False)
+            print(f"  → Saved {result.modified_count} phone numbers to database")
+        except errors.BulkWriteError as e:
+            print(f"  → Saved {e.details.get('nModified', 0)} phone numbers to database")
+            for write_error in e.details.get('writeErrors', []):
+                print(f"Error updating phone in database: {write_error.get('errmsg')}")
+        except Exception as e:
+            print(f"Error updating phones in database: {e}")
+            
+    def read_page_cards(self) -> List[Dict]:
+        """
+        Read every candidate card on the page with a single script run in the page
+        
+        Returns:
+            Rows with the card 'element', 'name', 'text', 'tels' and 'has_contact_button'
+        """
+        try:
+            rows = self.driver.execute_script(EXTRACT_CARDS_SCRIPT)
+            if isinstance(rows, list):
+                return rows
+        except Exception as e:
+            print(f"In-browser extraction failed, parsing page source instead: {e}")
+        return self.read_page_cards_from_source()
+        
+    def read_page_cards_from_source(self) -> List[Dict]:
+        """
+        Read every candidate card from one page_source snapshot (fallback for read_page_cards)
+        
+        Returns:
+            Rows shaped like read_page_cards
+        """
+        soup = BeautifulSoup(self.driver.page_source, 'lxml', parse_only=CARD_STRAINER)
+        cards = soup.find_all('div', class_='css-iuxpug')
+        
+        # Elements are only needed for the cards whose Contact Info gets clicked
+        containers = self.driver.find_elements(By.CSS_SELECTOR, "div.css-iuxpug")
+        if len(cards) != len(containers):
+            print(f"Page changed while reading it ({len(cards)} cards in snapshot), names are checked before each click")
+        
+        rows = []
+        for index, card in enumerate(cards):
+            name_elem = card.find('p', class_='css-5gltw')
+            rows.append({
+                'element': containers[index] if index < len(containers) else None,
+                'name': name_elem.get_text(strip=True) if name_elem else None,
+                'text': card.get_text(),
+                'tels': [link.get('href') for link in card.find_all('a', href=TEL_HREF_RE)],
+                'has_contact_button': any('Contact Info' in button.get_text() for button in card.find_all('button'))
+            })
+        return rows
+        
+    def scrape_current_page_phones(self, existing_phones: Dict[str, str],
+                                   cached_phones: Optional[Dict[str, str]] = None) -> List[Dict]:
+        """
+        Scrape phone numbers from candidates on current page (only for those missing phone numbers)
+        
+        Args:
+            existing_phones: Stored phone numbers by candidate name, from get_existing_phones
+            cached_phones: Phones found by recent runs by candidate name, reused without clicking
             
-    def scrape_current_page_phones(self) -> List[Dict]:
-        """Scrape phone numbers from candidates on current page (only for those missing phone numbers)"""
+        Returns:
+            List of {'name', 'phone'} results
+        """
         results = []
         
         print("Scraping phone numbers from current page...")
         
-        # Find all candidate containers
-        containers = self.driver.find_elements(By.CSS_SELECTOR, "div.css-iuxpug")
-        print(f"Found {len(containers)} candidate containers")
+        # Read names, buttons and visible phones for all cards at once instead of querying each card
+        rows = self.read_page_cards()
+        print(f"Found {len(rows)} candidate containers")
         
         processed = 0
         skipped = 0
+        to_click = []  # (result index, card element, displayed name, name) for cards to reveal
         
-        for container in containers:
+        for row in rows:
             try:
                 # Get candidate name
-                name_elem = container.find_element(By.CSS_SELECTOR, "p.css-5gltw")
-                name = name_elem.text.strip()
+                raw_name = row.get('name')
+                if not raw_name:
+                    raise ValueError("card has no name")
+                name = raw_name
                 
                 # Normalize Michiel(you) to Michiel Voortman
                 if name == 'Michiel(you)':
@@ -630,35 +996,31 @@ class AntlerPhoneScraper:
                     continue
                 
                 # Check if this candidate already has a phone number in database
-                existing_candidate = self.collection.find_one({'name': name})
-                if existing_candidate and existing_candidate.get('phone') and existing_candidate.get('phone').strip():
-                    print(f"Skipping {name}: already has phone {existing_candidate.get('phone')}")
+                if name in existing_phones:
+                    print(f"Skipping {name}: already has phone {existing_phones[name]}")
                     skipped += 1
                     continue
                 
-                phone = None
+                # Found by a recent run: reuse it instead of clicking Contact Info again
+                if cached_phones and name in cached_phones:
+                    print(f"Processed {name}: {cached_phones[name]} (cached)")
+                    results.append({'name': name, 'phone': cached_phones[name]})
+                    processed += 1
+                    continue
                 
-                # Look for Contact Info button
-                try:
-                    contact_btn = container.find_element(By.XPATH, ".//button[contains(., 'Contact Info')]")
-                    
-                    # Scroll into view
-                    self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", contact_btn)
-                    time.sleep(1)
-                    
-                    # Click using JavaScript to avoid interception
-                    self.driver.execute_script("arguments[0].click();", contact_btn)
-                    time.sleep(2)
-                    
-                    # Extract phone from the container after clicking
-                    phone = self.extract_phone_from_container(container)
-                    
-                    print(f"Processed {name}: {phone if phone else 'NO PHONE'}")
-                    
-                except:
-                    # No Contact Info button - try to find phone directly
-                    phone = self.extract_phone_from_container(container)
+                # A phone that is already visible on the card needs no click
+                phone = self.extract_phone_from_text(row['text'], row['tels'])
+                container = row['element']
+                
+                if not row['has_contact_button']:
                     print(f"No Contact Info button for {name}: {phone if phone else 'NO PHONE'}")
+                elif phone:
+                    print(f"Processed {name}: {phone} (already visible)")
+                elif container is None:
+                    print(f"Could not click Contact Info for {name}: NO PHONE")
+                else:
+                    # Clicked together with the rest of the page below
+                    to_click.append((len(results), container, raw_name, name))
                 
                 results.append({
                     'name': name,
@@ -670,85 +1032,166 @@ class AntlerPhoneScraper:
                 print(f"Error processing container: {e}")
                 continue
         
+        # Click every Contact Info button at once, then wait for all of them together instead of one by one
+        if to_click:
+            try:
+                clicked = self.click_contact_info([[container, raw_name] for _, container, raw_name, _ in to_click])
+                for (_, _, _, name), was_clicked in zip(to_click, clicked):
+                    if not was_clicked:
+                        print(f"Could not click Contact Info for {name}: NO PHONE")
+                
+                to_click = [card for card, was_clicked in zip(to_click, clicked) if was_clicked]
+                phones = self.wait_for_contact_phones([container for _, container, _, _ in to_click])
+                for (index, _, _, name), phone in zip(to_click, phones):
+                    results[index]['phone'] = phone if phone else ''
+                    print(f"Processed {name}: {phone if phone else 'NO PHONE'}")
+            except Exception as e:
+                print(f"Error clicking Contact Info buttons: {e}")
+        
         print(f"Processed: {processed}, Skipped (already have phone): {skipped}")
         return results
 
-    def scrape_phones(self):
-        """Main function to scrape phone numbers for all candidates"""
+    def scrape_pages_in_parallel(self, max_pages: int, workers: int, existing_phones: Dict[str, str],
+                                 cached_phones: Dict[str, str]) -> List[Dict]:
+        """
+        Scrape phone numbers from several pages at once, one browser per worker process
+        
+        Args:
+            max_pages: Number of pages to scrape
+            workers: Number of worker processes
+            existing_phones: Stored phone numbers by candidate name, from get_existing_phones
+            cached_phones: Phones found by recent runs by candidate name, from load_phone_cache
+            
+        Returns:
+            Results from all pages, in page order
+        """
+        session = self.export_session()
+        
+        all_results = []
+        print(f"Scraping {max_pages} pages with {workers} worker processes...")
+        with Pool(processes=min(workers, max_pages), initializer=_worker_init,
+                  initargs=(session, self.headless, existing_phones, cached_phones)) as pool:
+            try:
+                # Record each page as soon as it (and the pages before it) are done
+                for page_num, results in enumerate(pool.imap(_scrape_page, range(1, max_pages + 1)), 1):
+                    print(f"Found {len(results)} candidates on page {page_num}")
+                    self.write_csv_rows(results)
+                    all_results.extend(results)
+            finally:
+                # Let the workers exit normally so their browsers are closed, even if the loop failed:
+                # the terminate() in Pool.__exit__ would kill them before Finalize runs
+                pool.close()
+                pool.join()
+        
+        return all_results
+        
+    def open_csv(self):
+        """Open the results CSV for appending, writing the header if the file is new"""
+        is_new = not os.path.exists(self.csv_path) or os.path.getsize(self.csv_path) == 0
+        # Line buffered, so every page written survives a crash later in the run
+        self.csv_file = open(self.csv_path, 'a', newline='', encoding='utf-8', buffering=1)
+        self.csv_writer = csv.writer(self.csv_file)
+        if is_new:
+            self.csv_writer.writerow(['name', 'phone'])
+        print(f"Writing results to {self.csv_path}")
+        
+    def write_csv_rows(self, results: List[Dict]):
+        """
+        Append scraped results to the CSV (if one was requested)
+        
+        Args:
+            results: {'name', 'phone'} results, an empty phone meaning none was found
+        """
+        if self.csv_writer:
+            self.csv_writer.writerows([result['name'], result['phone']] for result in results)
+            
+    def scrape_phones(self, workers: int = 1):
+        """
+        Main function to scrape phone numbers for all candidates
+        
+        Args:
+            workers: Number of browser processes to scrape pages with (default: 1, sequential)
+        """
         try:
-            self.setup_driver()
+            # With headed_login the login happens in a visible browser, the scraping headless
+            self.setup_driver(headless=False if self.headed_login else None)
             self.setup_mongodb()
+            if self.csv_path:
+                self.open_csv()
             
             if not self.login_if_needed():
                 print("Login failed. Exiting.")
                 return
+            
+            if self.headed_login and self.headless:
+                self.switch_to_headless()
                 
             print(f"\nStarting to scrape phone numbers...")
             if not self.save_to_db:
                 print("(DRY RUN - Not saving to database. Use --save flag to save results)\n")
             
-            all_results = []
             max_pages = 3  # Check up to 3 pages
+            existing_phones = self.get_existing_phones()
+            cached_phones = load_phone_cache(self.cache_ttl) if self.cache_ttl > 0 else {}
+            if cached_phones:
+                print(f"{len(cached_phones)} phone numbers cached by recent runs")
             
-            for page_num in range(1, max_pages + 1):
-                print(f"\n--- Scraping page {page_num} ---")
-                
-                # Wait for candidates to load
-                if not self.wait_for_candidates_to_load():
-                    print(f"Failed to load candidates on page {page_num}")
-                    break
-                
-                # Scrape phone numbers from current page
-                page_results = self.scrape_current_page_phones()
-                print(f"Found {len(page_results)} candidates on page {page_num}")
-                all_results.extend(page_results)
+            if workers > 1:
+                all_results = self.scrape_pages_in_parallel(max_pages, workers, existing_phones, cached_phones)
+            else:
+                all_results = []
                 
-                # Navigate to next page
-                if page_num < max_pages:
-                    if not self.navigate_to_page(page_num + 1):
-                        print(f"Could not navigate to page {page_num + 1}. Stopping.")
+                for page_num in range(1, max_pages + 1):
+                    print(f"\n--- Scraping page {page_num} ---")
+                    
+                    # Wait for candidates to load
+                    if not self.wait_for_candidates_to_load():
+                        print(f"Failed to load candidates on page {page_num}")
                         break
-                    time.sleep(3)
+                    
+                    # Scrape phone numbers from current page
+                    page_results = self.scrape_current_page_phones(existing_phones, cached_phones)
+                    print(f"Found {len(page_results)} candidates on page {page_num}")
+                    self.write_csv_rows(page_results)
+                    all_results.extend(page_results)
+                    
+                    # Navigate to next page
+                    if page_num < max_pages:
+                        if not self.navigate_to_page(page_num + 1):
+                            print(f"Could not navigate to page {page_num + 1}. Stopping.")
+                            break
+            
+            if self.cache_ttl > 0:
+                save_phone_cache(all_results, self.cache_ttl)
+            
+            # Build the results summary and write it to stdout in one go
+            lines = [f"\n{'='*60}", "RESULTS SUMMARY", f"{'='*60}"]
             
             # Process results and update database if needed
-            phones_found = 0
-            phones_not_found = 0
+            # Indexed by whether a phone was found: [not found, found]
+            counts = [0, 0]
             
             for result in all_results:
                 name = result['name']
                 phone = result['phone']
                 
-                self.results.append({'name': name, 'phone': phone if phone else 'NO PHONE'})
+                # All results in a clean format
+                lines.append(f"{name:<30} | {phone if phone else 'NO PHONE'}")
                 
-                if self.save_to_db:
-                    # Find candidate in database and update
-                    candidate = self.collection.find_one({'name': name})
-                    if candidate:
-                        self.update_candidate_phone(candidate['_id'], phone)
+                # Only updates existing candidates (no upsert)
+                self.update_candidate_phone(name, phone)
                 
-                if phone:
-                    phones_found += 1
-                else:
-                    phones_not_found += 1
+                counts[bool(phone)] += 1
             
-            # Print results summary
-            print(f"\n{'='*60}")
-            print("RESULTS SUMMARY")
-            print(f"{'='*60}")
+            phones_not_found, phones_found = counts
             
-            # Print all results in a clean format
-            for result in self.results:
-                name = result['name']
-                phone = result['phone']
-                if phone and phone not in ['NO PHONE', 'NOT FOUND - Could not click profile', 'NO PROFILE AVAILABLE', 'NOT FOUND - Candidate not in list']:
-                    print(f"{name:<30} | {phone}")
-                else:
-                    print(f"{name:<30} | {phone}")
+            lines.append(f"\n{'='*60}")
+            lines.append(f"Phones found: {phones_found}")
+            lines.append(f"Phones not found: {phones_not_found}")
+            lines.append(f"Total processed: {phones_found + phones_not_found}")
+            sys.stdout.write("\n".join(lines) + "\n")
             
-            print(f"\n{'='*60}")
-            print(f"Phones found: {phones_found}")
-            print(f"Phones not found: {phones_not_found}")
-            print(f"Total processed: {phones_found + phones_not_found}")
+            self.flush_updates()
             
             if not self.save_to_db:
                 print("\n⚠️  Results were NOT saved to database (use --save flag to persist)")
@@ -757,10 +1200,16 @@ class AntlerPhoneScraper:
             print(f"Scraping error: {e}")
             raise
         finally:
+            # Don't lose queued updates if something failed after they were collected
+            if self.collection is not None:
+                self.flush_updates()
             self.cleanup()
             
     def cleanup(self):
         """Clean up resources"""
+        if self.csv_file:
+            self.csv_file.close()
+            print(f"Results written to {self.csv_path}")
         if self.driver:
             self.driver.quit()
             print("Browser closed")
@@ -769,13 +1218,89 @@ class AntlerPhoneScraper:
             print("Database connection closed")
             
 
+# Per-process state used by the worker pool (one browser per worker)
+_worker_scraper = None
+_worker_existing_phones = {}
+_worker_cached_phones = {}
+
+def _worker_init(session: Dict[str, Any], headless: bool, existing_phones: Dict[str, str],
+                 cached_phones: Dict[str, str]):
+    """
+    Pool initializer: start this worker's browser and reuse the parent's login
+    
+    Args:
+        session: Logged-in session from AntlerPhoneScraper.export_session
+        headless: Run browser in headless mode
+        existing_phones: Stored phone numbers by candidate name, loaded once by the parent
+        cached_phones: Phones found by recent runs by candidate name, loaded once by the parent
+    """
+    global _worker_scraper, _worker_existing_phones, _worker_cached_phones
+    # Ctrl+C is handled by the parent, which then waits for the workers to finish and close their browsers
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _worker_existing_phones = existing_phones
+    _worker_cached_phones = cached_phones
+    try:
+        # Workers use throwaway profiles: the persistent one is locked by the parent's browser
+        scraper = AntlerPhoneScraper(headless=headless, profile_dir=None)
+        # Close the browser when the worker process exits, even if setup fails halfway
+        Finalize(scraper, scraper.cleanup, exitpriority=10)
+        scraper.setup_driver()
+        scraper.restore_session(session)
+    except Exception as e:
+        # An initializer that raises makes the pool respawn the worker forever, so record the failure
+        # and let _scrape_page skip this worker's pages instead
+        print(f"Error starting worker browser: {e}")
+        return
+    _worker_scraper = scraper
+
+def _scrape_page(page_num: int) -> List[Dict]:
+    """
+    Scrape phone numbers from one results page in this worker's browser
+    
+    Args:
+        page_num: Page to scrape (1-based)
+        
+    Returns:
+        List of {'name', 'phone'} results from that page
+    """
+    scraper = _worker_scraper
+    if scraper is None:
+        print(f"No browser in this worker. Skipping page {page_num}.")
+        return []
+    time.sleep(WORKER_STAGGER_SECONDS * (page_num - 1))
+    try:
+        scraper.driver.get(scraper.founders_url)
+        scraper.wait_for_candidates_to_load()
+        if page_num > 1:
+            if not scraper.navigate_to_page(page_num):
+                print(f"Could not navigate to page {page_num}. Skipping it.")
+                return []
+            scraper.wait_for_candidates_to_load()
+        
+        print(f"\n--- Scraping page {page_num} ---")
+        return scraper.scrape_current_page_phones(_worker_existing_phones, _worker_cached_phones)
+    except Exception as e:
+        print(f"Error scraping page {page_num}: {e}")
+        return []
+            
+
 def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(description='Scrape phone numbers from Antler Hub candidate profiles')
     parser.add_argument('--headless', action='store_true', help='Run browser in headless mode')
+    parser.add_argument('--headed-login', action='store_true',
+                        help='Log in with a visible browser, then scrape headless (implies --headless)')
     parser.add_argument('--save', action='store_true', help='Save results to MongoDB database')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Number of browser processes to scrape pages in parallel (default: 1)')
+    parser.add_argument('--csv', metavar='PATH',
+                        help='Append results to this CSV file page by page, so they survive a crash')
+    parser.add_argument('--cache-ttl', type=float, default=PHONE_CACHE_TTL,
+                        help=f'Seconds to reuse phones found by earlier runs instead of scraping them again, 0 to disable (default: {PHONE_CACHE_TTL})')
     
     args = parser.parse_args()
+    if args.headed_login:
+        args.headless = True
     
     print("=== Antler Hub Phone Number Scraper ===\n")
     
@@ -784,17 +1309,20 @@ def main():
     else:
         print("ℹ️  Running in DRY RUN mode (use --save to persist to database)")
     
-    if args.headless:
+    if args.headed_login:
+        print("Logging in with a visible browser, then scraping in headless mode")
+    elif args.headless:
         print("Running in headless mode")
     else:
         print("Running with visible browser (use --headless for headless mode)")
     
     print()
     
-    scraper = AntlerPhoneScraper(headless=args.headless, save_to_db=args.save)
+    scraper = AntlerPhoneScraper(headless=args.headless, save_to_db=args.save, headed_login=args.headed_login,
+                                 cache_ttl=args.cache_ttl, csv_path=args.csv)
     
     try:
-        scraper.scrape_phones()
+        scraper.scrape_phones(workers=args.workers)
         print("\nPhone scraping completed successfully!")
     except KeyboardInterrupt:
         print("\n\nScraping interrupted by user")